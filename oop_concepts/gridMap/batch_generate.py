@@ -0,0 +1,50 @@
+import argparse
+import json
+import os
+from main import TERRAIN_CONFIG
+from models.batchGenerator import MANIFEST, generate_batch
+
+
+def parse_size(text):
+    """Parse '64' or '64x32' into (width, height)."""
+    width, _, height = text.lower().partition('x')
+    try:
+        return int(width), int(height or width)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid size '{text}', expected N or WxH.")
+
+
+def parse_config(text):
+    """Parse NAME=PATH into (name, terrain config loaded from the JSON file at PATH)."""
+    name, _, path = text.partition('=')
+    if not path:
+        name, path = os.path.splitext(os.path.basename(text))[0], text
+    with open(path) as file:
+        return name, json.load(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a pool of maps without a display.")
+    parser.add_argument('output', help="Directory for the .gmap files and the manifest")
+    parser.add_argument('--sizes', type=parse_size, nargs='+', default=[(64, 64)], help="Map sizes, N or WxH")
+    parser.add_argument('--count', type=int, default=10, help="Maps per size and config")
+    parser.add_argument('--first-seed', type=int, default=0, help="Seeds run from here to first-seed + count")
+    parser.add_argument('--config', type=parse_config, action='append', metavar='NAME=PATH',
+                        help="Terrain config JSON file; repeat for several presets (default: main.TERRAIN_CONFIG)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Processes, one map each at a time")
+    args = parser.parse_args()
+
+    configs = dict(args.config) if args.config else {'default': TERRAIN_CONFIG}
+    seeds = range(args.first_seed, args.first_seed + args.count)
+
+    def progress(record):
+        seconds = 'recovered' if record['seconds'] is None else f"{record['seconds']:.2f}s"
+        print(f"{record['file']}: {seconds}, connected={record['connected']}")
+
+    summary = generate_batch(args.output, args.sizes, seeds, configs, args.workers, progress)
+    print(f"{summary['generated']} generated, {summary['recovered']} recovered, {summary['skipped']} already done; "
+          f"manifest at {os.path.join(args.output, MANIFEST)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Benchmark every map generation stage and the full pipeline against a stored baseline.
+
+Run from the gridMap directory:
+
+    python -m benchmarks.pipeline                      # compare with benchmarks/baseline.json
+    python -m benchmarks.pipeline --sizes 15 64 256    # a quicker subset
+    python -m benchmarks.pipeline --save-baseline      # record a new baseline
+
+Each (stage, size) records its best wall time, its tracemalloc peak (from a separate
+untimed run), the search expansions where the stage has any and a checksum of the
+resulting terrain, so an optimization can show it is faster without changing output.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np  # Install with pip install numpy
+from main import TERRAIN_CONFIG
+from models.gridMap import GridMap
+from models.mapGenerator import generate_map
+from models.mapValidator import MapValidator
+from models.pathfinder import PathPlanner
+from models.terrainGenerator import TerrainGenerator
+from models.tile import TERRAIN_CODES
+from models.zoneGenerator import ZoneAllocator
+
+SIZES = (15, 64, 256, 1024, 2048)
+STAGES = ('legacy_terrain', 'terrain', 'roads', 'zones', 'validate', 'pipeline')
+SEED = 12345
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+TOLERANCE = 0.25  # Allowed relative slowdown or memory growth before a result counts as a regression
+MIN_SLOWDOWN = 0.005  # Seconds; smaller differences are timer noise on the small maps
+
+_terrain_maps = {}  # size -> terrain from the 'terrain' stage, input of the later stages
+
+
+def _terrain(size):
+    if size not in _terrain_maps:
+        grid_map = GridMap(size, size)
+        TerrainGenerator(grid_map, TERRAIN_CONFIG, seed=SEED).generate_terrain()
+        _terrain_maps[size] = grid_map.terrain.copy()
+    return _terrain_maps[size]
+
+
+def _setup(stage, size):
+    """Prepare a stage's input and return a callable that runs it and returns (grid_map, expanded)."""
+    if stage == 'pipeline':
+        def run():
+            grid_map = generate_map(size, size, TERRAIN_CONFIG, seed=SEED)
+            with contextlib.redirect_stdout(io.StringIO()):  # main() without Tk
+                grid_map.display_grid()
+            return grid_map, None
+        return run
+
+    if stage in ('legacy_terrain', 'terrain'):
+        grid_map = GridMap(size, size)
+    else:
+        grid_map = GridMap(size, size, terrain=_terrain(size).copy())
+
+    def run():
+        expanded = None
+        if stage == 'legacy_terrain':
+            grid_map.generate_terrain(seed=SEED)
+        elif stage == 'terrain':
+            TerrainGenerator(grid_map, TERRAIN_CONFIG, seed=SEED).generate_terrain()
+        elif stage == 'roads':
+            planner = PathPlanner(grid_map, TERRAIN_CONFIG, seed=SEED)
+            planner.place_roads()
+            expanded = planner.stats['expanded']
+        elif stage == 'zones':
+            ZoneAllocator(grid_map).reserve_player_zones()
+        elif stage == 'validate':
+            MapValidator(grid_map, ZoneAllocator(grid_map).zones()).repair()
+        else:
+            raise ValueError(f"Unknown stage '{stage}'.")
+        return grid_map, expanded
+
+    if stage == 'validate':
+        grid_map.terrain[:, size // 2] = TERRAIN_CODES['water']  # A river through the middle so repair has work to do
+    return run
+
+
+def bench(stage, size, repeats):
+    """Run one stage at one size and return its result record."""
+    times = []
+    for _ in range(repeats):
+        run = _setup(stage, size)
+        start = time.perf_counter()
+        grid_map, expanded = run()
+        times.append(time.perf_counter() - start)
+
+    run = _setup(stage, size)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'stage': stage, 'size': size, 'seconds': min(times), 'peak_memory': peak, 'expanded': expanded,
+        'checksum': hashlib.blake2b(np.ascontiguousarray(grid_map.terrain).tobytes(), digest_size=8).hexdigest(),
+    }
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Return a list of regression messages for results that are slower, larger or different from the baseline."""
+    previous = {(record['stage'], record['size']): record for record in baseline['results']}
+    regressions = []
+    for record in results:
+        old = previous.get((record['stage'], record['size']))
+        if old is None:
+            continue
+        name = f"{record['stage']} @ {record['size']}"
+        slowdown = record['seconds'] - old['seconds']
+        if slowdown > old['seconds'] * tolerance and slowdown > MIN_SLOWDOWN:
+            regressions.append(f"{name}: {old['seconds']:.4f}s -> {record['seconds']:.4f}s")
+        if record['peak_memory'] > old['peak_memory'] * (1 + tolerance):
+            regressions.append(f"{name}: peak {old['peak_memory']} -> {record['peak_memory']} bytes")
+        if old['expanded'] is not None and record['expanded'] is not None and record['expanded'] > old['expanded']:
+            regressions.append(f"{name}: {old['expanded']} -> {record['expanded']} expansions")
+        if record['checksum'] != old['checksum']:
+            regressions.append(f"{name}: output changed")
+    return regressions
+
+
+def _print_table(results, baseline):
+    previous = {(record['stage'], record['size']): record for record in baseline['results']} if baseline else {}
+    print(f"{'stage':<15}{'size':>6}{'time (s)':>12}{'vs base':>9}{'peak (MiB)':>12}{'vs base':>9}{'expanded':>11}")
+    for record in results:
+        old = previous.get((record['stage'], record['size']))
+        time_ratio = f"{record['seconds'] / old['seconds']:.2f}x" if old and old['seconds'] else ''
+        memory_ratio = f"{record['peak_memory'] / old['peak_memory']:.2f}x" if old and old['peak_memory'] else ''
+        expanded = '' if record['expanded'] is None else record['expanded']
+        print(f"{record['stage']:<15}{record['size']:>6}{record['seconds']:>12.4f}{time_ratio:>9}"
+              f"{record['peak_memory'] / 2 ** 20:>12.2f}{memory_ratio:>9}{expanded:>11}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the map generation pipeline.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help="Square map sizes")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES)
+    parser.add_argument('--repeats', type=int, default=3, help="Timed runs per result for maps up to 256x256")
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="Write the results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    results = []
+    for size in args.sizes:
+        for stage in args.stages:
+            results.append(bench(stage, size, args.repeats if size <= 256 else 1))
+            print(f"  {stage} @ {size}: {results[-1]['seconds']:.4f}s", file=sys.stderr)
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    _print_table(results, baseline)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump({
+                'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine(),
+                'seed': SEED, 'results': results,
+            }, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if baseline is None:
+        print("No baseline to compare against; run with --save-baseline first.")
+        return 0
+    regressions = compare(results, baseline, args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2 +1,2 @@
-from .guiController import GridController
-from .gridController import GridControllerWithGUI
\ No newline at end of file
+from .gridController import GridController
+from .guiController import GridControllerWithGUI
\ No newline at end of file
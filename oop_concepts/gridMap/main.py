@@ -1,11 +1,7 @@
-from models.gridMap  import GridMap
+import logging
 from models.player import Player
 from models.unit import Unit
-from models.terrainGenerator import TerrainGenerator
-from models.pathfinder import PathPlanner
-from models.zoneGenerator import ZoneAllocator
-from views.gridView import BoardView
-import tkinter as tk
+from models.mapGenerator import generate_map
 
 # Adjusted Terrain Configuration
 TERRAIN_CONFIG = {
@@ -15,27 +11,19 @@ TERRAIN_CONFIG = {
     'road': {'segments': 3, 'min_length': 7, 'max_length': 15},
 }
 
-def main():
+def main(seed=None):
     width, height = 15, 15
-    grid_map = GridMap(width, height)
 
-    # Terrain Generation
-    terrain_generator = TerrainGenerator(grid_map, TERRAIN_CONFIG)
-    terrain_generator.generate_terrain()
-
-    # Road Placement
-    path_planner = PathPlanner(grid_map, TERRAIN_CONFIG)
-    path_planner.place_roads()
-
-    # Reserve Player Zones
-    zone_allocator = ZoneAllocator(grid_map)
-    zone_allocator.reserve_player_zones()
+    # Terrain, roads and player zones, all derived from one seed
+    grid_map = generate_map(width, height, TERRAIN_CONFIG, seed)
 
     # Print Grid and Debug Information
-    print("Generated Terrain Map:")
+    print(f"Generated Terrain Map (seed={grid_map.seed}):")
     grid_map.display_grid()
 
-    # Visualize with Tkinter
+    # Visualize with Tkinter, imported here so the game logic runs without a display
+    import tkinter as tk
+    from views.gridView import BoardView
     root = tk.Tk()
     root.title("Tactical Board")
     board_view = BoardView(root, grid_map)
@@ -43,4 +31,5 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
     main()
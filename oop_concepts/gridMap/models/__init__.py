@@ -2,5 +2,3 @@ from models.gridMap import GridMap
 from models.player import Player
 from models.unit import Unit
 from models.turnManager import TurnManager
-from views.gridView import BoardView
-import tkinter as tk
@@ -0,0 +1,69 @@
+import heapq
+
+INF = float('inf')
+
+
+def astar_search(costs, width, height, start, goal, min_cost):
+    """Find the cheapest 4-connected path from start to goal and return (path, stats).
+
+    `costs` is a flat row-major list of per-tile entry costs (inf for impassable
+    tiles) and `min_cost` the cheapest finite cost, which scales the Manhattan
+    heuristic so it stays admissible. `path` is a list of (x, y) from start to goal,
+    or None when the goal cannot be reached.
+    """
+    start_index = start[1] * width + start[0]
+    goal_index = goal[1] * width + goal[0]
+    goal_x, goal_y = goal
+
+    def heuristic(index):
+        row, col = divmod(index, width)
+        return (abs(col - goal_x) + abs(row - goal_y)) * min_cost
+
+    g_score = {start_index: 0}
+    came_from = {start_index: -1}
+    closed = set()
+    h = heuristic(start_index)
+    open_set = [(h, h, start_index)]
+    stats = {'expanded': 0, 'pushes': 1, 'stale': 0, 'cost': None}
+
+    while open_set:
+        _, _, current = heapq.heappop(open_set)
+        if current in closed:
+            stats['stale'] += 1  # Superseded by a cheaper push
+            continue
+        if current == goal_index:
+            stats['cost'] = g_score[current]
+            return _reconstruct_path(came_from, current, width), stats
+        closed.add(current)
+        stats['expanded'] += 1
+
+        current_g = g_score[current]
+        row, col = divmod(current, width)
+        for neighbour in (
+            current - width if row > 0 else -1,
+            current + width if row < height - 1 else -1,
+            current - 1 if col > 0 else -1,
+            current + 1 if col < width - 1 else -1,
+        ):
+            if neighbour < 0 or neighbour in closed:
+                continue
+            tentative = current_g + costs[neighbour]
+            if tentative < g_score.get(neighbour, INF):
+                g_score[neighbour] = tentative
+                came_from[neighbour] = current
+                h = heuristic(neighbour)
+                heapq.heappush(open_set, (tentative + h, h, neighbour))
+                stats['pushes'] += 1
+
+    return None, stats
+
+
+def _reconstruct_path(came_from, current, width):
+    """Follow parents back to the start and return the path as (x, y) tuples."""
+    path = []
+    while current != -1:
+        row, col = divmod(current, width)
+        path.append((col, row))
+        current = came_from[current]
+    path.reverse()
+    return path
@@ -0,0 +1,124 @@
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .instrumentation import Metrics
+from .mapCache import MapCache
+from .mapFile import load_map, save_map_atomic
+from .mapGenerator import GENERATOR_VERSION, generate_map
+from .mapStats import terrain_histogram
+from .mapValidator import MapValidator
+from .zoneGenerator import ZoneAllocator
+
+MANIFEST = 'manifest.jsonl'
+
+logger = logging.getLogger(__name__)
+
+
+def map_filename(config_name, key, width, height, seed):
+    """Return the file name a batch stores one map under.
+
+    key is the MapCache.key of the request; part of it goes into the name so a file
+    left by another config or generator version is never mistaken for this map.
+    """
+    return f"{config_name}_{width}x{height}_{seed}_{key[:16]}.gmap"
+
+
+def describe_map(grid_map):
+    """Return the manifest stats of a map: its terrain counts and zone connectivity."""
+    report = MapValidator(grid_map, ZoneAllocator(grid_map).zones()).validate()
+    return {
+        'terrain': terrain_histogram(grid_map), 'components': report['components'],
+        'connected': report['connected'], 'isolated_zones': report['isolated'],
+    }
+
+
+def generate_entry(task):
+    """Generate, store and describe one map, returning its manifest record; runs in a worker process."""
+    directory, config_name, key, config, width, height, seed = task
+    metrics = Metrics()
+    start = time.perf_counter()
+    grid_map = generate_map(width, height, config, seed, metrics=metrics)
+    seconds = time.perf_counter() - start
+    filename = map_filename(config_name, key, width, height, seed)
+    save_map_atomic(grid_map, os.path.join(directory, filename))
+    return metrics.record(file=filename, config=config_name, key=key, width=width, height=height, seed=seed,
+                          version=GENERATOR_VERSION, seconds=seconds, **describe_map(grid_map))
+
+
+def read_manifest(path):
+    """Return manifest records by file name; later lines win and a line cut short by an interruption is ignored."""
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path) as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            records[record['file']] = record
+    return records
+
+
+def generate_batch(directory, sizes, seeds, configs, workers=1, progress=None):
+    """Generate every (config, size, seed) map not already in directory and append its record to the manifest.
+
+    configs maps a name to a terrain config and sizes holds (width, height) pairs. Maps
+    are spread over worker processes, one map per task, and each record is appended as
+    soon as its map is on disk, so an interrupted batch resumes where it stopped: maps
+    with a record for the same config contents and generator version are skipped, and
+    a map written just before an interruption is described from its file instead of
+    generated again, which its key-stamped file name makes safe. progress, if given, is
+    called with every new record. Returns counts of generated, recovered and skipped maps.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST)
+    done = read_manifest(manifest_path)
+    summary = {'generated': 0, 'recovered': 0, 'skipped': 0}
+    tasks = []
+    recovered = []
+
+    for config_name, config in configs.items():
+        for width, height in sizes:
+            for seed in seeds:
+                key = MapCache.key(width, height, config, seed)  # Covers config contents and GENERATOR_VERSION
+                filename = map_filename(config_name, key, width, height, seed)
+                exists = os.path.exists(os.path.join(directory, filename))
+                record = done.get(filename)
+                if exists and record is not None and record.get('key') == key:
+                    summary['skipped'] += 1
+                elif exists and record is None:
+                    recovered.append((filename, config_name, key, width, height, seed))
+                else:
+                    tasks.append((directory, config_name, key, config, width, height, seed))
+    logger.info("Batch: %d maps to generate, %d to recover, %d already done.",
+                len(tasks), len(recovered), summary['skipped'])
+
+    with open(manifest_path, 'a+') as manifest:
+        if manifest.tell():
+            manifest.seek(manifest.tell() - 1)
+            if manifest.read(1) != '\n':  # Finish a line cut short by an interruption
+                manifest.write('\n')
+
+        def append(record, outcome):
+            manifest.write(json.dumps(record) + '\n')
+            manifest.flush()
+            summary[outcome] += 1
+            if progress is not None:
+                progress(record)
+
+        for filename, config_name, key, width, height, seed in recovered:
+            grid_map = load_map(os.path.join(directory, filename))
+            append(Metrics().record(file=filename, config=config_name, key=key, width=width, height=height, seed=seed,
+                                    version=GENERATOR_VERSION, seconds=None, **describe_map(grid_map)), 'recovered')
+
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(workers) as pool:
+                for future in as_completed([pool.submit(generate_entry, task) for task in tasks]):
+                    append(future.result(), 'generated')
+        else:
+            for task in tasks:
+                append(generate_entry(task), 'generated')
+    return summary
@@ -0,0 +1,64 @@
+import random
+from collections import deque
+import numpy as np
+from .tile import TERRAIN_CODES
+
+
+class ClusterGrower:
+    """Grow terrain clusters from many seeds in one breadth-first pass."""
+
+    def __init__(self, grid_map, rng=None):
+        self.grid_map = grid_map
+        self.rng = rng or random.Random()
+
+    def grow(self, seed_mask, terrain, min_size, max_size, grow_on='grass'):
+        """Grow a cluster of `terrain` from every True cell of `seed_mask` and return the tiles written.
+
+        Each seed gets a budget of min_size..max_size tiles. Clusters expand round-robin
+        through a shared queue over `grow_on` tiles only, so every tile is claimed at most
+        once and the work is linear in the number of tiles written.
+        """
+        width, height = self.grid_map.width, self.grid_map.height
+        code = TERRAIN_CODES[terrain]
+        base = TERRAIN_CODES[grow_on]
+        cells = bytearray(self.grid_map.terrain.tobytes())  # Row-major copy with fast scalar access
+        queued = bytearray(width * height)
+        budgets = []
+        queue = deque()
+
+        for index in np.flatnonzero(seed_mask).tolist():
+            if cells[index] != base:
+                continue
+            queued[index] = 1
+            queue.append((index, len(budgets)))
+            budgets.append(self.rng.randint(min_size, max_size))
+
+        written = 0
+        shuffle = self.rng.shuffle
+        while queue:
+            index, cluster = queue.popleft()
+            if budgets[cluster] <= 0 or cells[index] != base:
+                queued[index] = 0  # Leave the tile available to other clusters
+                continue
+            cells[index] = code
+            budgets[cluster] -= 1
+            written += 1
+
+            row, col = divmod(index, width)
+            neighbours = []
+            if row > 0:
+                neighbours.append(index - width)
+            if row < height - 1:
+                neighbours.append(index + width)
+            if col > 0:
+                neighbours.append(index - 1)
+            if col < width - 1:
+                neighbours.append(index + 1)
+            shuffle(neighbours)  # Randomize direction growth
+            for neighbour in neighbours:
+                if not queued[neighbour] and cells[neighbour] == base:
+                    queued[neighbour] = 1
+                    queue.append((neighbour, cluster))
+
+        self.grid_map.terrain[:] = np.frombuffer(cells, dtype=np.uint8).reshape(height, width)
+        return written
@@ -0,0 +1,42 @@
+import numpy as np  # Install with pip install numpy
+
+
+def label_components(mask):
+    """Label the 4-connected components of a boolean (height, width) mask.
+
+    Returns (labels, count): an int32 array with 0 outside the mask and 1..count
+    inside, numbered in row-major order of each component's first tile. Horizontal
+    runs are the union-find elements, so the work grows with the number of runs
+    rather than tiles; runs are merged with vectorized hook-and-compress rounds.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    labels = np.zeros(mask.shape, dtype=np.int32)
+    if not mask.any():
+        return labels, 0
+
+    starts = mask.copy()
+    starts[:, 1:] &= ~mask[:, :-1]  # A run starts where the tile to the left is outside the mask
+    run_ids = np.cumsum(starts.ravel()).reshape(mask.shape) - 1
+    run_count = int(run_ids[-1, -1]) + 1
+
+    vertical = mask[:-1] & mask[1:]  # Runs touching the run directly below
+    upper, lower = run_ids[:-1][vertical], run_ids[1:][vertical]
+    pairs = np.unique(upper.astype(np.int64) * run_count + lower)
+    upper, lower = pairs // run_count, pairs % run_count
+
+    parent = np.arange(run_count)
+    while True:
+        a, b = parent[upper], parent[lower]
+        merge = a != b
+        if not merge.any():
+            break
+        np.minimum.at(parent, np.maximum(a, b)[merge], np.minimum(a, b)[merge])  # Hook larger roots onto smaller
+        while True:
+            compressed = parent[parent]
+            if np.array_equal(compressed, parent):
+                break
+            parent = compressed
+
+    roots, component = np.unique(parent, return_inverse=True)
+    labels[mask] = component[run_ids[mask]] + 1
+    return labels, len(roots)
@@ -0,0 +1,141 @@
+import numpy as np  # Install with pip install numpy
+from .tile import TERRAIN_CODES
+
+OPAQUE_TERRAIN = ('mountain',)  # Terrain that blocks line of sight
+# Octant transforms (xx, xy, yx, yy) mapping octant-local (dx, dy) to map offsets
+OCTANTS = (
+    (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+    (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1),
+)
+
+
+def shadowcast(opaque, width, height, origin, radius):
+    """Return the flat indices of the tiles visible from origin within radius, by recursive shadowcasting.
+
+    opaque is a flat sequence of truthy sight-blocking flags. Blocking tiles are
+    themselves visible; tiles off the map block sight.
+    """
+    ox, oy = origin
+    visible = {oy * width + ox}
+    limit = radius * radius
+
+    def cast(row, start, end, xx, xy, yx, yy):
+        if start < end:
+            return
+        new_start = start
+        for distance in range(row, radius + 1):
+            dx, dy = -distance - 1, -distance
+            blocked = False
+            while dx <= 0:
+                dx += 1
+                left, right = (dx - 0.5) / (dy + 0.5), (dx + 0.5) / (dy - 0.5)
+                if start < right:
+                    continue
+                if end > left:
+                    break
+                x, y = ox + dx * xx + dy * xy, oy + dx * yx + dy * yy
+                inside = 0 <= x < width and 0 <= y < height
+                index = y * width + x
+                if inside and dx * dx + dy * dy <= limit:
+                    visible.add(index)
+                wall = not inside or opaque[index]
+                if blocked:
+                    if wall:
+                        new_start = right
+                        continue
+                    blocked = False
+                    start = new_start
+                elif wall and distance < radius:
+                    blocked = True
+                    cast(distance + 1, start, left, xx, xy, yx, yy)
+                    new_start = right
+            if blocked:
+                break
+
+    for transform in OCTANTS:
+        cast(1, 1.0, 0.0, *transform)
+    return visible
+
+
+class FieldOfView:
+    """Visible tiles per (position, radius) over a GridMap.
+
+    Results are cached and an entry is dropped only when a tile within its radius
+    changes whether it blocks sight. The least recently used entries are evicted
+    beyond cache_size.
+    """
+
+    def __init__(self, grid_map, cache_size=4096):
+        self.grid_map = grid_map
+        self.cache_size = cache_size
+        self.stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+        self._cache = {}  # (x, y, radius) -> int array of flat tile indices
+        self.refresh()
+        grid_map.add_listener(self._on_tile_changed)
+
+    def refresh(self):
+        """Rebuild the opacity flags from the map and clear the cache, e.g. after bulk terrain edits."""
+        codes = [TERRAIN_CODES[terrain] for terrain in OPAQUE_TERRAIN]
+        self._opaque = bytearray(np.isin(self.grid_map.terrain, codes).tobytes())
+        self._cache.clear()
+
+    def close(self):
+        """Detach from the GridMap."""
+        self.grid_map.remove_listener(self._on_tile_changed)
+
+    def visible_tiles(self, x, y, radius):
+        """Return the flat indices (y * width + x) of the tiles visible from (x, y), as a read-only array."""
+        key = (x, y, radius)
+        tiles = self._cache.pop(key, None)
+        if tiles is not None:
+            self.stats['hits'] += 1
+        else:
+            self.stats['misses'] += 1
+            tiles = np.fromiter(shadowcast(self._opaque, self.grid_map.width, self.grid_map.height, (x, y), radius),
+                                dtype=np.int64)
+            tiles.sort()
+            tiles.flags.writeable = False
+            if len(self._cache) >= self.cache_size:
+                del self._cache[next(iter(self._cache))]
+        self._cache[key] = tiles  # Reinserted so the dict stays in least recently used order
+        return tiles
+
+    def can_see(self, origin, target, radius):
+        """Return whether target is visible from origin within radius."""
+        index = target[1] * self.grid_map.width + target[0]
+        tiles = self.visible_tiles(*origin, radius)
+        position = np.searchsorted(tiles, index)
+        return position < len(tiles) and tiles[position] == index
+
+    def visibility_map(self, units, radius):
+        """Return a (height, width) bool bitmap of the tiles any of the units can see.
+
+        Units that are not on the map are skipped.
+        """
+        bitmap = np.zeros((self.grid_map.height, self.grid_map.width), dtype=bool)
+        flat = bitmap.ravel()
+        for unit in units:
+            position = self.grid_map.position_of(unit)
+            if position is not None:
+                flat[self.visible_tiles(*position, radius)] = True
+        return bitmap
+
+    def fog_of_war(self, players, radius):
+        """Return {player name: visibility bitmap} for all of each player's units at once."""
+        return {player.name: self.visibility_map(player.units, radius) for player in players}
+
+    def _on_tile_changed(self, x, y, kind):
+        if kind != 'terrain':
+            return
+        index = y * self.grid_map.width + x
+        opaque = self.grid_map.get_terrain(x, y) in OPAQUE_TERRAIN
+        if opaque == bool(self._opaque[index]):
+            return
+        self._opaque[index] = opaque
+        stale = [
+            key for key in self._cache
+            if (key[0] - x) ** 2 + (key[1] - y) ** 2 <= key[2] * key[2]
+        ]
+        for key in stale:
+            del self._cache[key]
+        self.stats['invalidations'] += len(stale)
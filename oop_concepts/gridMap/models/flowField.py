@@ -0,0 +1,173 @@
+import heapq
+import numpy as np
+from .pathfinder import MOVEMENT_COSTS
+from .tile import BLOCKING_TERRAIN
+
+INF = float('inf')
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))  # Direction codes 0-3: up, down, left, right; -1 means none
+
+
+class FlowField:
+    """Integration and direction field that leads every tile to one target.
+
+    ``integration[i]`` is the cheapest cost from tile i to the target and
+    ``parent[i]`` the neighbouring tile a unit on i should step to next.
+    """
+
+    def __init__(self, costs, width, height, target):
+        self.costs = costs  # Flat per-tile entry costs, shared with the owning cache
+        self.width = width
+        self.height = height
+        self.target = target
+        self.target_index = target[1] * width + target[0]
+        self.stats = {'expanded': 0, 'updates': 0}
+        self._rebuild()
+
+    def next_step(self, x, y):
+        """Return the tile a unit on (x, y) should move to next, or None at the target or when unreachable."""
+        parent = self.parent[y * self.width + x]
+        if parent < 0:
+            return None
+        return parent % self.width, parent // self.width
+
+    def cost_to_target(self, x, y):
+        """Return the integrated cost from (x, y) to the target (inf when unreachable)."""
+        return self.integration[y * self.width + x]
+
+    def direction_field(self):
+        """Return a (height, width) int8 array of direction codes, see DIRECTIONS."""
+        index = np.arange(self.width * self.height)
+        parent = np.array(self.parent)
+        delta = parent - index
+        field = np.full(len(index), -1, dtype=np.int8)
+        reachable = parent >= 0
+        field[reachable & (delta == -self.width)] = 0
+        field[reachable & (delta == self.width)] = 1
+        field[reachable & (delta == -1)] = 2
+        field[reachable & (delta == 1)] = 3
+        return field.reshape(self.height, self.width)
+
+    def update(self, changed):
+        """Repair the field after the costs of the `changed` tile indices were modified.
+
+        Only tiles whose route ran through a changed tile are reset; they are re-seeded
+        from their unaffected neighbours and the changes are propagated outward. A change
+        on the target itself alters the cost of every route, so the field is rebuilt.
+        """
+        self.stats['updates'] += 1
+        if self.target_index in changed:
+            self._rebuild()
+            return
+        costs, integration, parent = self.costs, self.integration, self.parent
+        affected = set()
+        for index in changed:
+            if costs[index] == INF:
+                affected.add(index)
+            stack = [index]
+            while stack:  # Every tile whose step chain passes through this one
+                current = stack.pop()
+                for neighbour in self._neighbours(current):
+                    if parent[neighbour] == current and neighbour not in affected:
+                        affected.add(neighbour)
+                        stack.append(neighbour)
+        for index in affected:
+            integration[index] = INF
+            parent[index] = -1
+
+        open_set = []
+        for index in affected.union(changed):
+            if costs[index] == INF:
+                continue
+            for neighbour in self._neighbours(index):
+                candidate = integration[neighbour] + costs[neighbour]
+                if candidate < integration[index]:
+                    integration[index] = candidate
+                    parent[index] = neighbour
+            if integration[index] < INF:
+                open_set.append((integration[index], index))
+        heapq.heapify(open_set)
+        self._propagate(open_set)
+
+    def _rebuild(self):
+        """Recompute the whole field from the target."""
+        self.integration = [INF] * (self.width * self.height)
+        self.parent = [-1] * (self.width * self.height)
+        self.integration[self.target_index] = 0
+        self._propagate([(0, self.target_index)])
+
+    def _propagate(self, open_set):
+        """Dijkstra outward from the queued tiles, lowering integration values."""
+        costs, integration, parent = self.costs, self.integration, self.parent
+        expanded = 0
+        while open_set:
+            current_dist, current = heapq.heappop(open_set)
+            if current_dist > integration[current]:
+                continue  # Stale entry
+            expanded += 1
+            step_cost = current_dist + costs[current]  # Cost for a neighbour to step onto this tile
+            for neighbour in self._neighbours(current):
+                if step_cost < integration[neighbour] and costs[neighbour] < INF:
+                    integration[neighbour] = step_cost
+                    parent[neighbour] = current
+                    heapq.heappush(open_set, (step_cost, neighbour))
+        self.stats['expanded'] += expanded
+
+    def _neighbours(self, index):
+        row, col = divmod(index, self.width)
+        neighbours = []
+        if row > 0:
+            neighbours.append(index - self.width)
+        if row < self.height - 1:
+            neighbours.append(index + self.width)
+        if col > 0:
+            neighbours.append(index - 1)
+        if col < self.width - 1:
+            neighbours.append(index + 1)
+        return neighbours
+
+
+class FlowFieldCache:
+    """Flow fields per target over a GridMap, repaired incrementally when terrain changes."""
+
+    def __init__(self, grid_map, movement_costs=None):
+        self.grid_map = grid_map
+        self.movement_costs = {
+            terrain: cost for terrain, cost in (movement_costs or MOVEMENT_COSTS).items()
+            if terrain not in BLOCKING_TERRAIN
+        }
+        self._costs = grid_map.cost_grid(self.movement_costs).ravel().tolist()
+        self._fields = {}  # target -> FlowField
+        self._pending = {}  # target -> set of changed tile indices not yet applied
+        grid_map.add_listener(self._on_tile_changed)
+
+    def get(self, target):
+        """Return the flow field towards target, computing or repairing it as needed."""
+        field = self._fields.get(target)
+        if field is None:
+            field = FlowField(self._costs, self.grid_map.width, self.grid_map.height, target)
+            self._fields[target] = field
+            self._pending[target] = set()
+        elif self._pending[target]:
+            field.update(self._pending[target])
+            self._pending[target] = set()
+        return field
+
+    def discard(self, target):
+        """Forget the field for a target."""
+        self._fields.pop(target, None)
+        self._pending.pop(target, None)
+
+    def close(self):
+        """Detach from the GridMap."""
+        self.grid_map.remove_listener(self._on_tile_changed)
+
+    def _on_tile_changed(self, x, y, kind):
+        if kind != 'terrain':
+            return
+        index = y * self.grid_map.width + x
+        cost = self.movement_costs.get(self.grid_map.get_terrain(x, y), INF)
+        if cost == self._costs[index]:
+            return
+        self._costs[index] = cost
+        for pending in self._pending.values():
+            pending.add(index)
@@ -1,50 +1,207 @@
 import random
-from noise import pnoise2  # Install with pip install noise
-from .tile import Tile
+import sys
+import numpy as np  # Install with pip install numpy
+from .mapStats import terrain_histogram, write_ascii
+from .noiseField import perlin_field
+from .seeding import derive_seed
+from .spatialIndex import SpatialHash
+from .tile import TERRAIN_CODES, TERRAIN_TYPES, TileView
+
+
+class GridRow:
+    """Row of TileViews so that ``grid[y][x]`` keeps working on the array-backed map."""
+
+    __slots__ = ('grid_map', 'y')
+
+    def __init__(self, grid_map, y):
+        self.grid_map = grid_map
+        self.y = y
+
+    def __len__(self):
+        return self.grid_map.width
+
+    def __getitem__(self, x):
+        width = self.grid_map.width
+        if x < 0:
+            x += width
+        if not 0 <= x < width:
+            raise IndexError("grid column out of range")
+        return TileView(self.grid_map, x, self.y)
+
+    def __iter__(self):
+        for x in range(self.grid_map.width):
+            yield TileView(self.grid_map, x, self.y)
+
+
+class GridRows:
+    """Sequence of GridRows exposed as ``GridMap.grid``."""
+
+    __slots__ = ('grid_map',)
+
+    def __init__(self, grid_map):
+        self.grid_map = grid_map
+
+    def __len__(self):
+        return self.grid_map.height
+
+    def __getitem__(self, y):
+        height = self.grid_map.height
+        if y < 0:
+            y += height
+        if not 0 <= y < height:
+            raise IndexError("grid row out of range")
+        return GridRow(self.grid_map, y)
+
+    def __iter__(self):
+        for y in range(self.grid_map.height):
+            yield GridRow(self.grid_map, y)
+
 
 class GridMap:
-    def __init__(self, width, height):
+    def __init__(self, width, height, terrain=None):
         self.width = width
         self.height = height
-        self.grid = [[Tile() for _ in range(width)] for _ in range(height)]
+        if terrain is None:
+            terrain = np.zeros((height, width), dtype=np.uint8)
+        elif terrain.shape != (height, width) or terrain.dtype != np.uint8:
+            raise ValueError("terrain must be a (height, width) uint8 array.")
+        self.terrain = terrain  # Terrain codes, see TERRAIN_TYPES; may be a memory-mapped plane
+        self.units = {}  # (x, y) -> Unit, only for occupied tiles
+        self.unit_positions = {}  # Unit -> (x, y)
+        self.spatial_index = SpatialHash()  # Occupied positions, for range queries
+        self.grid = GridRows(self)
+        self.listeners = []  # Callables notified with (x, y, kind) when a tile changes
+        self.seed = None  # Generation seed, when the map was generated from one
+
+    def add_listener(self, listener):
+        """Call listener(x, y, kind) whenever a tile's 'terrain' or 'unit' changes."""
+        self.listeners.append(listener)
 
-    def generate_terrain(self):
+    def remove_listener(self, listener):
+        """Stop notifying a listener."""
+        self.listeners.remove(listener)
+
+    def _notify(self, x, y, kind):
+        for listener in self.listeners:
+            listener(x, y, kind)
+
+    def get_terrain(self, x, y):
+        """Return the terrain name at (x, y)."""
+        return TERRAIN_TYPES[self.terrain[y, x]]
+
+    def set_terrain(self, x, y, terrain):
+        """Set the terrain name at (x, y)."""
+        if terrain not in TERRAIN_CODES:
+            raise ValueError(f"Unknown terrain '{terrain}'.")
+        code = TERRAIN_CODES[terrain]
+        if self.terrain[y, x] != code:
+            self.terrain[y, x] = code
+            self._notify(x, y, 'terrain')
+
+    def set_unit(self, x, y, unit):
+        """Put a unit on (x, y), or clear the tile when unit is None.
+
+        A unit already elsewhere on the map is moved, and a unit already on (x, y) is replaced.
+        """
+        current = self.units.get((x, y))
+        if current is unit:
+            return
+        if current is not None:
+            del self.unit_positions[current]
+            del self.units[(x, y)]
+            self.spatial_index.remove(x, y)
+        if unit is not None:
+            previous = self.unit_positions.get(unit)
+            if previous is not None:
+                del self.units[previous]
+                self.spatial_index.remove(*previous)
+                self._notify(*previous, 'unit')
+            self.units[(x, y)] = unit
+            self.unit_positions[unit] = (x, y)
+            self.spatial_index.insert(x, y)
+        self._notify(x, y, 'unit')
+
+    def place_unit(self, x, y, unit):
+        """Place a unit that is not on the map yet on an empty tile."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Tile ({x}, {y}) is out of range.")
+        if (x, y) in self.units:
+            raise ValueError(f"Tile ({x}, {y}) is already occupied.")
+        if unit in self.unit_positions:
+            raise ValueError(f"{unit.name} is already on the map.")
+        self.set_unit(x, y, unit)
+
+    def remove_unit(self, unit):
+        """Take a unit off the map and return the position it was on."""
+        position = self.unit_positions[unit]
+        self.set_unit(*position, None)
+        return position
+
+    def move_unit(self, unit, x, y):
+        """Move a unit on the map to an empty tile."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Tile ({x}, {y}) is out of range.")
+        if unit not in self.unit_positions:
+            raise ValueError(f"{unit.name} is not on the map.")
+        if self.units.get((x, y)) not in (None, unit):
+            raise ValueError(f"Tile ({x}, {y}) is already occupied.")
+        self.set_unit(x, y, unit)
+
+    def unit_at(self, x, y):
+        """Return the unit on (x, y), or None."""
+        return self.units.get((x, y))
+
+    def position_of(self, unit):
+        """Return the (x, y) of a unit, or None when it is not on the map."""
+        return self.unit_positions.get(unit)
+
+    def units_in_radius(self, x, y, radius, metric='euclidean'):
+        """Return {(x, y): unit} for the units within radius of (x, y); see SpatialHash.query_radius."""
+        return {position: self.units[position] for position in self.spatial_index.query_radius(x, y, radius, metric)}
+
+    def units_in_rect(self, x0, y0, x1, y1):
+        """Return {(x, y): unit} for the units with x0 <= x < x1 and y0 <= y < y1."""
+        return {position: self.units[position] for position in self.spatial_index.query_rect(x0, y0, x1, y1)}
+
+    def cost_grid(self, movement_costs):
+        """Return a float array with the movement cost of every tile; unknown terrain costs inf."""
+        table = np.array([movement_costs.get(terrain, np.inf) for terrain in TERRAIN_TYPES], dtype=np.float64)
+        return table[self.terrain]
+
+    def generate_terrain(self, seed=None):
         """Improved terrain generation for balanced tactical gameplay."""
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+
         # Step 1: Initialize all tiles as grass
-        for row in range(self.height):
-            for col in range(self.width):
-                self.grid[row][col].terrain = 'grass'
+        self.terrain.fill(TERRAIN_CODES['grass'])
 
         # Step 2: Add natural features using Perlin noise
         self._apply_perlin_noise('mountain', threshold=0.6, scale=15)
         self._apply_perlin_noise('water', threshold=0.4, scale=10)
 
         # Step 3: Add strategic road networks
-        self._place_roads()
+        self._place_roads(random.Random(derive_seed(self.seed, 'roads')))
 
         # Step 4: Reserve starting zones for players
         self._reserve_player_zones()
 
     def _apply_perlin_noise(self, terrain, threshold, scale):
         """Use Perlin noise to create clusters of terrain."""
-        seed = random.randint(0, 100)
-        for row in range(self.height):
-            for col in range(self.width):
-                noise_value = pnoise2(row / scale, col / scale, base=seed)
-                if noise_value > threshold:
-                    self.grid[row][col].terrain = terrain
-
-    def _place_roads(self):
+        noise_values = perlin_field(self.height, self.width, scale, seed=derive_seed(self.seed, terrain))
+        self.terrain[noise_values > threshold] = TERRAIN_CODES[terrain]
+
+    def _place_roads(self, rng):
         """Create a connected road network."""
         road_segments = 3
+        road = TERRAIN_CODES['road']
         for _ in range(road_segments):
-            start_x = random.randint(0, self.width - 1)
-            start_y = random.randint(0, self.height - 1)
-            length = random.randint(7, 15)
+            start_x = rng.randint(0, self.width - 1)
+            start_y = rng.randint(0, self.height - 1)
+            length = rng.randint(7, 15)
             x, y = start_x, start_y
             for _ in range(length):
-                self.grid[y][x].terrain = 'road'
-                direction = random.choice([(0, 1), (1, 0), (0, -1), (-1, 0)])
+                self.terrain[y, x] = road
+                direction = rng.choice([(0, 1), (1, 0), (0, -1), (-1, 0)])
                 x += direction[0]
                 y += direction[1]
                 if not (0 <= x < self.width and 0 <= y < self.height):
@@ -63,25 +220,13 @@ class GridMap:
 
         for zone in zones:
             x_start, y_start = zone
-            for y in range(y_start, y_start + player_zone_size):
-                for x in range(x_start, x_start + player_zone_size):
-                    if 0 <= x < self.width and 0 <= y < self.height:
-                        self.grid[y][x].terrain = 'grass'
+            x_stop, y_stop = x_start + player_zone_size, y_start + player_zone_size
+            self.terrain[max(y_start, 0):max(y_stop, 0), max(x_start, 0):max(x_stop, 0)] = TERRAIN_CODES['grass']
 
     def display_grid(self):
         """Print the grid to the console for debugging and show tile statistics."""
-        terrain_count = {}
-        for row in self.grid:
-            line = "".join(self._terrain_symbol(tile.terrain) for tile in row)
-            print(line)
-            for tile in row:
-                terrain_count[tile.terrain] = terrain_count.get(tile.terrain, 0) + 1
+        write_ascii(self, sys.stdout)
         print("\nTile Distribution:")
-        for terrain, count in terrain_count.items():
-            print(f"{terrain.capitalize()}: {count} tiles")
-
-    @staticmethod
-    def _terrain_symbol(terrain):
-        """Return a symbol to represent the terrain."""
-        symbols = {'grass': '.', 'water': '~', 'mountain': '^', 'road': '#'}
-        return symbols.get(terrain, '?')
+        for terrain, count in terrain_histogram(self).items():
+            if count:
+                print(f"{terrain.capitalize()}: {count} tiles")
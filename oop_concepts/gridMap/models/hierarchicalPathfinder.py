@@ -0,0 +1,265 @@
+import heapq
+from .pathfinder import MOVEMENT_COSTS
+from .tile import BLOCKING_TERRAIN
+
+INF = float('inf')
+
+
+class HierarchicalPathfinder:
+    """Hierarchical pathfinding (HPA*) over square chunks of a GridMap.
+
+    Every pair of neighbouring chunks is joined by entrances: one tile pair in the
+    middle of each walkable run along their shared border. A chunk's abstract graph
+    links its entrance tiles with the cheapest intra-chunk costs and to their partners
+    across the border. Queries search this small graph and then refine only the
+    chunks the abstract path crosses. Costs follow the PathPlanner cost model with
+    water and mountains impassable; unit occupancy is not considered.
+    """
+
+    def __init__(self, grid_map, chunk_size=32, movement_costs=None):
+        self.grid_map = grid_map
+        self.chunk_size = chunk_size
+        self.movement_costs = {
+            terrain: cost for terrain, cost in (movement_costs or MOVEMENT_COSTS).items()
+            if terrain not in BLOCKING_TERRAIN
+        }
+        self.min_cost = min(self.movement_costs.values())
+        self.chunks_x = -(-grid_map.width // chunk_size)
+        self.chunks_y = -(-grid_map.height // chunk_size)
+        self.stats = {'queries': 0, 'abstract_expanded': 0, 'chunk_builds': 0, 'refined_chunks': 0}
+        self._costs = grid_map.cost_grid(self.movement_costs).ravel().tolist()
+        self._borders = {}  # ('v' | 'h', cx, cy) -> list of (tile_a, tile_b) entrance pairs
+        self._graphs = {}  # (cx, cy) -> {node: [(neighbour, cost), ...]}, built lazily
+        for cy in range(self.chunks_y):
+            for cx in range(self.chunks_x):
+                for border in self._borders_of((cx, cy))[:2]:
+                    self._build_border(border)
+        grid_map.add_listener(self._on_tile_changed)
+
+    def build(self):
+        """Precompute the abstract graph of every chunk instead of building them on demand."""
+        for cy in range(self.chunks_y):
+            for cx in range(self.chunks_x):
+                self._chunk_graph((cx, cy))
+
+    def close(self):
+        """Detach from the GridMap."""
+        self.grid_map.remove_listener(self._on_tile_changed)
+
+    def find_path(self, start, goal):
+        """Return a walkable path from start to goal as a list of (x, y), or None."""
+        self.stats['queries'] += 1
+        width = self.grid_map.width
+        start_index = start[1] * width + start[0]
+        goal_index = goal[1] * width + goal[0]
+        if self._costs[goal_index] == INF:
+            return None
+        start_chunk = self._chunk_of(start_index)
+        goal_chunk = self._chunk_of(goal_index)
+
+        if start_chunk == goal_chunk:
+            path = self._chunk_path(start_index, goal_index, start_chunk)
+            if path is not None:
+                return self._to_points(path)
+
+        # Temporary links from the start into its chunk's entrances and from the goal chunk's entrances to the goal
+        start_dist, _ = self._chunk_search(start_index, self._bounds(start_chunk), self._chunk_graph(start_chunk))
+        start_links = [(node, cost) for node, cost in start_dist.items() if node in self._graphs[start_chunk]]
+        goal_dist, _ = self._chunk_search(goal_index, self._bounds(goal_chunk), self._chunk_graph(goal_chunk), reverse=True)
+        goal_links = {node: cost for node, cost in goal_dist.items() if node in self._graphs[goal_chunk]}
+
+        abstract = self._abstract_search(start_index, goal_index, start_links, goal_links)
+        if abstract is None:
+            return None
+        return self._to_points(self._refine(abstract))
+
+    def _abstract_search(self, start_index, goal_index, start_links, goal_links):
+        """A* over entrance nodes; returns the list of abstract waypoints or None."""
+        width = self.grid_map.width
+        goal_row, goal_col = divmod(goal_index, width)
+
+        def heuristic(index):
+            row, col = divmod(index, width)
+            return (abs(row - goal_row) + abs(col - goal_col)) * self.min_cost
+
+        g_score = {start_index: 0}
+        came_from = {start_index: -1}
+        closed = set()
+        open_set = [(heuristic(start_index), start_index)]
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            if current in closed:
+                continue
+            if current == goal_index:
+                waypoints = []
+                while current != -1:
+                    waypoints.append(current)
+                    current = came_from[current]
+                waypoints.reverse()
+                return waypoints
+            closed.add(current)
+            self.stats['abstract_expanded'] += 1
+
+            edges = list(self._chunk_graph(self._chunk_of(current)).get(current, ()))
+            if current == start_index:
+                edges.extend(start_links)
+            if current in goal_links:
+                edges.append((goal_index, goal_links[current]))
+            for neighbour, cost in edges:
+                tentative = g_score[current] + cost
+                if neighbour not in closed and tentative < g_score.get(neighbour, INF):
+                    g_score[neighbour] = tentative
+                    came_from[neighbour] = current
+                    heapq.heappush(open_set, (tentative + heuristic(neighbour), neighbour))
+        return None
+
+    def _refine(self, waypoints):
+        """Expand consecutive abstract waypoints into a full tile path."""
+        width = self.grid_map.width
+        path = [waypoints[0]]
+        for current, following in zip(waypoints, waypoints[1:]):
+            if abs(current - following) in (1, width) and self._chunk_of(current) != self._chunk_of(following):
+                path.append(following)  # Border crossing
+                continue
+            self.stats['refined_chunks'] += 1
+            path.extend(self._chunk_path(current, following, self._chunk_of(current))[1:])
+        return path
+
+    def _chunk_path(self, source, target, chunk):
+        """Cheapest path from source to target without leaving the chunk, or None."""
+        dist, parent = self._chunk_search(source, self._bounds(chunk), {target: None})
+        if target not in dist:
+            return None
+        path = []
+        current = target
+        while current != -1:
+            path.append(current)
+            current = parent[current]
+        path.reverse()
+        return path
+
+    def _chunk_search(self, source, bounds, targets, reverse=False):
+        """Dijkstra from source restricted to bounds, stopping once every target is settled.
+
+        With reverse=True the distances are costs from each tile to the source.
+        """
+        width = self.grid_map.width
+        costs = self._costs
+        x0, y0, x1, y1 = bounds
+        remaining = len(targets)
+        dist = {}
+        parent = {source: -1}
+        best = {source: 0}
+        open_set = [(0, source)]
+        while open_set and remaining:
+            current_dist, current = heapq.heappop(open_set)
+            if current in dist:
+                continue
+            dist[current] = current_dist
+            if current in targets:
+                remaining -= 1
+            row, col = divmod(current, width)
+            step = costs[current] if reverse else 0
+            for neighbour, inside in (
+                (current - width, row > y0),
+                (current + width, row < y1 - 1),
+                (current - 1, col > x0),
+                (current + 1, col < x1 - 1),
+            ):
+                if not inside or neighbour in dist:
+                    continue
+                tentative = current_dist + (step if reverse else costs[neighbour])
+                if reverse and costs[neighbour] == INF:
+                    continue
+                if tentative < best.get(neighbour, INF):
+                    best[neighbour] = tentative
+                    parent[neighbour] = current
+                    heapq.heappush(open_set, (tentative, neighbour))
+        return dist, parent
+
+    def _chunk_graph(self, chunk):
+        """Return (building if needed) the abstract graph of one chunk."""
+        graph = self._graphs.get(chunk)
+        if graph is not None:
+            return graph
+        links = {}
+        for border, side in zip(self._borders_of(chunk), (0, 0, 1, 1)):
+            for pair in self._borders.get(border, ()):
+                links.setdefault(pair[side], []).append(pair[1 - side])
+
+        bounds = self._bounds(chunk)
+        graph = {}
+        for node, partners in links.items():
+            dist, _ = self._chunk_search(node, bounds, links)
+            edges = [(other, cost) for other, cost in dist.items() if other in links and other != node]
+            edges.extend((partner, self._costs[partner]) for partner in partners)
+            graph[node] = edges
+        self._graphs[chunk] = graph
+        self.stats['chunk_builds'] += 1
+        return graph
+
+    def _borders_of(self, chunk):
+        """Borders to the right, below, left and above a chunk; the chunk is side 0 of the first two."""
+        cx, cy = chunk
+        return [('v', cx, cy), ('h', cx, cy), ('v', cx - 1, cy), ('h', cx, cy - 1)]
+
+    def _build_border(self, border):
+        """Recompute the entrance pairs of one border and return True if they changed."""
+        kind, cx, cy = border
+        if cx < 0 or cy < 0 or (kind == 'v' and cx + 1 >= self.chunks_x) or (kind == 'h' and cy + 1 >= self.chunks_y):
+            return False
+        width = self.grid_map.width
+        x0, y0, x1, y1 = self._bounds((cx, cy))
+        if kind == 'v':
+            pairs = [(y * width + x1 - 1, y * width + x1) for y in range(y0, y1)]
+        else:
+            pairs = [((y1 - 1) * width + x, y1 * width + x) for x in range(x0, x1)]
+
+        entrances = []
+        run = []
+        for pair in pairs + [None]:
+            if pair is not None and self._costs[pair[0]] != INF and self._costs[pair[1]] != INF:
+                run.append(pair)
+            elif run:
+                entrances.append(run[len(run) // 2])
+                run = []
+        changed = self._borders.get(border) != entrances
+        self._borders[border] = entrances
+        return changed
+
+    def _on_tile_changed(self, x, y, kind):
+        """Update the tile's cost and drop the abstract graphs it affects."""
+        if kind != 'terrain':
+            return
+        index = y * self.grid_map.width + x
+        self._costs[index] = self.movement_costs.get(self.grid_map.get_terrain(x, y), INF)
+        chunk = self._chunk_of(index)
+        self._graphs.pop(chunk, None)
+
+        cx, cy = chunk
+        x0, y0, x1, y1 = self._bounds(chunk)
+        neighbours = (
+            (x == x1 - 1, ('v', cx, cy), (cx + 1, cy)),
+            (y == y1 - 1, ('h', cx, cy), (cx, cy + 1)),
+            (x == x0, ('v', cx - 1, cy), (cx - 1, cy)),
+            (y == y0, ('h', cx, cy - 1), (cx, cy - 1)),
+        )
+        for on_border, border, neighbour in neighbours:
+            if not on_border:
+                continue
+            was_entrance = any(index in pair for pair in self._borders.get(border, ()))
+            if self._build_border(border) or was_entrance:
+                self._graphs.pop(neighbour, None)  # Its entrances or crossing costs changed
+
+    def _chunk_of(self, index):
+        row, col = divmod(index, self.grid_map.width)
+        return col // self.chunk_size, row // self.chunk_size
+
+    def _bounds(self, chunk):
+        cx, cy = chunk
+        x0, y0 = cx * self.chunk_size, cy * self.chunk_size
+        return x0, y0, min(x0 + self.chunk_size, self.grid_map.width), min(y0 + self.chunk_size, self.grid_map.height)
+
+    def _to_points(self, path):
+        width = self.grid_map.width
+        return [(index % width, index // width) for index in path]
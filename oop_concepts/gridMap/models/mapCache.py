@@ -0,0 +1,50 @@
+import hashlib
+import json
+import os
+import random
+from .mapFile import load_map, save_map_atomic
+from .mapGenerator import GENERATOR_VERSION, generate_map
+
+
+class MapCache:
+    """Content-addressed on-disk cache of generated maps.
+
+    Maps are keyed on (width, height, config, seed, generator version), so a repeated
+    request for the same preset loads the stored terrain instead of regenerating it.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.stats = {'hits': 0, 'misses': 0}
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(width, height, config, seed):
+        """Return the cache key for a generation request."""
+        payload = json.dumps(
+            {'width': width, 'height': height, 'config': config, 'seed': seed, 'version': GENERATOR_VERSION},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path(self, width, height, config, seed):
+        """Return the file that holds (or will hold) a cached map."""
+        return os.path.join(self.directory, self.key(width, height, config, seed) + '.gmap')
+
+    def get_or_generate(self, width, height, config, seed, workers=1):
+        """Load the map from the cache, generating and storing it on a miss.
+
+        A seed of None picks a random seed first, as generate_map does, so every such
+        call gets a new map instead of the one stored by the first.
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        path = self.path(width, height, config, seed)
+        if os.path.exists(path):
+            self.stats['hits'] += 1
+            return load_map(path, mode='c')  # Copy-on-write: pages are shared until edited
+
+        self.stats['misses'] += 1
+        grid_map = generate_map(width, height, config, seed, workers=workers)
+        save_map_atomic(grid_map, path)  # Concurrent readers never see a partial map
+        return grid_map
@@ -0,0 +1,106 @@
+import os
+import struct
+import tempfile
+import numpy as np
+from .gridMap import GridMap
+from .tile import TERRAIN_TYPES
+from .unit import Unit
+
+MAGIC = b'GMAP'
+FORMAT_VERSION = 2
+READABLE_VERSIONS = (1, 2)
+ALIGNMENT = 64  # Terrain plane offset alignment
+NO_SEED = -1
+
+# magic, format version, terrain code count, width, height, seed, terrain offset, units offset
+HEADER = struct.Struct('<4sHHIIqQQ')
+UNIT_RECORD = struct.Struct('<IIddH')  # x, y, speed, health, name length
+UNIT_RECORD_V1 = struct.Struct('<IIiiH')  # Version 1 stored integer speed and health
+
+
+def save_map(grid_map, path):
+    """Write a GridMap as a binary map file.
+
+    Layout: fixed header, terrain code table (length-prefixed names), the raw
+    height x width uint8 terrain plane at an aligned offset, then the unit section.
+    """
+    table = b''.join(bytes([len(name)]) + name.encode('ascii') for name in TERRAIN_TYPES)
+    terrain_offset = -(-(HEADER.size + len(table)) // ALIGNMENT) * ALIGNMENT
+    units_offset = terrain_offset + grid_map.width * grid_map.height
+    seed = NO_SEED if grid_map.seed is None else grid_map.seed
+    units = [struct.pack('<I', len(grid_map.units))]  # Packed before opening, so a bad unit leaves no partial file
+    for (x, y), unit in grid_map.units.items():
+        name = unit.name.encode('utf-8')
+        units.append(UNIT_RECORD.pack(x, y, unit.speed, unit.health, len(name)) + name)
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(TERRAIN_TYPES), grid_map.width, grid_map.height,
+                               seed, terrain_offset, units_offset))
+        file.write(table)
+        file.write(b'\0' * (terrain_offset - HEADER.size - len(table)))
+        file.write(np.ascontiguousarray(grid_map.terrain, dtype=np.uint8).tobytes())
+        file.write(b''.join(units))
+
+
+def save_map_atomic(grid_map, path):
+    """Write a map file through a temporary file in the same directory, so readers never see a partial map."""
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    os.close(handle)
+    try:
+        save_map(grid_map, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def read_header(path):
+    """Return the header fields of a map file as a dict, including its terrain code table."""
+    with open(path, 'rb') as file:
+        fields = HEADER.unpack(file.read(HEADER.size))
+        magic, version, code_count, width, height, seed, terrain_offset, units_offset = fields
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a map file.")
+        if version not in READABLE_VERSIONS:
+            raise ValueError(f"Unsupported map file version {version}.")
+        table = []
+        for _ in range(code_count):
+            length = file.read(1)[0]
+            table.append(file.read(length).decode('ascii'))
+    return {
+        'version': version, 'width': width, 'height': height, 'seed': None if seed == NO_SEED else seed,
+        'terrain_types': tuple(table), 'terrain_offset': terrain_offset, 'units_offset': units_offset,
+    }
+
+
+def load_map(path, mode='r'):
+    """Load a map file, memory-mapping its terrain plane.
+
+    mode is the numpy.memmap mode: 'r' shares one read-only copy between processes,
+    'c' is copy-on-write and 'r+' writes terrain edits back to the file. The plane is
+    only copied when the file's terrain code table differs from TERRAIN_TYPES.
+    """
+    header = read_header(path)
+    width, height = header['width'], header['height']
+    terrain = np.memmap(path, dtype=np.uint8, mode=mode, offset=header['terrain_offset'], shape=(height, width))
+    if header['terrain_types'] != TERRAIN_TYPES[:len(header['terrain_types'])]:
+        lookup = np.array([TERRAIN_TYPES.index(name) for name in header['terrain_types']], dtype=np.uint8)
+        terrain = lookup[terrain]
+
+    grid_map = GridMap(width, height, terrain=terrain)
+    grid_map.seed = header['seed']
+    record = UNIT_RECORD if header['version'] >= 2 else UNIT_RECORD_V1
+    with open(path, 'rb') as file:
+        file.seek(header['units_offset'])
+        (count,) = struct.unpack('<I', file.read(4))
+        for _ in range(count):
+            x, y, speed, health, name_length = record.unpack(file.read(record.size))
+            unit = Unit(file.read(name_length).decode('utf-8'), _number(speed))
+            unit.health = _number(health)
+            grid_map.set_unit(x, y, unit)
+    return grid_map
+
+
+def _number(value):
+    """Return a stored speed or health as an int when it is whole, so integer stats round-trip unchanged."""
+    return int(value) if float(value).is_integer() else value
@@ -0,0 +1,76 @@
+import logging
+import random
+from .gridMap import GridMap
+from .instrumentation import Metrics
+from .mapPipeline import MapPipeline
+from .mapValidator import MapValidator
+from .pathfinder import PathPlanner
+from .seeding import derive_seed
+from .terrainGenerator import TerrainGenerator
+from .zoneGenerator import ZoneAllocator
+
+GENERATOR_VERSION = 4  # Bump whenever generation output changes for the same inputs
+TERRAIN_CONFIG_KEYS = ('grass', 'mountain', 'water')  # Config entries the terrain stage reads; roads read 'road'
+
+logger = logging.getLogger(__name__)
+
+
+def generate_map(width, height, config, seed=None, workers=1, metrics=None):
+    """Generate terrain, roads and connected player zones from one seed and return the GridMap.
+
+    Pass a Metrics to collect per-stage timings and counters for the run.
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    metrics = metrics or Metrics()
+    grid_map = build_pipeline(cache_size=0).run(width, height, config, seed, workers=workers, metrics=metrics)
+    metrics.log(logger, logging.DEBUG, width=width, height=height, seed=seed)
+    return grid_map
+
+
+def build_pipeline(cache_size=32):
+    """Return the standard generation stages as a MapPipeline.
+
+    Keep one around to regenerate a map cheaply while tuning a single config entry:
+    only the stages reading that entry, and the ones after them, run again.
+    """
+    pipeline = MapPipeline(cache_size=cache_size)
+    pipeline.add_stage('terrain', _terrain_stage, outputs=('terrain',), config_keys=TERRAIN_CONFIG_KEYS)
+    pipeline.add_stage('roads', _road_stage, inputs=('terrain',), outputs=('roads',), config_keys=('road',))
+    pipeline.add_stage('zones', _zone_stage, inputs=('roads',), outputs=('zones',))
+    pipeline.add_stage('validate', _validate_stage, inputs=('zones',), outputs=('map',))
+    return pipeline
+
+
+# Terrain Generation
+def _terrain_stage(context):
+    grid_map = GridMap(context.width, context.height)
+    terrain_generator = TerrainGenerator(grid_map, context.config, seed=derive_seed(context.seed, 'terrain'),
+                                         workers=context.workers)
+    terrain_generator.generate_terrain()
+    context.metrics.count_all(terrain_generator.stats, 'terrain_')
+    return {'terrain': grid_map.terrain}
+
+
+# Road Placement
+def _road_stage(context):
+    grid_map = GridMap(context.width, context.height, terrain=context.layers['terrain'])
+    path_planner = PathPlanner(grid_map, context.config, seed=derive_seed(context.seed, 'roads'))
+    path_planner.place_roads()
+    context.metrics.count_all(path_planner.stats, 'roads_')
+    return {'roads': grid_map.terrain}
+
+
+# Reserve Player Zones
+def _zone_stage(context):
+    grid_map = GridMap(context.width, context.height, terrain=context.layers['roads'])
+    ZoneAllocator(grid_map).reserve_player_zones()
+    return {'zones': grid_map.terrain}
+
+
+# Make sure every zone can reach the others
+def _validate_stage(context):
+    grid_map = GridMap(context.width, context.height, terrain=context.layers['zones'])
+    report = MapValidator(grid_map, ZoneAllocator(grid_map).zones()).repair()
+    context.metrics.count('validate_carved', report['carved'])
+    return {'map': grid_map.terrain}
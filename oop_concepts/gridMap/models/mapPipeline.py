@@ -0,0 +1,117 @@
+import hashlib
+import json
+import random
+from .gridMap import GridMap
+from .instrumentation import Metrics
+
+
+class PipelineStage:
+    """One generation step: a function from named input layers to named output layers.
+
+    ``config_keys`` lists the config entries the step reads, so changing any other
+    entry leaves its cached output valid.
+    """
+
+    __slots__ = ('name', 'run', 'inputs', 'outputs', 'config_keys')
+
+    def __init__(self, name, run, inputs=(), outputs=(), config_keys=()):
+        self.name = name
+        self.run = run
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.config_keys = tuple(config_keys)
+
+
+class StageContext:
+    """What a stage function gets: the run parameters and copies of its input layers."""
+
+    __slots__ = ('width', 'height', 'config', 'seed', 'workers', 'metrics', 'layers')
+
+    def __init__(self, width, height, config, seed, workers, metrics, layers):
+        self.width = width
+        self.height = height
+        self.config = config
+        self.seed = seed
+        self.workers = workers
+        self.metrics = metrics
+        self.layers = layers  # Layer name -> (height, width) uint8 terrain array, safe to modify
+
+
+class MapPipeline:
+    """Registered generation stages whose output layers are memoized between runs.
+
+    A stage's cache key covers its name, the config entries it declares, the seed,
+    the map size and the keys of the stages that produced its inputs. Changing one
+    config entry therefore re-runs only the stages that read it and everything
+    downstream of them. Layers are copied in and out of the cache, so callers may
+    edit the maps they get back.
+    """
+
+    def __init__(self, cache_size=32):
+        self.stages = []
+        self.cache_size = cache_size  # Cached stage results kept, least recently used first out; 0 disables
+        self.stats = {'hits': 0, 'misses': 0}
+        self._cache = {}  # Stage key -> {layer name: array}
+
+    def add_stage(self, name, run, inputs=(), outputs=(), config_keys=()):
+        """Register a stage; its inputs must be produced by stages registered before it."""
+        produced = {layer for stage in self.stages for layer in stage.outputs}
+        missing = [layer for layer in inputs if layer not in produced]
+        if missing:
+            raise ValueError(f"Stage '{name}' needs layers no earlier stage produces: {missing}")
+        if any(stage.name == name for stage in self.stages):
+            raise ValueError(f"Stage '{name}' is already registered.")
+        if not outputs:
+            raise ValueError(f"Stage '{name}' must produce at least one layer.")
+        self.stages.append(PipelineStage(name, run, inputs, outputs, config_keys))
+
+    def run(self, width, height, config, seed=None, workers=1, metrics=None):
+        """Run every stage, reusing cached layers, and return the last stage's first output as a GridMap."""
+        if not self.stages:
+            raise ValueError("The pipeline has no stages.")
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        metrics = metrics or Metrics()
+        layers = {}  # Layer name -> array, as produced in this run
+        producer_keys = {}  # Layer name -> key of the stage that produced it
+        for stage in self.stages:
+            key = self._stage_key(stage, width, height, config, seed, producer_keys)
+            outputs = self._cache.pop(key, None)
+            if outputs is not None:
+                self.stats['hits'] += 1
+                metrics.count('pipeline_cache_hits')
+            else:
+                self.stats['misses'] += 1
+                context = StageContext(width, height, config, seed, workers, metrics,
+                                       {layer: layers[layer].copy() for layer in stage.inputs})
+                with metrics.stage(stage.name):
+                    outputs = stage.run(context)
+                if set(outputs) != set(stage.outputs):
+                    raise ValueError(f"Stage '{stage.name}' returned {sorted(outputs)}, declared {list(stage.outputs)}.")
+                if self.cache_size:
+                    outputs = {layer: array.copy() for layer, array in outputs.items()}
+            if self.cache_size:
+                self._cache[key] = outputs  # Reinserted so the dict stays in least recently used order
+                while len(self._cache) > self.cache_size:
+                    del self._cache[next(iter(self._cache))]
+            for layer in stage.outputs:
+                layers[layer] = outputs[layer]
+                producer_keys[layer] = key
+
+        final = layers[self.stages[-1].outputs[0]]
+        grid_map = GridMap(width, height, terrain=final.copy() if self.cache_size else final)
+        grid_map.seed = seed
+        return grid_map
+
+    def clear(self):
+        """Forget every cached layer."""
+        self._cache.clear()
+
+    @staticmethod
+    def _stage_key(stage, width, height, config, seed, producer_keys):
+        description = {
+            'stage': stage.name, 'width': width, 'height': height, 'seed': seed,
+            'config': [[key, config[key]] for key in config if key in stage.config_keys],  # Config order matters
+            'inputs': [producer_keys[layer] for layer in stage.inputs],
+        }
+        return hashlib.sha256(json.dumps(description, sort_keys=True, default=repr).encode()).hexdigest()
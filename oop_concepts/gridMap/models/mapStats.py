@@ -0,0 +1,53 @@
+import io
+import numpy as np  # Install with pip install numpy
+from .components import label_components
+from .tile import TERRAIN_TYPES
+
+TERRAIN_SYMBOLS = {'grass': '.', 'water': '~', 'mountain': '^', 'road': '#'}
+SYMBOL_TABLE = np.frombuffer(''.join(TERRAIN_SYMBOLS.get(terrain, '?') for terrain in TERRAIN_TYPES).encode('ascii'),
+                             dtype=np.uint8)  # Terrain code -> ASCII byte
+
+
+def terrain_histogram(grid_map):
+    """Return the number of tiles of each terrain type, in TERRAIN_TYPES order."""
+    counts = np.bincount(grid_map.terrain.ravel(), minlength=len(TERRAIN_TYPES))
+    return {terrain: int(count) for terrain, count in zip(TERRAIN_TYPES, counts)}
+
+
+def region_counts(grid_map, region_size):
+    """Return terrain counts per square region as an int array of shape (region rows, region cols, terrain types).
+
+    Regions at the right and bottom edges may be smaller than region_size.
+    """
+    rows = -(-grid_map.height // region_size)
+    cols = -(-grid_map.width // region_size)
+    region_y = np.arange(grid_map.height) // region_size
+    region_x = np.arange(grid_map.width) // region_size
+    region = (region_y[:, None] * cols + region_x[None, :]) * len(TERRAIN_TYPES)
+    counts = np.bincount((region + grid_map.terrain).ravel(), minlength=rows * cols * len(TERRAIN_TYPES))
+    return counts.reshape(rows, cols, len(TERRAIN_TYPES))
+
+
+def cluster_counts(grid_map, terrains=None):
+    """Return the number of 4-connected clusters of each terrain type."""
+    return {
+        terrain: label_components(grid_map.terrain == code)[1]
+        for code, terrain in enumerate(TERRAIN_TYPES)
+        if terrains is None or terrain in terrains
+    }
+
+
+def write_ascii(grid_map, fileobj, chunk_rows=256):
+    """Write the map as one line of terrain symbols per row, chunk_rows rows at a time.
+
+    fileobj may be opened in text or binary mode.
+    """
+    text = isinstance(fileobj, io.TextIOBase)
+    lines = np.empty((chunk_rows, grid_map.width + 1), dtype=np.uint8)
+    lines[:, -1] = ord('\n')
+    for y0 in range(0, grid_map.height, chunk_rows):
+        block = grid_map.terrain[y0:y0 + chunk_rows]
+        out = lines[:len(block)]
+        out[:, :-1] = SYMBOL_TABLE[block]
+        data = out.tobytes()
+        fileobj.write(data.decode('ascii') if text else data)
@@ -0,0 +1,126 @@
+import heapq
+import logging
+import numpy as np  # Install with pip install numpy
+from .components import label_components
+from .pathfinder import MOVEMENT_COSTS
+from .tile import BLOCKING_TERRAIN, TERRAIN_CODES
+
+logger = logging.getLogger(__name__)
+
+
+class MapValidator:
+    """Check that every player zone can walk to every other and carve corridors where not.
+
+    Walkable tiles are labelled into 4-connected components. The component holding
+    the most zones is the main one; zones outside it are isolated. Repair joins an
+    isolated zone's component to the main one along the cheapest path under the
+    movement costs and turns the blocking tiles on it into road.
+    """
+
+    def __init__(self, grid_map, zones, movement_costs=None):
+        self.grid_map = grid_map
+        self.zones = [zone for zone in zones if zone[2] > zone[0] and zone[3] > zone[1]]  # (x0, y0, x1, y1)
+        self.movement_costs = movement_costs or MOVEMENT_COSTS
+        self._blocking = [TERRAIN_CODES[terrain] for terrain in BLOCKING_TERRAIN]
+
+    def validate(self):
+        """Return {'components', 'zone_components', 'main_zone', 'isolated', 'connected'} for the current map.
+
+        zone_components holds the component label of each zone (0 when it stands on
+        blocking terrain), main_zone a zone in the main component and isolated the
+        indices of the zones outside it.
+        """
+        labels, count = self._label()
+        return self._report(labels, count)
+
+    def repair(self):
+        """Carve corridors until all zones are connected and return the final report.
+
+        The report adds 'carved', the number of tiles turned into road.
+        """
+        labels, count = self._label()
+        report = self._report(labels, count)
+        carved = 0
+        while report['isolated']:
+            main_zone, zone = report['main_zone'], report['isolated'][0]
+            if not report['zone_components'][main_zone]:  # No zone stands on walkable ground yet
+                x0, y0 = self.zones[main_zone][:2]
+                path = np.array([y0 * self.grid_map.width + x0])
+            else:
+                path = self._cheapest_corridor(labels, zone, report['zone_components'][main_zone])
+            blocked = path[np.isin(self.grid_map.terrain.flat[path], self._blocking)]
+            if not len(blocked):
+                raise ValueError(f"The corridor for zone {zone + 1} crosses no blocking tile; repair cannot progress.")
+            self.grid_map.terrain.flat[blocked] = TERRAIN_CODES['road']
+            carved += len(blocked)
+            logger.info("Carved a corridor of %d tiles for zone %d.", len(blocked), zone + 1)
+            labels, count = self._label()
+            report = self._report(labels, count)
+        report['carved'] = carved
+        return report
+
+    def _label(self):
+        return label_components(~np.isin(self.grid_map.terrain, self._blocking))
+
+    def _report(self, labels, count):
+        zone_components = [int(labels[y0, x0]) for x0, y0, _, _ in self.zones]
+        walkable = [label for label in zone_components if label]
+        main_label = max(walkable, key=walkable.count) if walkable else 0
+        main_zone = zone_components.index(main_label) if walkable else 0
+        isolated = [index for index, label in enumerate(zone_components) if label != main_label or not label]
+        return {
+            'components': count, 'zone_components': zone_components, 'main_zone': main_zone,
+            'isolated': isolated, 'connected': not isolated,
+        }
+
+    def _cheapest_corridor(self, labels, zone, target_label):
+        """Return flat tile indices of the cheapest path from a zone's component to the target component.
+
+        Tiles whose terrain has no finite cost in movement_costs still get a large
+        finite carve cost, so a corridor always exists.
+        """
+        width, height = self.grid_map.width, self.grid_map.height
+        costs = self.grid_map.cost_grid(self.movement_costs).ravel()
+        finite = np.isfinite(costs)
+        largest = costs[finite].max() if finite.any() else 1.0
+        costs = np.where(finite, costs, largest * width * height).tolist()
+        flat_labels = labels.ravel()
+        x0, y0 = self.zones[zone][:2]
+        source_label = flat_labels[y0 * width + x0]
+        if source_label:
+            sources = np.flatnonzero(flat_labels == source_label)
+        else:  # The zone stands on blocking terrain; start from its corner tile
+            sources = np.array([y0 * width + x0])
+
+        dist = [float('inf')] * (width * height)
+        parent = [-1] * (width * height)
+        for index in sources.tolist():
+            dist[index] = 0
+        open_set = [(0, index) for index in sources.tolist()]
+        while open_set:
+            current_dist, current = heapq.heappop(open_set)
+            if current_dist > dist[current]:
+                continue  # Stale entry
+            if flat_labels[current] == target_label:
+                break
+            row, col = divmod(current, width)
+            for neighbour in (
+                current - width if row > 0 else -1,
+                current + width if row < height - 1 else -1,
+                current - 1 if col > 0 else -1,
+                current + 1 if col < width - 1 else -1,
+            ):
+                if neighbour < 0:
+                    continue
+                candidate = current_dist + costs[neighbour]
+                if candidate < dist[neighbour]:
+                    dist[neighbour] = candidate
+                    parent[neighbour] = current
+                    heapq.heappush(open_set, (candidate, neighbour))
+        if flat_labels[current] != target_label:
+            raise ValueError(f"No corridor reaches the main component from zone {zone + 1}.")
+
+        path = [current]
+        while parent[path[-1]] >= 0:
+            path.append(parent[path[-1]])
+        return np.array(path)
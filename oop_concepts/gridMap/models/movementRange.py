@@ -0,0 +1,126 @@
+import heapq
+import numpy as np  # Install with pip install numpy
+from .pathfinder import MOVEMENT_COSTS
+from .tile import BLOCKING_TERRAIN
+
+INF = float('inf')
+
+
+class ReachableArea:
+    """Tiles a unit can reach, stored as arrays over the bounding box of the reached tiles.
+
+    ``costs[row, col]`` is the cheapest cost to reach tile (x0 + col, y0 + row) and
+    inf for tiles out of range; ``mask`` marks the reachable ones.
+    """
+
+    __slots__ = ('x0', 'y0', 'costs', 'mask')
+
+    def __init__(self, x0, y0, costs):
+        self.x0 = x0
+        self.y0 = y0
+        self.costs = costs
+        self.mask = costs < INF
+
+    def __len__(self):
+        return int(self.mask.sum())
+
+    def __contains__(self, position):
+        col, row = position[0] - self.x0, position[1] - self.y0
+        return 0 <= row < self.mask.shape[0] and 0 <= col < self.mask.shape[1] and bool(self.mask[row, col])
+
+    def cost_to(self, x, y):
+        """Return the movement points needed to reach (x, y), or inf when out of range."""
+        return float(self.costs[y - self.y0, x - self.x0]) if (x, y) in self else INF
+
+    def tiles(self):
+        """Return the reachable tiles as a list of (x, y)."""
+        rows, cols = np.nonzero(self.mask)
+        return list(zip((cols + self.x0).tolist(), (rows + self.y0).tolist()))
+
+
+class MovementRange:
+    """Bounded-Dijkstra reachability for units on a GridMap.
+
+    Uses the same terrain costs as PathPlanner; water, mountains and tiles held by
+    other units cannot be entered. Queries share one distance buffer, which is reset
+    only where the previous query touched it.
+    """
+
+    def __init__(self, grid_map, movement_costs=None):
+        self.grid_map = grid_map
+        self.movement_costs = {
+            terrain: cost for terrain, cost in (movement_costs or MOVEMENT_COSTS).items()
+            if terrain not in BLOCKING_TERRAIN
+        }
+        self.refresh()
+        grid_map.add_listener(self._on_tile_changed)
+
+    def refresh(self):
+        """Rebuild the cost list from the map, e.g. after bulk terrain edits."""
+        costs = self.grid_map.cost_grid(self.movement_costs)
+        for x, y in self.grid_map.units:
+            costs[y, x] = INF
+        self._costs = costs.ravel().tolist()
+        self._distance = [INF] * (self.grid_map.width * self.grid_map.height)  # Scratch buffer
+
+    def close(self):
+        """Detach from the GridMap."""
+        self.grid_map.remove_listener(self._on_tile_changed)
+
+    def reachable(self, x, y, movement_points):
+        """Return the ReachableArea of a unit standing on (x, y) with movement_points to spend."""
+        width, height = self.grid_map.width, self.grid_map.height
+        costs, distance = self._costs, self._distance
+        start = y * width + x
+        distance[start] = 0
+        touched = [start]
+        open_set = [(0, start)]
+        while open_set:
+            current_dist, current = heapq.heappop(open_set)
+            if current_dist > distance[current]:
+                continue  # Stale entry
+            row, col = divmod(current, width)
+            for neighbour, inside in (
+                (current - width, row > 0), (current + width, row < height - 1),
+                (current - 1, col > 0), (current + 1, col < width - 1),
+            ):
+                if not inside:
+                    continue
+                candidate = current_dist + costs[neighbour]
+                if candidate <= movement_points and candidate < distance[neighbour]:
+                    if distance[neighbour] == INF:
+                        touched.append(neighbour)
+                    distance[neighbour] = candidate
+                    heapq.heappush(open_set, (candidate, neighbour))
+
+        indices = np.array(touched)
+        rows, cols = np.divmod(indices, width)
+        x0, y0 = int(cols.min()), int(rows.min())
+        area = np.full((int(rows.max()) - y0 + 1, int(cols.max()) - x0 + 1), INF, dtype=np.float32)
+        area[rows - y0, cols - x0] = [distance[index] for index in touched]
+        for index in touched:
+            distance[index] = INF
+        return ReachableArea(x0, y0, area)
+
+    def reachable_for_units(self, units, movement_points=None):
+        """Return {unit: ReachableArea} for every unit on the map.
+
+        movement_points defaults to each unit's speed. Units not on the map are skipped.
+        """
+        areas = {}
+        for unit in units:
+            position = self.grid_map.position_of(unit)
+            if position is not None:
+                areas[unit] = self.reachable(*position, unit.speed if movement_points is None else movement_points)
+        return areas
+
+    def reachable_for_player(self, player, movement_points=None):
+        """Return {unit: ReachableArea} for all of a player's units in one call."""
+        return self.reachable_for_units(player.units, movement_points)
+
+    def _on_tile_changed(self, x, y, kind):
+        if (x, y) in self.grid_map.units:
+            cost = INF
+        else:
+            cost = self.movement_costs.get(self.grid_map.get_terrain(x, y), INF)
+        self._costs[y * self.grid_map.width + x] = cost
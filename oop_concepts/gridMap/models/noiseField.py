@@ -0,0 +1,104 @@
+import numpy as np  # Install with pip install numpy
+
+REFERENCE_PERMUTATION = np.array([
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225, 140, 36, 103, 30, 69, 142, 8, 99,
+    37, 240, 21, 10, 23, 190, 6, 148, 247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32,
+    57, 177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175, 74, 165, 71, 134, 139, 48, 27,
+    166, 77, 146, 158, 231, 83, 111, 229, 122, 60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102,
+    143, 54, 65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169, 200, 196, 135, 130, 116,
+    188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64, 52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126,
+    255, 82, 85, 212, 207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213, 119, 248, 152,
+    2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9, 129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224,
+    232, 178, 185, 112, 104, 218, 246, 97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241, 81,
+    51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157, 184, 84, 204, 176, 115, 121, 50, 45,
+    127, 4, 150, 254, 138, 236, 205, 93, 222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156,
+    180
+], dtype=np.int64)  # Ken Perlin's table, as used by pnoise2
+PERMUTATION = np.concatenate([REFERENCE_PERMUTATION, REFERENCE_PERMUTATION])
+
+# Gradient table used by the reference 2D Perlin noise (first two components of GRAD3)
+GRADIENT_X = np.array([1, -1, 1, -1, 1, -1, 1, -1, 0, 0, 0, 0, 1, -1, 0, 0], dtype=np.float64)
+GRADIENT_Y = np.array([1, 1, -1, -1, 0, 0, 0, 0, 1, -1, 1, -1, 0, 0, -1, 1], dtype=np.float64)
+
+
+def lattice_offset(seed):
+    """Return the whole-lattice-cell (row, col) shift that stands in for a seed.
+
+    pnoise2's ``base`` argument offsets indices into its 512-entry table and reads past
+    the end for any base above 1, so seeds move the sampling window over the periodic
+    reference noise instead; the field for a seed is exactly pnoise2 at shifted points.
+    """
+    row, col = np.random.default_rng(seed).integers(256, size=2)
+    return int(row), int(col)
+
+
+def _fade(t):
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+def _gradient_noise(x, y, perm):
+    """Evaluate 2D Perlin gradient noise on the grid spanned by 1D coordinates x (rows) and y (columns).
+
+    Lattice indices, offsets and fade weights only depend on one axis, so they are
+    computed on the 1D coordinates and broadcast; only the hash lookups are 2D.
+    """
+    xi = np.floor(x)
+    yi = np.floor(y)
+    xf = (x - xi)[:, None]
+    yf = (y - yi)[None, :]
+    i = xi.astype(np.int64) & 255
+    j = (yi.astype(np.int64) & 255)[None, :]
+    a = perm[i][:, None]
+    b = perm[(i + 1) & 255][:, None]
+    jj = (j + 1) & 255
+
+    def corner(hashed, dx, dy):
+        h = perm[hashed] & 15
+        return GRADIENT_X[h] * dx + GRADIENT_Y[h] * dy
+
+    naa = corner(perm[a + j], xf, yf)
+    nba = corner(perm[b + j], xf - 1, yf)
+    nab = corner(perm[a + jj], xf, yf - 1)
+    nbb = corner(perm[b + jj], xf - 1, yf - 1)
+
+    u = _fade(xf)
+    v = _fade(yf)
+    nx0 = naa + u * (nba - naa)
+    nx1 = nab + u * (nbb - nab)
+    return nx0 + v * (nx1 - nx0)
+
+
+def perlin_field(height, width, scale, seed=0, octaves=1, persistence=0.5, lacunarity=2.0,
+                 row_offset=0, col_offset=0):
+    """Return a (height, width) array of Perlin noise sampled at (row / scale, col / scale).
+
+    This is the whole-field equivalent of calling ``pnoise2(row / scale + dr, col / scale + dc)``
+    per cell, with (dr, dc) = lattice_offset(seed) and octaves summed and normalised the
+    same way, so terrain thresholds tuned against pnoise2 keep their densities. The
+    offsets place the window inside a larger map, so chunks sampled separately match
+    the full field exactly.
+    """
+    shift_row, shift_col = lattice_offset(seed)
+    rows = np.arange(row_offset, row_offset + height, dtype=np.float64) / scale + shift_row
+    cols = np.arange(col_offset, col_offset + width, dtype=np.float64) / scale + shift_col
+
+    total = np.zeros((height, width), dtype=np.float64)
+    frequency = 1.0
+    amplitude = 1.0
+    max_amplitude = 0.0
+    for _ in range(octaves):
+        total += _gradient_noise(rows * frequency, cols * frequency, PERMUTATION) * amplitude
+        max_amplitude += amplitude
+        frequency *= lacunarity
+        amplitude *= persistence
+    return total / max_amplitude
+
+
+def edge_distance_field(height, width, row_offset=0, col_offset=0, rows=None, cols=None):
+    """Return each cell's distance in tiles to the nearest edge of a height x width map.
+
+    By default the whole map is returned; offsets and rows/cols select a window of it.
+    """
+    rows = np.arange(row_offset, row_offset + (height if rows is None else rows))[:, None]
+    cols = np.arange(col_offset, col_offset + (width if cols is None else cols))[None, :]
+    return np.minimum(np.minimum(rows, height - rows - 1), np.minimum(cols, width - cols - 1))
@@ -0,0 +1,134 @@
+import heapq
+import numpy as np
+from .tile import TERRAIN_CODES
+
+
+class RoadNetworkBuilder:
+    """Connect key points with roads using one multi-source search.
+
+    Implements Mehlhorn's Steiner tree approximation: a single Dijkstra grown from all
+    key points at once splits the map into regions owned by the nearest key point,
+    the cheapest edge between every pair of touching regions gives the shortest-path
+    distance between their key points, and a minimum spanning tree over those
+    distances picks which corridors to pave.
+    """
+
+    def __init__(self, grid_map, movement_costs):
+        self.grid_map = grid_map
+        self.movement_costs = movement_costs
+
+    def build(self, key_points):
+        """Pave roads connecting all key points and return search statistics."""
+        width, height = self.grid_map.width, self.grid_map.height
+        costs = self.grid_map.cost_grid(self.movement_costs).ravel().tolist()
+        dist, source, parent, expanded, pushes = self._grow_regions(key_points, costs, width, height)
+
+        edges = self._bridge_edges(np.array(dist).reshape(height, width), np.array(source).reshape(height, width))
+        tree = self._minimum_spanning_tree(edges, len(key_points))
+        paved = self._pave(tree, parent)
+        return {'expanded': expanded, 'pushes': pushes, 'paved': paved, 'connections': len(tree)}
+
+    @staticmethod
+    def _grow_regions(key_points, costs, width, height):
+        """Run one Dijkstra from every key point and record each tile's owner and parent."""
+        size = width * height
+        dist = [float('inf')] * size
+        source = [-1] * size
+        parent = [-1] * size
+        open_set = []
+        for owner, (x, y) in enumerate(key_points):
+            index = y * width + x
+            if source[index] == -1:
+                dist[index] = 0
+                source[index] = owner
+                open_set.append((0, index))
+        heapq.heapify(open_set)
+
+        expanded = 0
+        pushes = len(open_set)
+        while open_set:
+            current_dist, index = heapq.heappop(open_set)
+            if current_dist > dist[index]:
+                continue  # Stale entry
+            expanded += 1
+            row, col = divmod(index, width)
+            for neighbour in (
+                index - width if row > 0 else -1,
+                index + width if row < height - 1 else -1,
+                index - 1 if col > 0 else -1,
+                index + 1 if col < width - 1 else -1,
+            ):
+                if neighbour < 0:
+                    continue
+                tentative = current_dist + costs[neighbour]
+                if tentative < dist[neighbour]:
+                    dist[neighbour] = tentative
+                    source[neighbour] = source[index]
+                    parent[neighbour] = index
+                    heapq.heappush(open_set, (tentative, neighbour))
+                    pushes += 1
+        return dist, source, parent, expanded, pushes
+
+    @staticmethod
+    def _bridge_edges(dist, source):
+        """Return the cheapest (cost, tile_a, tile_b, owner_a, owner_b) edge between each pair of touching regions."""
+        height, width = dist.shape
+        index = np.arange(height * width).reshape(height, width)
+        candidates = []
+        for a, b in ((np.s_[:, :-1], np.s_[:, 1:]), (np.s_[:-1, :], np.s_[1:, :])):
+            crossing = (source[a] != source[b]) & (source[a] >= 0) & (source[b] >= 0)
+            crossing &= np.isfinite(dist[a]) & np.isfinite(dist[b])
+            candidates.append((
+                (dist[a] + dist[b])[crossing],
+                index[a][crossing],
+                index[b][crossing],
+            ))
+        cost = np.concatenate([c[0] for c in candidates])
+        tile_a = np.concatenate([c[1] for c in candidates])
+        tile_b = np.concatenate([c[2] for c in candidates])
+        if not len(cost):
+            return []
+
+        flat_source = source.ravel()
+        owner_a = flat_source[tile_a]
+        owner_b = flat_source[tile_b]
+        pair = np.minimum(owner_a, owner_b) * (flat_source.max() + 1) + np.maximum(owner_a, owner_b)
+        order = np.lexsort((cost, pair))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = pair[order][1:] != pair[order][:-1]
+        best = order[first]
+        return sorted(zip(
+            cost[best].tolist(), tile_a[best].tolist(), tile_b[best].tolist(),
+            owner_a[best].tolist(), owner_b[best].tolist(),
+        ))
+
+    @staticmethod
+    def _minimum_spanning_tree(edges, count):
+        """Kruskal over region edges; returns the (tile_a, tile_b) bridges to pave."""
+        roots = list(range(count))
+
+        def find(owner):
+            while roots[owner] != owner:
+                roots[owner] = roots[roots[owner]]
+                owner = roots[owner]
+            return owner
+
+        tree = []
+        for _, tile_a, tile_b, owner_a, owner_b in edges:
+            root_a, root_b = find(owner_a), find(owner_b)
+            if root_a != root_b:
+                roots[root_a] = root_b
+                tree.append((tile_a, tile_b))
+        return tree
+
+    def _pave(self, tree, parent):
+        """Mark every bridge and its parent chains back to both key points as road."""
+        paved = set()
+        for bridge in tree:
+            for index in bridge:
+                while index != -1 and index not in paved:  # Shared trunks are walked once
+                    paved.add(index)
+                    index = parent[index]
+        rows, cols = np.divmod(np.fromiter(paved, dtype=np.int64, count=len(paved)), self.grid_map.width)
+        self.grid_map.terrain[rows, cols] = TERRAIN_CODES['road']
+        return len(paved)
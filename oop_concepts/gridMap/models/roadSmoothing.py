@@ -0,0 +1,119 @@
+import numpy as np  # Install with pip install numpy
+from .tile import TERRAIN_CODES
+
+PAD = 2  # Border of non-road tiles around the padded arrays, so lookups two tiles out need no bounds checks
+
+
+def neighbour_count(mask):
+    """Return the number of 4-connected neighbours inside mask for every tile, as a uint8 array."""
+    padded = np.pad(mask, 1).astype(np.uint8)
+    return padded[:-2, 1:-1] + padded[2:, 1:-1] + padded[1:-1, :-2] + padded[1:-1, 2:]
+
+
+def prune_spurs(road, protected):
+    """Remove road tiles with at most one road neighbour, repeatedly, until none are left.
+
+    road is a bool (height, width) array changed in place; protected tiles are never
+    removed. A tile with one neighbour lies on no route between two other tiles, so
+    pruning never disconnects protected tiles. After the first full pass only the
+    neighbours of removed tiles are re-examined. Returns the number of tiles removed.
+    """
+    height, width = road.shape
+    flat, keep = road.ravel(), protected.ravel()
+    count = neighbour_count(road).ravel().astype(np.int16)
+    candidates = np.flatnonzero(flat & (count <= 1) & ~keep)
+    removed = 0
+    while candidates.size:
+        flat[candidates] = False
+        removed += candidates.size
+        rows, cols = np.divmod(candidates, width)
+        neighbours = np.concatenate([
+            candidates[rows > 0] - width, candidates[rows < height - 1] + width,
+            candidates[cols > 0] - 1, candidates[cols < width - 1] + 1,
+        ])
+        np.subtract.at(count, neighbours, 1)
+        neighbours = np.unique(neighbours)
+        candidates = neighbours[flat[neighbours] & (count[neighbours] <= 1) & ~keep[neighbours]]
+    return removed
+
+
+def straighten_corners(road, buildable, protected):
+    """Flip staircase corners onto the opposite diagonal wherever that removes turns.
+
+    An L-corner B joining neighbours A and C moves to the tile E that also touches
+    both, so the road keeps its length and stays connected. A flip is made only when
+    it leaves fewer turns at A and C, so repeating until nothing changes terminates.
+    Tiles are processed in 16 interleaved subfields (x % 4, y % 4): flips in one
+    subfield read and write disjoint tiles and can be applied at once.
+
+    road is changed in place. E must be buildable and not yet road, and protected
+    tiles are never moved. Returns (flips, sweeps).
+    """
+    height, width = road.shape
+    pitch = width + 2 * PAD
+    padded = np.zeros((height + 2 * PAD, pitch), dtype=bool)
+    padded[PAD:-PAD, PAD:-PAD] = road
+    can_build = np.zeros_like(padded)
+    can_build[PAD:-PAD, PAD:-PAD] = buildable
+    locked = np.zeros_like(padded)
+    locked[PAD:-PAD, PAD:-PAD] = protected
+    r, can_build, locked = padded.ravel(), can_build.ravel(), locked.ravel()
+
+    subfield = (np.arange(r.size) // pitch % 4) * 4 + np.arange(r.size) % pitch % 4
+    window = (np.arange(-PAD, PAD + 1)[:, None] * pitch + np.arange(-PAD, PAD + 1)[None, :]).ravel()
+    active = np.flatnonzero(r)
+    flips = sweeps = 0
+    while active.size:
+        sweeps += 1
+        moved = []
+        for group in range(16):
+            b = active[subfield[active] == group]
+            b = b[r[b] & ~locked[b]]
+            left, right, up, down = r[b - 1], r[b + 1], r[b - pitch], r[b + pitch]
+            corner = (left ^ right) & (up ^ down)
+            b, right, down = b[corner], right[corner], down[corner]
+            sx = np.where(right, 1, -1)
+            sy = np.where(down, pitch, -pitch)
+            a, c, e = b + sx, b + sy, b + sx + sy
+
+            def degree(tiles):
+                return r[tiles - 1].astype(np.int8) + r[tiles + 1] + r[tiles - pitch] + r[tiles + pitch]
+
+            turns = (r[a + sx].astype(np.int8) - r[a - sy]) + (r[c + sy].astype(np.int8) - r[c - sx])
+            flip = (can_build[e] & ~r[e] & ~r[e + sx] & ~r[e + sy]
+                    & (degree(a) == 2) & (degree(c) == 2) & (turns < 0))
+            b, e = b[flip], e[flip]
+            r[b] = False
+            r[e] = True
+            moved.append(b)
+            moved.append(e)
+        moved = np.concatenate(moved)
+        flips += moved.size // 2
+        active = np.unique((moved[:, None] + window[None, :]).ravel())
+        active = active[r[active]]
+
+    road[:] = padded[PAD:-PAD, PAD:-PAD]
+    return flips, sweeps
+
+
+def smooth_roads(grid_map, key_points, straighten=False):
+    """Prune dead-end spurs from the map's roads and optionally straighten zig-zags.
+
+    Key points are never removed or moved, so routes between them stay connected.
+    Removed road tiles become grass. Returns {'pruned', 'straightened', 'sweeps'}.
+    """
+    road_code, grass_code = TERRAIN_CODES['road'], TERRAIN_CODES['grass']
+    before = grid_map.terrain == road_code
+    road = before.copy()
+    protected = np.zeros_like(road)
+    for x, y in key_points:
+        protected[y, x] = True
+
+    pruned = prune_spurs(road, protected)
+    flips = sweeps = 0
+    if straighten:
+        flips, sweeps = straighten_corners(road, grid_map.terrain == grass_code, protected)
+
+    grid_map.terrain[before & ~road] = grass_code
+    grid_map.terrain[road & ~before] = road_code
+    return {'pruned': pruned, 'straightened': flips, 'sweeps': sweeps}
@@ -0,0 +1,10 @@
+import hashlib
+
+
+def derive_seed(seed, *components):
+    """Derive a stable 32-bit seed from a base seed and any labels, e.g. a stage name and chunk coordinates.
+
+    Uses a hash rather than ``hash()`` so results match across processes and runs.
+    """
+    key = repr((seed,) + components).encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=4).digest(), 'little')
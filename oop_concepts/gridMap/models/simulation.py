@@ -0,0 +1,151 @@
+import math
+import random
+import time
+import tracemalloc
+import numpy as np  # Install with pip install numpy
+from .instrumentation import Metrics
+from .mapGenerator import generate_map
+from .movementRange import MovementRange
+from .player import Player
+from .seeding import derive_seed
+from .tile import BLOCKING_TERRAIN, TERRAIN_CODES
+from .turnManager import TurnManager
+from .unit import Unit
+
+POLICIES = ('random', 'advance')
+SIGHT_RADIUS = 12  # How far 'advance' units look for enemies
+
+
+class Simulation:
+    """Headless game loop: generate a map, spawn units for each player and play turns.
+
+    Every unit action is one turn, scheduled by a time-mode TurnManager. With the
+    'random' policy units move to a random reachable tile; with 'advance' they close
+    in on the nearest visible enemy, or on the map centre when none is in sight.
+    Stage timings, including the generation stages, are collected in ``metrics``.
+    """
+
+    def __init__(self, width, height, config, players=2, units_per_player=10, policy='advance', seed=0,
+                 workers=1):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy '{policy}'.")
+        self.width = width
+        self.height = height
+        self.config = config
+        self.player_count = players
+        self.units_per_player = units_per_player
+        self.policy = policy
+        self.seed = seed
+        self.workers = workers
+        self.rng = random.Random(derive_seed(seed, 'simulation'))
+        self.metrics = Metrics()
+        self.grid_map = None
+        self.players = []
+        self.owner = {}  # Unit -> Player
+        self.scheduler = None
+        self.ranges = None
+        self.turns = 0
+
+    def setup(self):
+        """Generate the map and spawn every player's units."""
+        with self._stage('generate'):
+            self.grid_map = generate_map(self.width, self.height, self.config, seed=self.seed, workers=self.workers,
+                                         metrics=self.metrics)
+        with self._stage('spawn'):
+            self._spawn_units()
+            self.scheduler = TurnManager(mode='time')
+            for player in self.players:
+                for unit in player.units:
+                    self.scheduler.add_unit(unit)
+            self.ranges = MovementRange(self.grid_map)
+
+    def run(self, turns):
+        """Play the given number of unit turns."""
+        for _ in range(turns):
+            with self._stage('schedule'):
+                unit = self.scheduler.next_turn()
+            if unit is None:
+                break
+            with self._stage('range'):
+                area = self.ranges.reachable(*self.grid_map.position_of(unit), unit.speed)
+            with self._stage('policy'):
+                destination = self._choose_destination(unit, area)
+            with self._stage('move'):
+                self.grid_map.move_unit(unit, *destination)
+            self.turns += 1
+
+    def _spawn_units(self):
+        """Place each player's units on the free walkable tiles closest to their anchor point."""
+        free = ~np.isin(self.grid_map.terrain, [TERRAIN_CODES[terrain] for terrain in BLOCKING_TERRAIN])
+        ys, xs = np.nonzero(free)
+        for index in range(self.player_count):
+            player = Player(f"Player {index + 1}")
+            anchor_x, anchor_y = self._anchor(index)
+            order = np.argsort((xs - anchor_x) ** 2 + (ys - anchor_y) ** 2, kind='stable')
+            for tile in order:
+                if len(player.units) == self.units_per_player:
+                    break
+                x, y = int(xs[tile]), int(ys[tile])
+                if self.grid_map.unit_at(x, y) is None:
+                    unit = Unit(f"{player.name} unit {len(player.units) + 1}", self.rng.randint(3, 8))
+                    self.grid_map.place_unit(x, y, unit)
+                    player.add_unit(unit)
+                    self.owner[unit] = player
+            self.players.append(player)
+
+    def _anchor(self, index):
+        """Spawn point of a player, spread evenly on a circle around the map centre, starting top-left."""
+        angle = math.pi * 1.25 + 2 * math.pi * index / self.player_count
+        radius = 0.4 * (min(self.width, self.height) - 1)
+        return ((self.width - 1) / 2 + radius * math.cos(angle) * math.sqrt(2),
+                (self.height - 1) / 2 + radius * math.sin(angle) * math.sqrt(2))
+
+    def _choose_destination(self, unit, area):
+        rows, cols = np.nonzero(area.mask)
+        if self.policy == 'random':
+            tile = self.rng.randrange(len(rows))
+            return int(cols[tile]) + area.x0, int(rows[tile]) + area.y0
+
+        x, y = self.grid_map.position_of(unit)
+        enemies = [
+            position for position, other in self.grid_map.units_in_radius(x, y, SIGHT_RADIUS).items()
+            if self.owner[other] is not self.owner[unit]
+        ]
+        if enemies:
+            target_x, target_y = min(enemies, key=lambda position: abs(position[0] - x) + abs(position[1] - y))
+        else:
+            target_x, target_y = self.width // 2, self.height // 2
+        distance = np.abs(cols + area.x0 - target_x) + np.abs(rows + area.y0 - target_y)
+        tile = int(np.argmin(distance))
+        return int(cols[tile]) + area.x0, int(rows[tile]) + area.y0
+
+    def _stage(self, name):
+        return self.metrics.stage(name)
+
+
+def run_simulation(width, height, config, players=2, units_per_player=10, turns=1000, policy='advance', seed=0,
+                   workers=1, trace_memory=True):
+    """Run a headless simulation and return a report of its throughput, stage timings, counters and memory peak.
+
+    tracemalloc slows allocation-heavy code down, so pass trace_memory=False for
+    timing-only runs; peak_memory is then None.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    simulation = Simulation(width, height, config, players, units_per_player, policy, seed, workers)
+    try:
+        simulation.setup()
+        start = time.perf_counter()
+        simulation.run(turns)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return simulation.metrics.record(
+        seed=seed, width=width, height=height, policy=policy,
+        units=sum(len(player.units) for player in simulation.players),
+        turns=simulation.turns,
+        turns_per_second=simulation.turns / elapsed if elapsed > 0 else float('inf'),
+        peak_memory=peak,
+    )
@@ -0,0 +1,57 @@
+class SpatialHash:
+    """Buckets of occupied tile positions keyed by (x // cell_size, y // cell_size).
+
+    Range queries only visit the buckets that overlap the query area, so their cost
+    grows with the number of positions near it rather than with the map size.
+    """
+
+    def __init__(self, cell_size=16):
+        self.cell_size = cell_size
+        self.buckets = {}  # (cell x, cell y) -> set of (x, y)
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.buckets.values())
+
+    def insert(self, x, y):
+        self.buckets.setdefault((x // self.cell_size, y // self.cell_size), set()).add((x, y))
+
+    def remove(self, x, y):
+        cell = (x // self.cell_size, y // self.cell_size)
+        bucket = self.buckets[cell]
+        bucket.remove((x, y))
+        if not bucket:
+            del self.buckets[cell]
+
+    def query_rect(self, x0, y0, x1, y1):
+        """Return the positions with x0 <= x < x1 and y0 <= y < y1."""
+        if x1 <= x0 or y1 <= y0:
+            return []
+        size = self.cell_size
+        cx0, cy0, cx1, cy1 = x0 // size, y0 // size, (x1 - 1) // size, (y1 - 1) // size
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.buckets):
+            cells = [cell for cell in self.buckets if cx0 <= cell[0] <= cx1 and cy0 <= cell[1] <= cy1]
+        else:
+            cells = [(cx, cy) for cy in range(cy0, cy1 + 1) for cx in range(cx0, cx1 + 1) if (cx, cy) in self.buckets]
+        found = []
+        for cx, cy in cells:
+            bucket = self.buckets[(cx, cy)]
+            if x0 <= cx * size and (cx + 1) * size <= x1 and y0 <= cy * size and (cy + 1) * size <= y1:
+                found.extend(bucket)  # Bucket lies entirely inside the rectangle
+            else:
+                found.extend((x, y) for x, y in bucket if x0 <= x < x1 and y0 <= y < y1)
+        return found
+
+    def query_radius(self, x, y, radius, metric='euclidean'):
+        """Return the positions within radius of (x, y), inclusive.
+
+        metric is 'euclidean', 'manhattan' or 'chebyshev'.
+        """
+        candidates = self.query_rect(x - radius, y - radius, x + radius + 1, y + radius + 1)
+        if metric == 'chebyshev':
+            return candidates
+        if metric == 'manhattan':
+            return [(px, py) for px, py in candidates if abs(px - x) + abs(py - y) <= radius]
+        if metric == 'euclidean':
+            limit = radius * radius
+            return [(px, py) for px, py in candidates if (px - x) ** 2 + (py - y) ** 2 <= limit]
+        raise ValueError(f"Unknown metric '{metric}'.")
@@ -1,61 +1,99 @@
 import random
 import logging
-from noise import pnoise2
+from concurrent.futures import ProcessPoolExecutor
+from .clusterGrower import ClusterGrower
+from .gridMap import GridMap
+from .noiseField import edge_distance_field, perlin_field
+from .seeding import derive_seed
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
 
 class TerrainGenerator:
-    def __init__(self, grid_map, config):
+    def __init__(self, grid_map, config, seed=None, chunk_size=256, workers=1):
         self.grid_map = grid_map
         self.config = config
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.chunk_size = chunk_size
+        self.workers = workers  # Worker processes; 1 generates the same chunks in-process
+        self.stats = {'chunks': 0, 'tiles_written': 0}
 
     def generate_terrain(self):
-        logging.info("Starting terrain generation.")
+        logger.info("Starting terrain generation.")
+        stages = self._stages()
+        width, height = self.grid_map.width, self.grid_map.height
+        chunks = [
+            (x0, y0, min(x0 + self.chunk_size, width), min(y0 + self.chunk_size, height))
+            for y0 in range(0, height, self.chunk_size)
+            for x0 in range(0, width, self.chunk_size)
+        ]
+        tasks = [
+            ((x0, y0, x1, y1), self.grid_map.terrain[y0:y1, x0:x1].copy(), (height, width), stages, self.seed)
+            for x0, y0, x1, y1 in chunks
+        ]
+
+        if self.workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(self.workers) as pool:
+                results = list(pool.map(generate_chunk, tasks, chunksize=max(1, len(tasks) // (4 * self.workers))))
+        else:
+            results = [generate_chunk(task) for task in tasks]
+        for (x0, y0, x1, y1), (block, written) in zip(chunks, results):
+            self.grid_map.terrain[y0:y1, x0:x1] = block
+            self.stats['tiles_written'] += written
+        self.stats['chunks'] += len(chunks)
+        logger.info("Terrain generation completed.")
+
+    def _stages(self):
+        """Translate the terrain config into per-chunk stage settings, in config order."""
+        stages = []
         for terrain, settings in self.config.items():
             if terrain in ['grass', 'road']:
                 continue
-            logging.info(f"Generating terrain: {terrain}")
+            noise_seed = derive_seed(self.seed, terrain)  # Shared by all chunks so borders line up
+            logger.debug("Generating terrain: %s with seed=%d, threshold=%s, scale=%s.",
+                         terrain, noise_seed, settings['threshold'], settings['scale'])
             if terrain == 'mountain':
-                self._generate_edge_clusters(terrain, settings['threshold'], settings['scale'])
+                stages.append({'terrain': terrain, 'threshold': settings['threshold'], 'scale': settings['scale'],
+                               'noise_seed': noise_seed, 'edge_bias': True, 'cluster_size': (4, 12)})
             elif terrain == 'water':
-                self._generate_clustered_terrain(terrain, settings['threshold'], settings['scale'])
-        logging.info("Terrain generation completed.")
-
-    def _generate_clustered_terrain(self, terrain, threshold, scale):
-        """Generate terrain clusters using Perlin noise and flood-fill."""
-        seed = random.randint(0, 100)
-        logging.info(f"Applying Perlin noise for {terrain} with seed={seed}, threshold={threshold}, scale={scale}.")
-        for row in range(self.grid_map.height):
-            for col in range(self.grid_map.width):
-                noise_value = pnoise2(row / scale, col / scale, base=seed)
-                if noise_value > threshold:
-                    self._flood_fill(row, col, terrain, cluster_size=random.randint(5, 10))
-
-    def _generate_edge_clusters(self, terrain, threshold, scale):
-        """Generate mountains toward map edges."""
-        seed = random.randint(0, 100)
-        logging.info(f"Applying Perlin noise for {terrain} with seed={seed}, threshold={threshold}, scale={scale}.")
-        for row in range(self.grid_map.height):
-            for col in range(self.grid_map.width):
-                # Edge proximity score to encourage mountain placement near edges
-                edge_score = min(row, col, self.grid_map.height - row - 1, self.grid_map.width - col - 1)
-                max_distance = min(self.grid_map.height, self.grid_map.width) // 3  # Mountain bias
-                if edge_score <= max_distance:  # Favor edges
-                    noise_value = pnoise2(row / scale, col / scale, base=seed)
-                    if noise_value > threshold:
-                        self._flood_fill(row, col, terrain, cluster_size=random.randint(4, 12))
-
-
-    def _flood_fill(self, row, col, terrain, cluster_size):
-        """Flood-fill algorithm to grow terrain clusters."""
-        if cluster_size <= 0 or not (0 <= row < self.grid_map.height and 0 <= col < self.grid_map.width):
-            return
-        if self.grid_map.grid[row][col].terrain != 'grass':  # Only grow on default terrain
-            return
-
-        self.grid_map.grid[row][col].terrain = terrain
-        cluster_size -= 1
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        random.shuffle(directions)  # Randomize direction growth
-        for dx, dy in directions:
-            self._flood_fill(row + dx, col + dy, terrain, cluster_size)
+                stages.append({'terrain': terrain, 'threshold': settings['threshold'], 'scale': settings['scale'],
+                               'noise_seed': noise_seed, 'edge_bias': False, 'cluster_size': (5, 10)})
+        return stages
+
+
+def generate_chunk(task):
+    """Run every terrain stage on one chunk and return (terrain block, tiles written).
+
+    Module-level so it can run in a worker process. Noise is sampled in global map
+    coordinates and cluster growth is seeded from (map seed, terrain, chunk origin),
+    so a chunk's result does not depend on how many processes generate the map.
+    Clusters stay inside their chunk.
+    """
+    (x0, y0, x1, y1), block, (map_height, map_width), stages, seed = task
+    chunk_map = GridMap(x1 - x0, y1 - y0)
+    chunk_map.terrain[:] = block
+    written = 0
+    for stage in stages:
+        if stage['edge_bias']:
+            seeds = _edge_cluster_seeds(stage, chunk_map, x0, y0, map_height, map_width)
+        else:
+            seeds = _clustered_seeds(stage, chunk_map, x0, y0)
+        rng = random.Random(derive_seed(seed, stage['terrain'], x0, y0))
+        min_size, max_size = stage['cluster_size']
+        written += ClusterGrower(chunk_map, rng).grow(seeds, stage['terrain'], min_size, max_size)
+    return chunk_map.terrain, written
+
+
+def _clustered_seeds(stage, chunk_map, x0, y0):
+    """Cluster seeds where the Perlin noise exceeds the stage threshold."""
+    noise_values = perlin_field(chunk_map.height, chunk_map.width, stage['scale'], seed=stage['noise_seed'],
+                                row_offset=y0, col_offset=x0)
+    return noise_values > stage['threshold']
+
+
+def _edge_cluster_seeds(stage, chunk_map, x0, y0, map_height, map_width):
+    """Cluster seeds biased toward the map edges, for mountains."""
+    # Edge proximity score to encourage mountain placement near edges
+    edge_score = edge_distance_field(map_height, map_width, row_offset=y0, col_offset=x0,
+                                     rows=chunk_map.height, cols=chunk_map.width)
+    max_distance = min(map_height, map_width) // 3  # Mountain bias
+    return (edge_score <= max_distance) & _clustered_seeds(stage, chunk_map, x0, y0)  # Favor edges
@@ -1,3 +1,8 @@
+TERRAIN_TYPES = ('grass', 'water', 'mountain', 'road')  # Index is the terrain code
+TERRAIN_CODES = {terrain: code for code, terrain in enumerate(TERRAIN_TYPES)}
+BLOCKING_TERRAIN = ('water', 'mountain')
+
+
 class Tile:
     def __init__(self, terrain='grass', unit=None):
         self.terrain = terrain
@@ -5,4 +10,35 @@ class Tile:
 
     def is_walkable(self):
         """Check if the tile can be walked on."""
-        return self.terrain not in ['water', 'mountain'] and self.unit is None
\ No newline at end of file
+        return self.terrain not in BLOCKING_TERRAIN and self.unit is None
+
+
+class TileView:
+    """Tile-like view onto one cell of a GridMap's terrain array."""
+
+    __slots__ = ('grid_map', 'x', 'y')
+
+    def __init__(self, grid_map, x, y):
+        self.grid_map = grid_map
+        self.x = x
+        self.y = y
+
+    @property
+    def terrain(self):
+        return TERRAIN_TYPES[self.grid_map.terrain[self.y, self.x]]
+
+    @terrain.setter
+    def terrain(self, terrain):
+        self.grid_map.set_terrain(self.x, self.y, terrain)
+
+    @property
+    def unit(self):
+        return self.grid_map.units.get((self.x, self.y))
+
+    @unit.setter
+    def unit(self, unit):
+        self.grid_map.set_unit(self.x, self.y, unit)
+
+    def is_walkable(self):
+        """Check if the tile can be walked on."""
+        return self.terrain not in BLOCKING_TERRAIN and self.unit is None
@@ -1,16 +1,121 @@
-import heapq
+from itertools import count
+
+ACTION_THRESHOLD = 100  # Initiative a unit needs to act in time mode
+
 
 class TurnManager:
-    def __init__(self):
-        self.priority_queue = []
+    """Initiative scheduler backed by an indexed binary heap.
+
+    In 'speed' mode next_turn pops units fastest first, like a single round of turns.
+    In 'time' mode units accumulate initiative at their speed and act each time they
+    reach ACTION_THRESHOLD, so they stay queued and fast units act more often. Ties
+    go to the unit added first. Removing a unit or changing its speed is O(log n).
+    """
+
+    def __init__(self, mode='speed'):
+        if mode not in ('speed', 'time'):
+            raise ValueError(f"Unknown turn mode '{mode}'.")
+        self.mode = mode
+        self.time = 0.0  # Current time in time mode
+        self.priority_queue = []  # Heap of (key, sequence, unit)
+        self._positions = {}  # unit -> index in priority_queue
+        self._sequence = count()
+
+    def __len__(self):
+        return len(self.priority_queue)
+
+    def __contains__(self, unit):
+        return unit in self._positions
 
     def add_unit(self, unit):
         """Add a unit to the turn queue."""
-        heapq.heappush(self.priority_queue, (-unit.speed, unit))
+        if unit in self._positions:
+            raise ValueError(f"{unit.name} is already in the turn queue.")
+        self.priority_queue.append((self._key(unit.speed, self.time), next(self._sequence), unit))
+        self._positions[unit] = len(self.priority_queue) - 1
+        self._sift_up(len(self.priority_queue) - 1)
+
+    def remove_unit(self, unit):
+        """Remove a unit, e.g. when it dies."""
+        index = self._positions.pop(unit)
+        last = self.priority_queue.pop()
+        if index < len(self.priority_queue):
+            self.priority_queue[index] = last
+            self._positions[last[2]] = index
+            self._sift_down(self._sift_up(index))
+
+    def update_speed(self, unit, speed):
+        """Change a unit's speed and move it to its new place in the queue.
+
+        In time mode the unit keeps the share of initiative it has already built up.
+        """
+        index = self._positions[unit]
+        key, sequence, _ = self.priority_queue[index]
+        if self.mode == 'time' and unit.speed > 0 and speed > 0:
+            key = self.time + (key - self.time) * unit.speed / speed
+        else:
+            key = self._key(speed, self.time)
+        unit.speed = speed
+        self.priority_queue[index] = (key, sequence, unit)
+        self._sift_down(self._sift_up(index))
+
+    def peek(self):
+        """Return the unit that acts next without taking its turn."""
+        return self.priority_queue[0][2] if self.priority_queue else None
 
     def next_turn(self):
-        """Pop the next unit based on the highest speed."""
-        if self.priority_queue:
-            _, unit = heapq.heappop(self.priority_queue)
+        """Return the next unit to act, or None when the queue is empty.
+
+        In speed mode the unit is removed; in time mode the clock advances to its
+        turn and it is rescheduled for its next one.
+        """
+        if not self.priority_queue:
+            return None
+        key, _, unit = self.priority_queue[0]
+        if self.mode == 'speed':
+            self.remove_unit(unit)
             return unit
-        return None
+        if key == float('inf'):
+            return None  # No unit can ever act
+        self.time = key
+        self.priority_queue[0] = (self._key(unit.speed, key), next(self._sequence), unit)
+        self._sift_down(0)
+        return unit
+
+    def _key(self, speed, now):
+        if self.mode == 'speed':
+            return -speed
+        return now + ACTION_THRESHOLD / speed if speed > 0 else float('inf')
+
+    def _sift_up(self, index):
+        heap, positions = self.priority_queue, self._positions
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if heap[parent] <= entry:
+                break
+            heap[index] = heap[parent]
+            positions[heap[index][2]] = index
+            index = parent
+        heap[index] = entry
+        positions[entry[2]] = index
+        return index
+
+    def _sift_down(self, index):
+        heap, positions = self.priority_queue, self._positions
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[index] = heap[child]
+            positions[heap[index][2]] = index
+            index = child
+        heap[index] = entry
+        positions[entry[2]] = index
+        return index
@@ -0,0 +1,78 @@
+from .astar import astar_search
+from .pathfinder import MOVEMENT_COSTS
+from .tile import BLOCKING_TERRAIN
+
+INF = float('inf')
+
+
+class UnitPathfinder:
+    """Find walkable paths for unit movement and cache them by (start, goal).
+
+    Water, mountains and tiles occupied by other units are impassable. The finder
+    listens to the GridMap, and a cached path is dropped only when a tile along it
+    (other than its start) changes terrain or occupancy.
+    """
+
+    def __init__(self, grid_map, movement_costs=None):
+        self.grid_map = grid_map
+        self.movement_costs = {
+            terrain: cost for terrain, cost in (movement_costs or MOVEMENT_COSTS).items()
+            if terrain not in BLOCKING_TERRAIN
+        }
+        self.min_cost = min(self.movement_costs.values())
+        self.stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+        self._cache = {}  # (start, goal) -> tuple of (x, y)
+        self._paths_through = {}  # (x, y) -> set of cache keys whose path uses that tile
+        self.refresh()
+        grid_map.add_listener(self._on_tile_changed)
+
+    def refresh(self):
+        """Rebuild the cost list from the map and clear the cache, e.g. after bulk terrain edits."""
+        costs = self.grid_map.cost_grid(self.movement_costs)
+        for x, y in self.grid_map.units:
+            costs[y, x] = INF
+        self._costs = costs.ravel().tolist()
+        self._cache.clear()
+        self._paths_through.clear()
+
+    def close(self):
+        """Detach from the GridMap."""
+        self.grid_map.remove_listener(self._on_tile_changed)
+
+    def find_path(self, start, goal):
+        """Return the cheapest walkable path from start to goal as a tuple of (x, y), or None."""
+        key = (start, goal)
+        path = self._cache.get(key)
+        if path is not None:
+            self.stats['hits'] += 1
+            return path
+
+        self.stats['misses'] += 1
+        path, _ = astar_search(self._costs, self.grid_map.width, self.grid_map.height, start, goal, self.min_cost)
+        if path is None:
+            return None  # Failures are not cached since no tile on them can invalidate the entry
+        path = tuple(path)
+        self._cache[key] = path
+        for tile in path[1:]:
+            self._paths_through.setdefault(tile, set()).add(key)
+        return path
+
+    def _on_tile_changed(self, x, y, kind):
+        """Update the tile's cost and drop every cached path that crosses it."""
+        if (x, y) in self.grid_map.units:
+            cost = INF
+        else:
+            cost = self.movement_costs.get(self.grid_map.get_terrain(x, y), INF)
+        self._costs[y * self.grid_map.width + x] = cost
+
+        for key in self._paths_through.pop((x, y), ()):
+            path = self._cache.pop(key, None)
+            if path is None:
+                continue
+            self.stats['invalidations'] += 1
+            for tile in path[1:]:
+                keys = self._paths_through.get(tile)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._paths_through[tile]
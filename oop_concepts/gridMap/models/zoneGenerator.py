@@ -1,27 +1,33 @@
 import logging
+from .tile import TERRAIN_CODES
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
 
 class ZoneAllocator:
-    def __init__(self, grid_map):
+    def __init__(self, grid_map, margin=2, zone_size=3):
         self.grid_map = grid_map
+        self.margin = margin
+        self.zone_size = zone_size
 
-    def reserve_player_zones(self):
-        logging.info("Reserving player zones.")
-        margin = 2
-        player_zone_size = 3
-        zones = [
-            (margin, margin),  # Top-left corner
-            (self.grid_map.width - margin - player_zone_size, margin),  # Top-right
-            (margin, self.grid_map.height - margin - player_zone_size),  # Bottom-left
-            (self.grid_map.width - margin - player_zone_size, self.grid_map.height - margin - player_zone_size),  # Bottom-right
+    def zones(self):
+        """Return the player zones as (x_start, y_start, x_stop, y_stop) rectangles clipped to the map."""
+        width, height = self.grid_map.width, self.grid_map.height
+        far_x = width - self.margin - self.zone_size
+        far_y = height - self.margin - self.zone_size
+        corners = [
+            (self.margin, self.margin),  # Top-left corner
+            (far_x, self.margin),  # Top-right
+            (self.margin, far_y),  # Bottom-left
+            (far_x, far_y),  # Bottom-right
+        ]
+        return [
+            (max(x, 0), max(y, 0), min(x + self.zone_size, width), min(y + self.zone_size, height))
+            for x, y in corners
         ]
 
-        for i, zone in enumerate(zones):
-            logging.info(f"Reserving zone {i + 1} at {zone}.")
-            x_start, y_start = zone
-            for y in range(y_start, y_start + player_zone_size):
-                for x in range(x_start, x_start + player_zone_size):
-                    if 0 <= x < self.grid_map.width and 0 <= y < self.grid_map.height:
-                        self.grid_map.grid[y][x].terrain = 'grass'
-        logging.info("Player zones reserved.")
+    def reserve_player_zones(self):
+        logger.info("Reserving player zones.")
+        for i, (x_start, y_start, x_stop, y_stop) in enumerate(self.zones()):
+            logger.debug("Reserving zone %d at (%d, %d).", i + 1, x_start, y_start)
+            self.grid_map.terrain[y_start:y_stop, x_start:x_stop] = TERRAIN_CODES['grass']
+        logger.info("Player zones reserved.")
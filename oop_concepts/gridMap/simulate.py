@@ -0,0 +1,35 @@
+import argparse
+import json
+from main import TERRAIN_CONFIG
+from models.simulation import POLICIES, run_simulation
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game loop without a display and report its throughput.")
+    parser.add_argument('--size', type=int, default=128, help="Map width and height in tiles")
+    parser.add_argument('--players', type=int, default=2)
+    parser.add_argument('--units', type=int, default=50, help="Units per player")
+    parser.add_argument('--turns', type=int, default=5000, help="Unit turns to play")
+    parser.add_argument('--policy', choices=POLICIES, default='advance')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=1, help="Processes for terrain generation")
+    parser.add_argument('--no-memory', action='store_true', help="Skip tracemalloc for timing-only runs")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run_simulation(args.size, args.size, TERRAIN_CONFIG, args.players, args.units, args.turns, args.policy,
+                            args.seed, args.workers, trace_memory=not args.no_memory)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{report['turns']} turns of {report['units']} units on {args.size}x{args.size} (seed={args.seed}, "
+          f"policy={args.policy}): {report['turns_per_second']:.0f} turns/sec")
+    for stage, seconds in report['timings'].items():
+        print(f"  {stage:<10} {seconds * 1000:10.1f} ms")
+    if report['peak_memory'] is not None:
+        print(f"Peak memory: {report['peak_memory'] / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
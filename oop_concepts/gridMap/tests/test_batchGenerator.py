@@ -0,0 +1,99 @@
+"""
+Unit Tests for Batch Map Generation
+===================================
+Tests map files, manifest records and resuming of the batch generator.
+"""
+
+import copy
+import json
+import os
+import tempfile
+import unittest
+import numpy as np  # Install with pip install numpy
+from main import TERRAIN_CONFIG
+from models.batchGenerator import MANIFEST, generate_batch, map_filename, read_manifest
+from models.mapCache import MapCache
+from models.mapFile import load_map
+from models.mapGenerator import GENERATOR_VERSION, generate_map
+
+
+class TestBatchGenerator(unittest.TestCase):
+    """Unit tests for generate_batch and the manifest."""
+
+    def setUp(self):
+        """Create a temporary output directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.temp_dir.name
+        self.manifest = os.path.join(self.directory, MANIFEST)
+
+    def tearDown(self):
+        """Remove the output directory."""
+        self.temp_dir.cleanup()
+
+    def _batch(self, seeds=range(3), workers=1, config=TERRAIN_CONFIG):
+        """Generate square 20 and 24x16 maps for the given seeds."""
+        return generate_batch(self.directory, [(20, 20), (24, 16)], seeds, {'default': config}, workers)
+
+    def _filename(self, width, height, seed):
+        """Return the file name of a default-config map."""
+        return map_filename('default', MapCache.key(width, height, TERRAIN_CONFIG, seed), width, height, seed)
+
+    def test_maps_and_records(self):
+        """Test that every map is stored as generated and described in the manifest."""
+        self.assertEqual(self._batch(), {'generated': 6, 'recovered': 0, 'skipped': 0})
+        records = read_manifest(self.manifest)
+        self.assertEqual(len(records), 6)
+        record = records[self._filename(24, 16, 2)]
+        self.assertEqual((record['width'], record['height'], record['seed']), (24, 16, 2))
+        self.assertEqual(record['version'], GENERATOR_VERSION)
+        self.assertEqual(sum(record['terrain'].values()), 24 * 16)
+        self.assertTrue(record['connected'])
+        self.assertGreater(record['seconds'], 0)
+        self.assertIn('roads', record['timings'])
+        stored = load_map(os.path.join(self.directory, record['file']))
+        np.testing.assert_array_equal(stored.terrain, generate_map(24, 16, TERRAIN_CONFIG, seed=2).terrain)
+        self.assertFalse([name for name in os.listdir(self.directory) if name.endswith('.tmp')])
+
+    def test_resume_skips_finished_maps(self):
+        """Test that a second batch over a wider seed range only generates the new seeds."""
+        self._batch(range(2))
+        self.assertEqual(self._batch(range(3)), {'generated': 2, 'recovered': 0, 'skipped': 4})
+        with open(self.manifest) as file:
+            self.assertEqual(len(file.readlines()), 6)
+
+    def test_changed_config_is_regenerated(self):
+        """Test that editing a preset under the same name regenerates its maps instead of skipping them."""
+        self._batch(range(1))
+        config = copy.deepcopy(TERRAIN_CONFIG)
+        config['water']['threshold'] = -1.0
+        self.assertEqual(self._batch(range(1), config=config), {'generated': 2, 'recovered': 0, 'skipped': 0})
+        keys = {record['key'] for record in read_manifest(self.manifest).values()}
+        self.assertIn(MapCache.key(24, 16, config, 0), keys)
+        self.assertEqual(self._batch(range(1), config=config)['skipped'], 2)
+
+    def test_resume_after_interruption(self):
+        """Test that a truncated manifest line is ignored and a map without a record is recovered from disk."""
+        self._batch(range(2))
+        with open(self.manifest) as file:
+            lines = file.readlines()
+        with open(self.manifest, 'w') as file:
+            file.writelines(lines[:-1])
+            file.write(lines[-1][:20])  # Cut short mid-write
+        os.remove(os.path.join(self.directory, self._filename(20, 20, 0)))
+        summary = self._batch(range(2))
+        self.assertEqual(summary, {'generated': 1, 'recovered': 1, 'skipped': 2})
+        records = read_manifest(self.manifest)
+        self.assertEqual(len(records), 4)
+        self.assertIsNone(records[json.loads(lines[-1])['file']]['seconds'])
+
+    def test_process_pool_matches_in_process(self):
+        """Test that worker processes store the same maps as an in-process batch."""
+        self._batch(range(2), workers=2)
+        for record in read_manifest(self.manifest).values():
+            stored = load_map(os.path.join(self.directory, record['file']))
+            expected = generate_map(record['width'], record['height'], TERRAIN_CONFIG, seed=record['seed'])
+            np.testing.assert_array_equal(stored.terrain, expected.terrain)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Unit Tests for the Pipeline Benchmarks
+======================================
+Tests benchmark records and the comparison against a baseline.
+"""
+
+import unittest
+from benchmarks.pipeline import STAGES, bench, compare
+
+
+class TestPipelineBenchmarks(unittest.TestCase):
+    """Unit tests for bench and compare."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Benchmark every stage once on the smallest map."""
+        cls.results = [bench(stage, 15, repeats=1) for stage in STAGES]
+
+    def test_records(self):
+        """Test that every stage reports time, memory, checksum and road expansions."""
+        for record in self.results:
+            self.assertEqual(record['size'], 15)
+            self.assertGreaterEqual(record['seconds'], 0)
+            self.assertGreater(record['peak_memory'], 0)
+            self.assertEqual(len(record['checksum']), 16)
+        roads = next(record for record in self.results if record['stage'] == 'roads')
+        self.assertGreater(roads['expanded'], 0)
+
+    def test_fixed_seeds_are_reproducible(self):
+        """Test that a second run matches its own baseline in output and expansions."""
+        again = [bench(stage, 15, repeats=1) for stage in STAGES]
+        for first, second in zip(self.results, again):
+            self.assertEqual(first['checksum'], second['checksum'])
+            self.assertEqual(first['expanded'], second['expanded'])
+
+    def test_compare_flags_regressions(self):
+        """Test that slowdowns, memory growth, extra expansions and changed output are reported."""
+        baseline = {'results': [
+            {'stage': 'roads', 'size': 64, 'seconds': 0.5, 'peak_memory': 1000, 'expanded': 100, 'checksum': 'a'},
+        ]}
+        same = [dict(baseline['results'][0], seconds=0.55)]
+        self.assertEqual(compare(same, baseline), [])
+        worse = [dict(baseline['results'][0], seconds=1.0, peak_memory=2000, expanded=150, checksum='b')]
+        self.assertEqual(len(compare(worse, baseline)), 4)
+        noise = [dict(baseline['results'][0], seconds=0.001)]
+        self.assertEqual(compare(noise, {'results': [dict(noise[0], seconds=0.0005)]}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
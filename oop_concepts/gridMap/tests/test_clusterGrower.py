@@ -0,0 +1,69 @@
+"""
+Unit Tests for ClusterGrower Class
+==================================
+Tests budgeted, seeded cluster growth on a GridMap.
+"""
+
+import random
+import unittest
+import numpy as np
+from models.clusterGrower import ClusterGrower
+from models.gridMap import GridMap
+from models.tile import TERRAIN_CODES
+
+
+class TestClusterGrower(unittest.TestCase):
+    """Unit tests for ClusterGrower functionality."""
+
+    def setUp(self):
+        """Initialize an all-grass map before each test."""
+        self.grid_map = GridMap(50, 40)
+
+    def _seed_mask(self, *cells):
+        mask = np.zeros((self.grid_map.height, self.grid_map.width), dtype=bool)
+        for row, col in cells:
+            mask[row, col] = True
+        return mask
+
+    def test_budget_is_respected(self):
+        """Test that a single seed writes exactly its budget on open grass."""
+        grower = ClusterGrower(self.grid_map, random.Random(1))
+        written = grower.grow(self._seed_mask((20, 25)), 'water', 7, 7)
+        self.assertEqual(written, 7)
+        self.assertEqual(int((self.grid_map.terrain == TERRAIN_CODES['water']).sum()), 7)
+
+    def test_only_grows_on_grass(self):
+        """Test that clusters never overwrite other terrain."""
+        self.grid_map.terrain[:, 26:] = TERRAIN_CODES['mountain']
+        grower = ClusterGrower(self.grid_map, random.Random(2))
+        grower.grow(self._seed_mask((20, 25)), 'water', 30, 30)
+        self.assertTrue((self.grid_map.terrain[:, 26:] == TERRAIN_CODES['mountain']).all())
+
+    def test_many_seeds_are_connected_clusters(self):
+        """Test that each seed produces a cluster and totals stay within budgets."""
+        grower = ClusterGrower(self.grid_map, random.Random(3))
+        written = grower.grow(self._seed_mask((5, 5), (30, 40), (10, 40)), 'water', 4, 12)
+        self.assertGreaterEqual(written, 3 * 4)
+        self.assertLessEqual(written, 3 * 12)
+        for row, col in [(5, 5), (30, 40), (10, 40)]:
+            self.assertEqual(self.grid_map.terrain[row, col], TERRAIN_CODES['water'])
+
+    def test_large_budget_does_not_recurse(self):
+        """Test that huge clusters grow without hitting the recursion limit."""
+        grid_map = GridMap(300, 300)
+        mask = np.zeros((300, 300), dtype=bool)
+        mask[150, 150] = True
+        grower = ClusterGrower(grid_map, random.Random(4))
+        self.assertEqual(grower.grow(mask, 'water', 5000, 5000), 5000)
+
+    def test_seeded_growth_is_reproducible(self):
+        """Test that equal RNG seeds give equal clusters."""
+        other = GridMap(50, 40)
+        mask = self._seed_mask((12, 12), (25, 30))
+        ClusterGrower(self.grid_map, random.Random(9)).grow(mask, 'water', 4, 12)
+        ClusterGrower(other, random.Random(9)).grow(mask, 'water', 4, 12)
+        self.assertTrue(np.array_equal(self.grid_map.terrain, other.terrain))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Unit Tests for FieldOfView
+==========================
+Tests shadowcast visibility, caching and per-player fog of war.
+"""
+
+import unittest
+import numpy as np
+from models.fieldOfView import FieldOfView
+from models.gridMap import GridMap
+from models.player import Player
+from models.tile import TERRAIN_CODES
+from models.unit import Unit
+
+
+class TestFieldOfView(unittest.TestCase):
+    """Unit tests for the field-of-view engine."""
+
+    def setUp(self):
+        """Initialize an open map with a mountain wall east of (10, 10)."""
+        self.grid_map = GridMap(30, 25)
+        self.grid_map.terrain[6:15, 14] = TERRAIN_CODES['mountain']
+        self.fov = FieldOfView(self.grid_map)
+
+    def test_open_ground_sees_full_circle(self):
+        """Test that without walls every tile within the radius is visible."""
+        tiles = self.fov.visible_tiles(5, 18, 5)
+        expected = {(x, y) for x in range(30) for y in range(25) if (x - 5) ** 2 + (y - 18) ** 2 <= 25}
+        self.assertEqual({(index % 30, index // 30) for index in tiles}, expected)
+
+    def test_mountains_block_sight(self):
+        """Test that a wall is visible but hides what lies behind it."""
+        self.assertTrue(self.fov.can_see((10, 10), (14, 10), 8))
+        self.assertFalse(self.fov.can_see((10, 10), (16, 10), 8))
+        self.assertTrue(self.fov.can_see((10, 10), (10, 16), 8))
+        self.assertFalse(self.fov.can_see((10, 10), (10, 19), 8))  # Beyond the radius
+
+    def test_edges_are_clipped(self):
+        """Test that sight near the map corner stays on the map."""
+        tiles = self.fov.visible_tiles(0, 0, 6)
+        self.assertTrue((tiles >= 0).all() and (tiles < 30 * 25).all())
+        self.assertIn(0, tiles)
+
+    def test_cache_and_invalidation(self):
+        """Test that results are cached and only nearby opacity changes drop them."""
+        before = self.fov.visible_tiles(10, 10, 8)
+        self.assertIs(self.fov.visible_tiles(10, 10, 8), before)
+        self.fov.visible_tiles(25, 22, 2)
+        self.grid_map.set_terrain(20, 3, 'water')  # Does not block sight
+        self.grid_map.set_terrain(14, 10, 'grass')  # Opens a gap in the wall
+        self.assertEqual(self.fov.stats['invalidations'], 1)
+        after = self.fov.visible_tiles(10, 10, 8)
+        self.assertIn(10 * 30 + 16, after)
+        self.assertEqual(self.fov.stats, {'hits': 1, 'misses': 3, 'invalidations': 1})
+        self.assertTrue(np.array_equal(after, FieldOfView(self.grid_map).visible_tiles(10, 10, 8)))
+
+    def test_lru_eviction(self):
+        """Test that the cache never grows beyond cache_size."""
+        fov = FieldOfView(self.grid_map, cache_size=3)
+        for x in range(6):
+            fov.visible_tiles(x, 0, 3)
+        self.assertEqual(len(fov._cache), 3)
+
+    def test_fog_of_war_per_player(self):
+        """Test that each player's bitmap is the union of their units' views."""
+        red, blue = Player("Red"), Player("Blue")
+        scouts = [Unit("Scout", 4), Unit("Rider", 6)]
+        for unit, position in zip(scouts, [(2, 2), (27, 22)]):
+            red.add_unit(unit)
+            self.grid_map.place_unit(*position, unit)
+        blue.add_unit(Unit("Reserve", 3))  # Not on the map
+        fog = self.fov.fog_of_war([red, blue], 4)
+        self.assertEqual(fog['Red'].shape, (25, 30))
+        self.assertTrue(fog['Red'][2, 2] and fog['Red'][22, 27])
+        self.assertFalse(fog['Red'][12, 15])
+        union = set(self.fov.visible_tiles(2, 2, 4)) | set(self.fov.visible_tiles(27, 22, 4))
+        self.assertEqual(set(np.flatnonzero(fog['Red'])), union)
+        self.assertFalse(fog['Blue'].any())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Unit Tests for FlowField and FlowFieldCache
+===========================================
+Tests shared-goal flow fields and their incremental repair on terrain edits.
+"""
+
+import random
+import unittest
+from models.flowField import FlowField, FlowFieldCache
+from models.gridMap import GridMap
+from models.tile import TERRAIN_CODES, TERRAIN_TYPES
+
+
+class TestFlowField(unittest.TestCase):
+    """Unit tests for flow field computation and caching."""
+
+    def setUp(self):
+        """Initialize a map with a water wall that has one gap."""
+        self.grid_map = GridMap(20, 15)
+        self.grid_map.terrain[:, 10] = TERRAIN_CODES['water']
+        self.grid_map.terrain[7, 10] = TERRAIN_CODES['road']
+        self.cache = FlowFieldCache(self.grid_map)
+        self.target = (18, 2)
+
+    def _walk(self, field, start):
+        """Follow next_step from start and return the visited tiles."""
+        path = [start]
+        while path[-1] != field.target:
+            step = field.next_step(*path[-1])
+            self.assertIsNotNone(step)
+            path.append(step)
+        return path
+
+    def test_units_follow_field_to_target(self):
+        """Test that following the field from any side reaches the target."""
+        field = self.cache.get(self.target)
+        for start in [(0, 0), (0, 14), (19, 14)]:
+            path = self._walk(field, start)
+            if start[0] < 10:
+                self.assertIn((10, 7), path)
+        self.assertIsNone(field.next_step(*self.target))
+        self.assertEqual(field.cost_to_target(*self.target), 0)
+
+    def test_blocked_tiles_are_unreachable(self):
+        """Test that impassable tiles have no step and infinite cost."""
+        field = self.cache.get(self.target)
+        self.assertIsNone(field.next_step(10, 0))
+        self.assertEqual(field.cost_to_target(10, 0), float('inf'))
+        self.assertEqual(field.direction_field()[0, 10], -1)
+
+    def test_field_is_cached_per_target(self):
+        """Test that the same target returns the same field object."""
+        self.assertIs(self.cache.get(self.target), self.cache.get(self.target))
+        self.assertIsNot(self.cache.get(self.target), self.cache.get((0, 0)))
+
+    def test_incremental_update_matches_full_recompute(self):
+        """Test that repairing after random edits matches a fresh field."""
+        rng = random.Random(7)
+        field = self.cache.get(self.target)
+        for _ in range(6):
+            for _ in range(8):
+                x, y = rng.randrange(20), rng.randrange(15)
+                self.grid_map.set_terrain(x, y, rng.choice(TERRAIN_TYPES))
+            repaired = self.cache.get(self.target)
+            self.assertIs(repaired, field)
+            fresh = FlowField(self.cache._costs, 20, 15, self.target)
+            self.assertEqual(repaired.integration, fresh.integration)
+
+    def test_target_edit_rebuilds_field(self):
+        """Test that flooding the target cuts every route and paving it lowers every cost."""
+        grid_map = GridMap(5, 1)
+        cache = FlowFieldCache(grid_map)
+        field = cache.get((4, 0))
+        grid_map.set_terrain(4, 0, 'water')
+        cache.get((4, 0))
+        self.assertEqual(field.integration, [float('inf')] * 4 + [0])
+        self.assertIsNone(field.next_step(0, 0))
+        grid_map.set_terrain(4, 0, 'road')
+        cache.get((4, 0))
+        self.assertEqual(field.integration, [3.5, 2.5, 1.5, 0.5, 0])
+        self.assertEqual(field.next_step(0, 0), (1, 0))
+
+    def test_incremental_update_touches_less_than_full(self):
+        """Test that a local edit expands fewer tiles than the initial build."""
+        field = self.cache.get(self.target)
+        initial = field.stats['expanded']
+        self.grid_map.set_terrain(2, 13, 'mountain')
+        self.cache.get(self.target)
+        self.assertLess(field.stats['expanded'] - initial, initial)
+
+
+if __name__ == "__main__":
+    unittest.main()
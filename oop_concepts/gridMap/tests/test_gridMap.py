@@ -0,0 +1,60 @@
+"""
+Unit Tests for GridMap Class
+============================
+Tests the array-backed terrain storage of GridMap and the Tile-like views
+returned by ``grid[y][x]``.
+"""
+
+import unittest
+import numpy as np
+from models.gridMap import GridMap
+from models.tile import TERRAIN_CODES
+from models.unit import Unit
+
+
+class TestGridMap(unittest.TestCase):
+    """Unit tests for GridMap storage and tile views."""
+
+    def setUp(self):
+        """Initialize a small grid map before each test."""
+        self.grid_map = GridMap(6, 4)
+
+    def test_terrain_array_shape(self):
+        """Test that terrain is stored as one uint8 array of grass."""
+        self.assertEqual(self.grid_map.terrain.shape, (4, 6))
+        self.assertEqual(self.grid_map.terrain.dtype, np.uint8)
+        self.assertTrue((self.grid_map.terrain == TERRAIN_CODES['grass']).all())
+
+    def test_tile_view_writes_through(self):
+        """Test that setting terrain on a view updates the array."""
+        self.grid_map.grid[2][5].terrain = 'water'
+        self.assertEqual(self.grid_map.terrain[2, 5], TERRAIN_CODES['water'])
+        self.assertEqual(self.grid_map.grid[2][5].terrain, 'water')
+        self.assertFalse(self.grid_map.grid[2][5].is_walkable())
+
+    def test_unknown_terrain(self):
+        """Test that unknown terrain names are rejected."""
+        with self.assertRaises(ValueError):
+            self.grid_map.set_terrain(0, 0, 'lava')
+
+    def test_units_are_sparse(self):
+        """Test that units are kept in a position map."""
+        unit = Unit("Knight", 5)
+        self.grid_map.grid[1][3].unit = unit
+        self.assertIs(self.grid_map.units[(3, 1)], unit)
+        self.assertFalse(self.grid_map.grid[1][3].is_walkable())
+        self.grid_map.grid[1][3].unit = None
+        self.assertEqual(self.grid_map.units, {})
+
+    def test_grid_iteration(self):
+        """Test that rows and tiles can still be iterated."""
+        rows = list(self.grid_map.grid)
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(len([tile for tile in rows[0]]), 6)
+        self.assertEqual(self.grid_map.grid[-1][-1].x, 5)
+        with self.assertRaises(IndexError):
+            self.grid_map.grid[4]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""
+Unit Tests for BoardView Helpers
+================================
+Tests the display-independent parts of the canvas renderer.
+"""
+
+import unittest
+from views.gridView import PALETTE, TERRAIN_COLORS, dirty_rectangles
+from models.tile import TERRAIN_CODES
+
+
+class TestDirtyRectangles(unittest.TestCase):
+    """Unit tests for merging changed tiles into rectangles."""
+
+    def test_single_tile(self):
+        """Test that one tile becomes a 1x1 rectangle."""
+        self.assertEqual(dirty_rectangles({(3, 4)}), [(3, 4, 4, 5)])
+
+    def test_block_merges_into_one_rectangle(self):
+        """Test that a full block of tiles becomes one rectangle."""
+        tiles = {(x, y) for x in range(2, 6) for y in range(1, 4)}
+        self.assertEqual(dirty_rectangles(tiles), [(2, 1, 6, 4)])
+
+    def test_disjoint_runs_stay_separate(self):
+        """Test that gaps split runs and rows only stack on equal spans."""
+        tiles = {(0, 0), (1, 0), (3, 0), (0, 1), (1, 1), (0, 3)}
+        self.assertEqual(sorted(dirty_rectangles(tiles)), [(0, 0, 2, 2), (0, 3, 1, 4), (3, 0, 4, 1)])
+
+    def test_rectangles_cover_exactly_the_tiles(self):
+        """Test that the rectangles cover each dirty tile once and nothing else."""
+        tiles = {(x, y) for x in range(10) for y in range(10) if (x * 7 + y * 3) % 5 < 2}
+        covered = [(x, y) for x0, y0, x1, y1 in dirty_rectangles(tiles)
+                   for y in range(y0, y1) for x in range(x0, x1)]
+        self.assertEqual(len(covered), len(tiles))
+        self.assertEqual(set(covered), tiles)
+
+    def test_palette_follows_terrain_codes(self):
+        """Test that palette entries line up with terrain codes."""
+        self.assertEqual(PALETTE[TERRAIN_CODES['water']], TERRAIN_COLORS['water'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Unit Tests for HierarchicalPathfinder Class
+===========================================
+Tests chunked HPA* queries against flat A* and chunk-local rebuilds.
+"""
+
+import unittest
+from models.gridMap import GridMap
+from models.hierarchicalPathfinder import HierarchicalPathfinder
+from models.tile import TERRAIN_CODES
+from models.unitPathfinder import UnitPathfinder
+
+
+class TestHierarchicalPathfinder(unittest.TestCase):
+    """Unit tests for HierarchicalPathfinder functionality."""
+
+    def setUp(self):
+        """Initialize a 64x48 map with two walls that have gaps."""
+        self.grid_map = GridMap(64, 48)
+        self.grid_map.terrain[:, 20] = TERRAIN_CODES['water']
+        self.grid_map.terrain[40, 20] = TERRAIN_CODES['grass']
+        self.grid_map.terrain[10, 25:60] = TERRAIN_CODES['mountain']
+        self.grid_map.terrain[20:30, 40:45] = TERRAIN_CODES['road']
+        self.hpa = HierarchicalPathfinder(self.grid_map, chunk_size=16)
+
+    def _cost(self, path):
+        return sum(self.hpa._costs[y * self.grid_map.width + x] for x, y in path[1:])
+
+    def assertValidPath(self, grid_map, path, start, goal):
+        self.assertEqual(path[0], start)
+        self.assertEqual(path[-1], goal)
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            self.assertEqual(abs(x1 - x2) + abs(y1 - y2), 1)
+        for x, y in path:
+            self.assertTrue(grid_map.grid[y][x].is_walkable())
+
+    def test_path_is_valid_and_near_optimal(self):
+        """Test that HPA* paths are walkable and close to the flat optimum."""
+        start, goal = (2, 2), (60, 45)
+        path = self.hpa.find_path(start, goal)
+        self.assertValidPath(self.grid_map, path, start, goal)
+        optimal = UnitPathfinder(self.grid_map).find_path(start, goal)
+        self.assertLessEqual(self._cost(path), self._cost(optimal) * 1.5)
+
+    def test_unreachable_goal(self):
+        """Test that a sealed-off goal has no path."""
+        self.grid_map.terrain[44:48, 59] = TERRAIN_CODES['water']
+        self.grid_map.terrain[44, 59:64] = TERRAIN_CODES['water']
+        hpa = HierarchicalPathfinder(self.grid_map, chunk_size=16)
+        self.assertIsNone(hpa.find_path((2, 2), (62, 46)))
+
+    def test_same_chunk_query(self):
+        """Test that a query inside one chunk stays local."""
+        path = self.hpa.find_path((1, 1), (14, 5))
+        self.assertValidPath(self.grid_map, path, (1, 1), (14, 5))
+        self.assertEqual(self.hpa.stats['chunk_builds'], 0)
+
+    def test_graphs_are_built_lazily(self):
+        """Test that only chunks touched by the search get an abstract graph."""
+        self.hpa.find_path((2, 40), (30, 46))
+        self.assertLess(self.hpa.stats['chunk_builds'], self.hpa.chunks_x * self.hpa.chunks_y)
+
+    def test_edit_rebuilds_only_its_chunk(self):
+        """Test that an interior edit drops one chunk graph and is respected."""
+        self.hpa.build()
+        builds = self.hpa.stats['chunk_builds']
+        self.grid_map.set_terrain(20, 40, 'water')  # Close the gap; (20, 40) is inside chunk (1, 2)
+        self.assertEqual(len(self.hpa._graphs), self.hpa.chunks_x * self.hpa.chunks_y - 1)
+        self.assertIsNone(self.hpa.find_path((2, 40), (60, 45)))
+        self.assertEqual(self.hpa.stats['chunk_builds'], builds + 1)
+
+    def test_border_edit_updates_entrances(self):
+        """Test that opening a tile on a chunk border creates a new crossing."""
+        grid_map = GridMap(48, 32)
+        grid_map.terrain[:, 32] = TERRAIN_CODES['water']  # First column of chunks (2, y)
+        hpa = HierarchicalPathfinder(grid_map, chunk_size=16)
+        self.assertIsNone(hpa.find_path((2, 5), (45, 5)))
+        grid_map.set_terrain(32, 20, 'grass')
+        path = hpa.find_path((2, 5), (45, 5))
+        self.assertValidPath(grid_map, path, (2, 5), (45, 5))
+        self.assertIn((32, 20), path)
+
+
+if __name__ == "__main__":
+    unittest.main()
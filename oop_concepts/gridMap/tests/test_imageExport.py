@@ -0,0 +1,106 @@
+"""
+Unit Tests for Headless Image Export
+====================================
+Tests rendering GridMaps to PNG and PPM images without a display.
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+import numpy as np
+from models.gridMap import GridMap
+from models.mapFile import save_map
+from models.tile import TERRAIN_CODES
+from models.unit import Unit
+from views.imageExport import RGB_PALETTE, UNIT_RGB, export_directory, export_image, render_pixels
+
+
+def read_png(path):
+    """Decode an unfiltered 8-bit RGB PNG written by write_png."""
+    with open(path, 'rb') as file:
+        data = file.read()
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    offset, chunks = 8, {}
+    while offset < len(data):
+        (length,) = struct.unpack('>I', data[offset:offset + 4])
+        kind = data[offset + 4:offset + 8]
+        body = data[offset + 8:offset + 8 + length]
+        assert struct.unpack('>I', data[offset + 8 + length:offset + 12 + length])[0] == zlib.crc32(kind + body)
+        chunks[kind] = chunks.get(kind, b'') + body
+        offset += 12 + length
+    width, height = struct.unpack('>II', chunks[b'IHDR'][:8])
+    raw = np.frombuffer(zlib.decompress(chunks[b'IDAT']), dtype=np.uint8).reshape(height, width * 3 + 1)
+    assert not raw[:, 0].any()
+    return raw[:, 1:].reshape(height, width, 3)
+
+
+class TestImageExport(unittest.TestCase):
+    """Unit tests for render_pixels, export_image and export_directory."""
+
+    def setUp(self):
+        """Create a small map with water, a road and one unit."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.grid_map = GridMap(12, 7)
+        self.grid_map.terrain[1:3, 2:5] = TERRAIN_CODES['water']
+        self.grid_map.terrain[5, :] = TERRAIN_CODES['road']
+        self.grid_map.set_unit(9, 0, Unit("Knight", 5))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_pixels_follow_palette(self):
+        """Test that each tile gets its terrain colour and units are overlaid."""
+        pixels = render_pixels(self.grid_map)
+        self.assertEqual(pixels.shape, (7, 12, 3))
+        self.assertTrue(np.array_equal(pixels[1, 2], RGB_PALETTE[TERRAIN_CODES['water']]))
+        self.assertTrue(np.array_equal(pixels[5, 0], RGB_PALETTE[TERRAIN_CODES['road']]))
+        self.assertTrue(np.array_equal(pixels[0, 9], UNIT_RGB))
+        plain = render_pixels(self.grid_map, units=False)
+        self.assertTrue(np.array_equal(plain[0, 9], RGB_PALETTE[TERRAIN_CODES['grass']]))
+
+    def test_scale_repeats_tiles(self):
+        """Test that scaling turns each tile into a square block."""
+        pixels = render_pixels(self.grid_map, scale=3)
+        self.assertEqual(pixels.shape, (21, 36, 3))
+        self.assertTrue((pixels[3:9, 6:15] == RGB_PALETTE[TERRAIN_CODES['water']]).all())
+        with self.assertRaises(ValueError):
+            render_pixels(self.grid_map, scale=0)
+
+    def test_png_round_trip(self):
+        """Test that the PNG decodes back to the rendered pixels."""
+        path = os.path.join(self.directory.name, 'map.png')
+        export_image(self.grid_map, path, scale=2)
+        self.assertTrue(np.array_equal(read_png(path), render_pixels(self.grid_map, scale=2)))
+
+    def test_ppm_layout(self):
+        """Test that the PPM has a P6 header followed by raw RGB bytes."""
+        path = os.path.join(self.directory.name, 'map.ppm')
+        export_image(self.grid_map, path)
+        with open(path, 'rb') as file:
+            data = file.read()
+        header = b'P6 12 7 255\n'
+        self.assertTrue(data.startswith(header))
+        self.assertEqual(data[len(header):], render_pixels(self.grid_map).tobytes())
+
+    def test_unknown_format_raises(self):
+        """Test that an unsupported extension raises ValueError."""
+        with self.assertRaises(ValueError):
+            export_image(self.grid_map, os.path.join(self.directory.name, 'map.gif'))
+
+    def test_export_directory(self):
+        """Test that every map file in a directory is exported, in and out of process."""
+        source = os.path.join(self.directory.name, 'maps')
+        os.makedirs(source)
+        for name in ('a', 'b', 'c'):
+            save_map(self.grid_map, os.path.join(source, name + '.gmap'))
+        for workers in (1, 2):
+            destination = os.path.join(self.directory.name, f'images{workers}')
+            paths = export_directory(source, destination, workers=workers)
+            self.assertEqual([os.path.basename(path) for path in paths], ['a.png', 'b.png', 'c.png'])
+            self.assertTrue(np.array_equal(read_png(paths[1]), render_pixels(self.grid_map)))
+
+
+if __name__ == "__main__":
+    unittest.main()
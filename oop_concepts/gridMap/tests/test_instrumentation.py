@@ -0,0 +1,81 @@
+"""
+Unit Tests for Metrics and Generation Logging
+=============================================
+Tests stage timers, counters, metrics records and lazy module logging.
+"""
+
+import json
+import logging
+import unittest
+from main import TERRAIN_CONFIG
+from models.instrumentation import Metrics
+from models.mapGenerator import generate_map
+
+
+class CountingMetrics(Metrics):
+    """Metrics that counts how often a record is built."""
+
+    def __init__(self):
+        super().__init__()
+        self.records_built = 0
+
+    def record(self, **fields):
+        self.records_built += 1
+        return super().record(**fields)
+
+
+class TestMetrics(unittest.TestCase):
+    """Unit tests for the instrumentation surface."""
+
+    def test_stages_and_counters_accumulate(self):
+        """Test that repeated stages add up and counters sum numeric stats only."""
+        metrics = Metrics()
+        for _ in range(3):
+            with metrics.stage('work'):
+                sum(range(1000))
+        metrics.count('nodes', 5)
+        metrics.count('nodes')
+        metrics.count_all({'expanded': 10, 'pushes': 12, 'label': 'x', 'done': True}, 'roads_')
+        self.assertGreater(metrics.timings['work'], 0)
+        self.assertEqual(metrics.counters, {'nodes': 6, 'roads_expanded': 10, 'roads_pushes': 12})
+
+    def test_record_is_serializable(self):
+        """Test that a record carries extra fields and survives JSON."""
+        metrics = Metrics()
+        metrics.count('tiles', 3)
+        record = metrics.record(seed=7)
+        self.assertEqual(json.loads(json.dumps(record)), {'seed': 7, 'timings': {}, 'counters': {'tiles': 3}})
+
+    def test_log_is_lazy(self):
+        """Test that no record is built while the level is disabled, and one is attached when enabled."""
+        logger = logging.getLogger('gridMap.test.metrics')
+        logger.setLevel(logging.WARNING)
+        metrics = CountingMetrics()
+        metrics.log(logger, logging.INFO)
+        self.assertEqual(metrics.records_built, 0)
+        with self.assertLogs(logger, logging.INFO) as captured:
+            metrics.log(logger, logging.INFO, seed=1)
+        self.assertEqual(metrics.records_built, 1)
+        self.assertEqual(captured.records[0].metrics['seed'], 1)
+
+    def test_generate_map_reports_metrics(self):
+        """Test that generation fills stage timings and counters from every stage."""
+        metrics = Metrics()
+        generate_map(40, 40, TERRAIN_CONFIG, seed=3, metrics=metrics)
+        self.assertEqual(set(metrics.timings), {'terrain', 'roads', 'zones', 'validate'})
+        for counter in ('terrain_tiles_written', 'roads_expanded', 'roads_pushes', 'validate_carved'):
+            self.assertIn(counter, metrics.counters)
+        self.assertGreater(metrics.counters['terrain_tiles_written'], 0)
+
+    def test_details_are_debug_only(self):
+        """Test that per-zone and per-stage details log at DEBUG through module loggers."""
+        with self.assertLogs('models', logging.DEBUG) as captured:
+            generate_map(20, 20, TERRAIN_CONFIG, seed=3)
+        levels = {record.getMessage(): record.levelno for record in captured.records}
+        self.assertEqual(levels['Reserving zone 1 at (2, 2).'], logging.DEBUG)
+        self.assertEqual(levels['Starting terrain generation.'], logging.INFO)
+        self.assertTrue(all(record.name.startswith('models.') for record in captured.records))
+
+
+if __name__ == "__main__":
+    unittest.main()
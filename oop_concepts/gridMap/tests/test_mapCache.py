@@ -0,0 +1,77 @@
+"""
+Unit Tests for Seeded Generation and MapCache
+=============================================
+Tests that one seed reproduces a whole map and that cached maps load from disk.
+"""
+
+import copy
+import tempfile
+import unittest
+import numpy as np
+from main import TERRAIN_CONFIG
+from models.gridMap import GridMap
+from models.mapCache import MapCache
+from models.mapGenerator import generate_map
+
+
+class TestSeededGeneration(unittest.TestCase):
+    """Unit tests for seed threading through every stage."""
+
+    def test_generate_map_is_reproducible(self):
+        """Test that terrain, roads and zones are identical for one seed."""
+        first = generate_map(40, 30, TERRAIN_CONFIG, seed=21)
+        second = generate_map(40, 30, TERRAIN_CONFIG, seed=21)
+        self.assertTrue(np.array_equal(first.terrain, second.terrain))
+        self.assertEqual(first.seed, 21)
+
+    def test_legacy_generate_terrain_is_reproducible(self):
+        """Test that GridMap.generate_terrain honours its seed."""
+        first, second = GridMap(30, 30), GridMap(30, 30)
+        first.generate_terrain(seed=4)
+        second.generate_terrain(seed=4)
+        self.assertTrue(np.array_equal(first.terrain, second.terrain))
+
+
+class TestMapCache(unittest.TestCase):
+    """Unit tests for MapCache functionality."""
+
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = MapCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_second_request_hits_cache(self):
+        """Test that a repeated request loads the same map from disk."""
+        generated = self.cache.get_or_generate(32, 24, TERRAIN_CONFIG, 8)
+        loaded = self.cache.get_or_generate(32, 24, TERRAIN_CONFIG, 8)
+        self.assertEqual(self.cache.stats, {'hits': 1, 'misses': 1})
+        self.assertTrue(np.array_equal(generated.terrain, loaded.terrain))
+        self.assertEqual(loaded.seed, 8)
+
+    def test_no_seed_is_never_a_hit(self):
+        """Test that requests without a seed each get a fresh random map, stored under its own seed."""
+        first = self.cache.get_or_generate(16, 16, TERRAIN_CONFIG, None)
+        second = self.cache.get_or_generate(16, 16, TERRAIN_CONFIG, None)
+        self.assertEqual(self.cache.stats, {'hits': 0, 'misses': 2})
+        self.assertNotEqual(first.seed, second.seed)
+        self.cache.get_or_generate(16, 16, TERRAIN_CONFIG, first.seed)
+        self.assertEqual(self.cache.stats['hits'], 1)
+
+    def test_key_covers_every_input(self):
+        """Test that size, config and seed all change the key."""
+        changed = copy.deepcopy(TERRAIN_CONFIG)
+        changed['water']['threshold'] = 0.3
+        keys = {
+            MapCache.key(32, 24, TERRAIN_CONFIG, 8),
+            MapCache.key(24, 32, TERRAIN_CONFIG, 8),
+            MapCache.key(32, 24, changed, 8),
+            MapCache.key(32, 24, TERRAIN_CONFIG, 9),
+        }
+        self.assertEqual(len(keys), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
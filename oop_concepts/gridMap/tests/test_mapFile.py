@@ -0,0 +1,98 @@
+"""
+Unit Tests for the Binary Map File Format
+=========================================
+Tests saving and memory-mapped loading of GridMaps.
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from models import mapFile
+from models.gridMap import GridMap
+from models.mapFile import load_map, read_header, save_map
+from models.tile import TERRAIN_CODES
+from models.unit import Unit
+
+
+class TestMapFile(unittest.TestCase):
+    """Unit tests for save_map and load_map."""
+
+    def setUp(self):
+        """Create a small map with terrain, a seed and units."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.gmap')
+        self.grid_map = GridMap(37, 21)
+        self.grid_map.terrain[3:9, 4:30] = TERRAIN_CODES['water']
+        self.grid_map.terrain[15, :] = TERRAIN_CODES['road']
+        self.grid_map.seed = 1234
+        knight = Unit("Knight", 7)
+        knight.health = 80
+        self.grid_map.set_unit(2, 18, knight)
+        self.grid_map.set_unit(36, 0, Unit("Archer", 4))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """Test that terrain, seed and units survive a save and load."""
+        save_map(self.grid_map, self.path)
+        loaded = load_map(self.path)
+        self.assertTrue(np.array_equal(loaded.terrain, self.grid_map.terrain))
+        self.assertEqual(loaded.seed, 1234)
+        self.assertEqual(loaded.units[(2, 18)].name, "Knight")
+        self.assertEqual(loaded.units[(2, 18)].health, 80)
+        self.assertEqual(loaded.units[(36, 0)].speed, 4)
+
+    def test_fractional_stats_round_trip(self):
+        """Test that non-integer speed and health are stored exactly."""
+        scout = Unit("Scout", 2.5)
+        scout.health = 37.25
+        self.grid_map.set_unit(5, 5, scout)
+        save_map(self.grid_map, self.path)
+        loaded = load_map(self.path).units[(5, 5)]
+        self.assertEqual((loaded.speed, loaded.health), (2.5, 37.25))
+
+    def test_reads_version_1_files(self):
+        """Test that files written with integer unit records still load."""
+        with mock.patch.multiple(mapFile, FORMAT_VERSION=1, UNIT_RECORD=mapFile.UNIT_RECORD_V1):
+            save_map(self.grid_map, self.path)
+        self.assertEqual(read_header(self.path)['version'], 1)
+        loaded = load_map(self.path)
+        self.assertEqual((loaded.units[(2, 18)].speed, loaded.units[(2, 18)].health), (7, 80))
+
+    def test_bad_unit_leaves_no_file(self):
+        """Test that a unit that cannot be stored fails before the file is created."""
+        self.grid_map.set_unit(5, 5, Unit("Ghost", "fast"))
+        with self.assertRaises(struct.error):
+            save_map(self.grid_map, self.path)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_terrain_is_memory_mapped(self):
+        """Test that the terrain plane is mapped from the file, not copied."""
+        save_map(self.grid_map, self.path)
+        loaded = load_map(self.path)
+        self.assertIsInstance(loaded.terrain, np.memmap)
+        self.assertEqual(read_header(self.path)['terrain_offset'] % 64, 0)
+        with self.assertRaises(ValueError):
+            loaded.set_terrain(0, 0, 'water')  # Read-only mapping
+
+    def test_copy_on_write_mode(self):
+        """Test that 'c' mode allows edits without touching the file."""
+        save_map(self.grid_map, self.path)
+        loaded = load_map(self.path, mode='c')
+        loaded.set_terrain(0, 0, 'mountain')
+        self.assertEqual(load_map(self.path).get_terrain(0, 0), 'grass')
+
+    def test_rejects_other_files(self):
+        """Test that files without the magic number are rejected."""
+        with open(self.path, 'wb') as file:
+            file.write(b'\0' * 64)
+        with self.assertRaises(ValueError):
+            load_map(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
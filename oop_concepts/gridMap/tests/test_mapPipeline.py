@@ -0,0 +1,96 @@
+"""
+Unit Tests for the Map Pipeline
+===============================
+Tests stage registration, cached layers and selective re-runs of the generation pipeline.
+"""
+
+import copy
+import unittest
+import numpy as np  # Install with pip install numpy
+from main import TERRAIN_CONFIG
+from models.instrumentation import Metrics
+from models.mapGenerator import build_pipeline, generate_map
+from models.mapPipeline import MapPipeline
+
+
+class TestMapPipeline(unittest.TestCase):
+    """Unit tests for MapPipeline and the standard generation stages."""
+
+    def _run(self, pipeline, config, seed=5):
+        """Run the pipeline on a small map and return (grid_map, metrics)."""
+        metrics = Metrics()
+        return pipeline.run(32, 24, config, seed, metrics=metrics), metrics
+
+    def test_matches_generate_map(self):
+        """Test that cached and uncached runs produce the same map as generate_map."""
+        pipeline = build_pipeline()
+        expected = generate_map(32, 24, TERRAIN_CONFIG, seed=5).terrain
+        for _ in range(2):
+            grid_map, _ = self._run(pipeline, TERRAIN_CONFIG)
+            np.testing.assert_array_equal(grid_map.terrain, expected)
+            self.assertEqual(grid_map.seed, 5)
+
+    def test_repeat_run_is_served_from_cache(self):
+        """Test that a second identical run runs no stage at all."""
+        pipeline = build_pipeline()
+        self._run(pipeline, TERRAIN_CONFIG)
+        _, metrics = self._run(pipeline, TERRAIN_CONFIG)
+        self.assertEqual(metrics.timings, {})
+        self.assertEqual(metrics.counters, {'pipeline_cache_hits': 4})
+
+    def test_road_change_reruns_roads_onwards(self):
+        """Test that editing only the road config keeps the cached terrain."""
+        pipeline = build_pipeline()
+        self._run(pipeline, TERRAIN_CONFIG)
+        config = copy.deepcopy(TERRAIN_CONFIG)
+        config['road']['straighten'] = True
+        grid_map, metrics = self._run(pipeline, config)
+        self.assertEqual(set(metrics.timings), {'roads', 'zones', 'validate'})
+        self.assertEqual(metrics.counters['pipeline_cache_hits'], 1)
+        np.testing.assert_array_equal(grid_map.terrain, generate_map(32, 24, config, seed=5).terrain)
+
+    def test_terrain_change_or_new_seed_reruns_everything(self):
+        """Test that terrain settings and the seed invalidate every stage."""
+        pipeline = build_pipeline()
+        self._run(pipeline, TERRAIN_CONFIG)
+        config = copy.deepcopy(TERRAIN_CONFIG)
+        config['water']['threshold'] = 0.4
+        _, metrics = self._run(pipeline, config)
+        self.assertEqual(set(metrics.timings), {'terrain', 'roads', 'zones', 'validate'})
+        _, metrics = self._run(pipeline, TERRAIN_CONFIG, seed=6)
+        self.assertNotIn('pipeline_cache_hits', metrics.counters)
+
+    def test_returned_maps_do_not_share_cached_layers(self):
+        """Test that editing a returned map leaves the cache untouched."""
+        pipeline = build_pipeline()
+        first, _ = self._run(pipeline, TERRAIN_CONFIG)
+        expected = first.terrain.copy()
+        first.terrain[:] = 0
+        second, _ = self._run(pipeline, TERRAIN_CONFIG)
+        np.testing.assert_array_equal(second.terrain, expected)
+
+    def test_cache_is_bounded(self):
+        """Test that old stage results are evicted beyond cache_size."""
+        pipeline = build_pipeline(cache_size=4)
+        self._run(pipeline, TERRAIN_CONFIG, seed=1)
+        self._run(pipeline, TERRAIN_CONFIG, seed=2)
+        _, metrics = self._run(pipeline, TERRAIN_CONFIG, seed=1)
+        self.assertNotIn('pipeline_cache_hits', metrics.counters)
+        self.assertEqual(pipeline.stats, {'hits': 0, 'misses': 12})
+
+    def test_stage_registration_is_checked(self):
+        """Test that missing inputs, duplicate names and undeclared outputs are rejected."""
+        pipeline = MapPipeline()
+        with self.assertRaises(ValueError):
+            pipeline.add_stage('roads', lambda context: {}, inputs=('terrain',), outputs=('roads',))
+        pipeline.add_stage('blank', lambda context: {'terrain': np.zeros((24, 32), np.uint8)}, outputs=('terrain',))
+        with self.assertRaises(ValueError):
+            pipeline.add_stage('blank', lambda context: {}, outputs=('other',))
+        pipeline.add_stage('wrong', lambda context: {'other': context.layers['terrain']},
+                           inputs=('terrain',), outputs=('final',))
+        with self.assertRaises(ValueError):
+            self._run(pipeline, TERRAIN_CONFIG)
+
+
+if __name__ == "__main__":
+    unittest.main()
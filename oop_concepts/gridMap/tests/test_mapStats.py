@@ -0,0 +1,92 @@
+"""
+Unit Tests for Map Statistics
+=============================
+Tests terrain histograms, region and cluster counts, component labelling and the ASCII writer.
+"""
+
+import io
+import unittest
+from collections import deque
+import numpy as np
+from models.components import label_components
+from models.gridMap import GridMap
+from models.mapStats import cluster_counts, region_counts, terrain_histogram, write_ascii
+from models.tile import TERRAIN_CODES
+
+
+def count_components(mask):
+    """Reference 4-connected component count by breadth-first search."""
+    height, width = mask.shape
+    seen = np.zeros_like(mask)
+    count = 0
+    for y in range(height):
+        for x in range(width):
+            if mask[y, x] and not seen[y, x]:
+                count += 1
+                seen[y, x] = True
+                queue = deque([(x, y)])
+                while queue:
+                    cx, cy = queue.popleft()
+                    for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+                        if 0 <= nx < width and 0 <= ny < height and mask[ny, nx] and not seen[ny, nx]:
+                            seen[ny, nx] = True
+                            queue.append((nx, ny))
+    return count
+
+
+class TestMapStats(unittest.TestCase):
+    """Unit tests for the vectorized statistics and streaming ASCII output."""
+
+    def setUp(self):
+        """Create a map with two water lakes and a road row."""
+        self.grid_map = GridMap(10, 6)
+        self.grid_map.terrain[0:2, 0:3] = TERRAIN_CODES['water']
+        self.grid_map.terrain[3, 6:9] = TERRAIN_CODES['water']
+        self.grid_map.terrain[5, :] = TERRAIN_CODES['road']
+
+    def test_terrain_histogram(self):
+        """Test that the histogram counts every terrain, including absent ones."""
+        self.assertEqual(terrain_histogram(self.grid_map), {'grass': 41, 'water': 9, 'mountain': 0, 'road': 10})
+
+    def test_region_counts(self):
+        """Test per-region counts, including the smaller edge regions."""
+        counts = region_counts(self.grid_map, 4)
+        self.assertEqual(counts.shape, (2, 3, 4))
+        self.assertEqual(counts[0, 0, TERRAIN_CODES['water']], 6)
+        self.assertEqual(counts[1, 2].sum(), 4)
+        self.assertEqual(counts.sum(), 60)
+
+    def test_cluster_counts(self):
+        """Test that separate patches of the same terrain are counted as separate clusters."""
+        self.assertEqual(cluster_counts(self.grid_map, ['water', 'road', 'mountain']),
+                         {'water': 2, 'mountain': 0, 'road': 1})
+
+    def test_label_components_matches_search(self):
+        """Test labelling against a breadth-first search on random masks, including U shapes."""
+        rng = np.random.default_rng(3)
+        for density in (0.3, 0.5, 0.6):
+            mask = rng.random((40, 50)) < density
+            labels, count = label_components(mask)
+            self.assertEqual(count, count_components(mask))
+            self.assertTrue(np.array_equal(labels > 0, mask))
+        u_shape = np.zeros((5, 5), dtype=bool)
+        u_shape[:, 0] = u_shape[:, 4] = u_shape[4, :] = True
+        labels, count = label_components(u_shape)
+        self.assertEqual(count, 1)
+        self.assertEqual(set(np.unique(labels)), {0, 1})
+
+    def test_write_ascii_text_and_binary(self):
+        """Test that chunked output matches the full map in text and binary files."""
+        text, binary = io.StringIO(), io.BytesIO()
+        write_ascii(self.grid_map, text, chunk_rows=4)
+        write_ascii(self.grid_map, binary)
+        lines = text.getvalue().splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(lines[0], '~~~.......')
+        self.assertEqual(lines[3], '......~~~.')
+        self.assertEqual(lines[5], '#' * 10)
+        self.assertEqual(binary.getvalue().decode('ascii'), text.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Unit Tests for MapValidator
+===========================
+Tests zone reachability checks and corridor repair on generated-style maps.
+"""
+
+import unittest
+from main import TERRAIN_CONFIG
+from models.gridMap import GridMap
+from models.mapGenerator import generate_map
+from models.mapValidator import MapValidator
+from models.tile import TERRAIN_CODES
+from models.zoneGenerator import ZoneAllocator
+
+
+class TestMapValidator(unittest.TestCase):
+    """Unit tests for walkable-component validation and repair."""
+
+    def setUp(self):
+        """Initialize a map whose right half is cut off by a river and a mountain ridge."""
+        self.grid_map = GridMap(30, 20)
+        self.grid_map.terrain[:, 14:16] = TERRAIN_CODES['water']
+        self.grid_map.terrain[:, 16] = TERRAIN_CODES['mountain']
+        self.zones = ZoneAllocator(self.grid_map).zones()
+
+    def test_zone_rectangles(self):
+        """Test that the allocator exposes the four corner zones it reserves."""
+        self.assertEqual(self.zones, [(2, 2, 5, 5), (25, 2, 28, 5), (2, 15, 5, 18), (25, 15, 28, 18)])
+
+    def test_isolated_zones_are_reported(self):
+        """Test that zones across the river are isolated from the main component."""
+        report = MapValidator(self.grid_map, self.zones).validate()
+        self.assertEqual(report['components'], 2)
+        self.assertFalse(report['connected'])
+        self.assertEqual(report['isolated'], [1, 3])
+
+    def test_repair_carves_cheapest_corridor(self):
+        """Test that repair connects all zones through the cheapest crossing."""
+        self.grid_map.terrain[9, 16] = TERRAIN_CODES['grass']  # Gap in the ridge: only the river to cross
+        report = MapValidator(self.grid_map, self.zones).repair()
+        self.assertTrue(report['connected'])
+        self.assertEqual(report['carved'], 2)
+        self.assertEqual(self.grid_map.get_terrain(14, 9), 'road')
+        self.assertEqual(self.grid_map.get_terrain(15, 9), 'road')
+        self.assertTrue(MapValidator(self.grid_map, self.zones).validate()['connected'])
+
+    def test_repair_without_gap(self):
+        """Test that repair crosses the river and the ridge when there is no gap."""
+        report = MapValidator(self.grid_map, self.zones).repair()
+        self.assertTrue(report['connected'])
+        self.assertEqual(report['carved'], 3)
+
+    def test_repair_with_costs_missing_a_blocking_terrain(self):
+        """Test that terrain left out of the cost table is still carved through instead of looping forever."""
+        grid_map = GridMap(20, 20)
+        grid_map.terrain[:, 10] = TERRAIN_CODES['water']
+        costs = {'grass': 1, 'road': 1, 'mountain': 5}
+        report = MapValidator(grid_map, ZoneAllocator(grid_map).zones(), movement_costs=costs).repair()
+        self.assertTrue(report['connected'])
+        self.assertEqual(report['carved'], 1)
+
+    def test_zone_on_blocking_terrain(self):
+        """Test that a zone standing in water is connected as well."""
+        grid_map = GridMap(12, 12)
+        grid_map.terrain[0:6, 0:6] = TERRAIN_CODES['water']
+        report = MapValidator(grid_map, ZoneAllocator(grid_map).zones()).repair()
+        self.assertTrue(report['connected'])
+        self.assertEqual(grid_map.get_terrain(2, 2), 'road')
+
+    def test_generated_maps_are_connected(self):
+        """Test that generate_map always returns maps whose zones reach each other."""
+        for seed in range(10):
+            grid_map = generate_map(32, 32, TERRAIN_CONFIG, seed=seed)
+            self.assertTrue(MapValidator(grid_map, ZoneAllocator(grid_map).zones()).validate()['connected'])
+
+
+if __name__ == "__main__":
+    unittest.main()
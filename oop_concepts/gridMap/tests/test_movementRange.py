@@ -0,0 +1,74 @@
+"""
+Unit Tests for MovementRange
+============================
+Tests bounded-Dijkstra reachability and the batched per-player API.
+"""
+
+import unittest
+import numpy as np
+from models.gridMap import GridMap
+from models.movementRange import MovementRange
+from models.player import Player
+from models.tile import TERRAIN_CODES
+from models.unit import Unit
+
+
+class TestMovementRange(unittest.TestCase):
+    """Unit tests for reachable tiles under movement costs."""
+
+    def setUp(self):
+        """Initialize a map with a road row and a water wall."""
+        self.grid_map = GridMap(20, 12)
+        self.grid_map.terrain[5, :] = TERRAIN_CODES['road']
+        self.grid_map.terrain[:, 12] = TERRAIN_CODES['water']
+        self.ranges = MovementRange(self.grid_map)
+
+    def test_open_ground_is_a_diamond(self):
+        """Test that on grass the range is every tile within Manhattan distance."""
+        area = self.ranges.reachable(4, 1, 2)
+        expected = {(x, y) for x in range(20) for y in range(5) if abs(x - 4) + abs(y - 1) <= 2}
+        self.assertEqual(set(area.tiles()), expected)
+        self.assertEqual((area.x0, area.y0, area.mask.shape), (2, 0, (4, 5)))
+        self.assertEqual(area.cost_to(4, 3), 2)
+        self.assertEqual(area.cost_to(10, 10), float('inf'))
+
+    def test_roads_extend_range_and_water_blocks(self):
+        """Test that cheap roads reach further and water cannot be crossed."""
+        area = self.ranges.reachable(6, 5, 3)
+        self.assertIn((11, 5), area)
+        self.assertEqual(area.cost_to(11, 5), 2.5)
+        self.assertNotIn((12, 5), area)
+        self.assertNotIn((13, 5), area)
+
+    def test_other_units_block(self):
+        """Test that tiles held by other units cannot be entered, even after the range was built."""
+        self.grid_map.place_unit(5, 5, Unit("Wall", 1))
+        area = self.ranges.reachable(4, 5, 1)
+        self.assertNotIn((5, 5), area)
+        self.assertIn((3, 5), area)
+
+    def test_buffer_is_reset_between_queries(self):
+        """Test that repeated and overlapping queries give identical results."""
+        first = self.ranges.reachable(3, 3, 4)
+        self.ranges.reachable(4, 4, 6)
+        again = self.ranges.reachable(3, 3, 4)
+        self.assertTrue(np.array_equal(first.costs, again.costs))
+        self.assertTrue(all(distance == float('inf') for distance in self.ranges._distance))
+
+    def test_reachable_for_player(self):
+        """Test the batch API uses each unit's speed and skips units off the map."""
+        player = Player("Red")
+        fast, slow, reserve = Unit("Rider", 3), Unit("Footman", 1), Unit("Reserve", 2)
+        for unit in (fast, slow, reserve):
+            player.add_unit(unit)
+        self.grid_map.place_unit(2, 9, fast)
+        self.grid_map.place_unit(16, 2, slow)
+        areas = self.ranges.reachable_for_player(player)
+        self.assertEqual(set(areas), {fast, slow})
+        self.assertEqual(len(areas[slow]), 5)
+        self.assertIn((2, 6), areas[fast])
+        self.assertNotIn((16, 4), areas[slow])
+
+
+if __name__ == "__main__":
+    unittest.main()
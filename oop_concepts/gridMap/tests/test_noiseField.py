@@ -0,0 +1,60 @@
+"""
+Unit Tests for Noise Fields
+===========================
+Tests the vectorized Perlin noise field, against per-cell pnoise2 when the noise package is installed.
+"""
+
+import unittest
+import numpy as np
+from models.noiseField import edge_distance_field, lattice_offset, perlin_field
+
+try:
+    from noise import pnoise2  # Optional reference, pip install noise
+except ImportError:
+    pnoise2 = None
+
+
+class TestNoiseField(unittest.TestCase):
+    """Unit tests for perlin_field and edge_distance_field."""
+
+    def test_shape_and_range(self):
+        """Test that the field covers the map and stays within [-1, 1]."""
+        field = perlin_field(40, 30, scale=8, seed=5)
+        self.assertEqual(field.shape, (40, 30))
+        self.assertLessEqual(np.abs(field).max(), 1.0)
+
+    def test_lattice_points_are_zero(self):
+        """Test that gradient noise vanishes on integer lattice points."""
+        field = perlin_field(5, 5, scale=1.0, seed=2)
+        self.assertTrue(np.allclose(field, 0.0))
+
+    def test_seed_is_reproducible(self):
+        """Test that equal seeds give equal fields and different seeds differ."""
+        self.assertTrue(np.array_equal(perlin_field(16, 16, 4, seed=1), perlin_field(16, 16, 4, seed=1)))
+        self.assertFalse(np.array_equal(perlin_field(16, 16, 4, seed=1), perlin_field(16, 16, 4, seed=2)))
+
+    def test_octaves_are_normalised(self):
+        """Test that summed octaves stay within [-1, 1]."""
+        field = perlin_field(64, 64, scale=16, seed=3, octaves=4)
+        self.assertLessEqual(np.abs(field).max(), 1.0)
+
+    @unittest.skipIf(pnoise2 is None, "noise package not installed")
+    def test_matches_pnoise2(self):
+        """Test that the field equals per-cell pnoise2 at the seed's lattice offset, for one and several octaves."""
+        for seed, octaves in ((0, 1), (7, 1), (7, 3)):
+            shift_row, shift_col = lattice_offset(seed)
+            field = perlin_field(24, 20, 8, seed=seed, octaves=octaves, row_offset=5, col_offset=3)
+            expected = np.array([[pnoise2((row + 5) / 8 + shift_row, (col + 3) / 8 + shift_col, octaves=octaves)
+                                  for col in range(20)] for row in range(24)])
+            np.testing.assert_allclose(field, expected, atol=1e-5)  # pnoise2 works in float32
+
+    def test_edge_distance(self):
+        """Test distances to the nearest edge."""
+        distance = edge_distance_field(5, 7)
+        self.assertEqual(distance[0, 3], 0)
+        self.assertEqual(distance[2, 3], 2)
+        self.assertEqual(distance[2, 6], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Unit Tests for PathPlanner and RoadNetworkBuilder
+=================================================
+Tests that road placement connects every key point.
+"""
+
+import unittest
+from collections import deque
+from models.astar import astar_search
+from models.gridMap import GridMap
+from models.pathfinder import PathPlanner
+from models.roadNetwork import RoadNetworkBuilder
+from models.tile import TERRAIN_CODES
+
+
+def road_connected(grid_map, points):
+    """Return True if all points lie on one 4-connected road component."""
+    road = TERRAIN_CODES['road']
+    start = points[0]
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (0 <= nx < grid_map.width and 0 <= ny < grid_map.height
+                    and (nx, ny) not in seen and grid_map.terrain[ny, nx] == road):
+                seen.add((nx, ny))
+                queue.append((nx, ny))
+    return all(point in seen for point in points)
+
+
+class TestRoadNetwork(unittest.TestCase):
+    """Unit tests for multi-source road building."""
+
+    def setUp(self):
+        """Initialize a grass map with a water barrier and a mountain block."""
+        self.grid_map = GridMap(40, 30)
+        self.grid_map.terrain[:, 20] = TERRAIN_CODES['water']
+        self.grid_map.terrain[12:18, 8:12] = TERRAIN_CODES['mountain']
+        self.costs = PathPlanner(self.grid_map, {}).movement_costs
+
+    def test_connects_all_key_points(self):
+        """Test that every key point ends up on one road network."""
+        points = [(1, 1), (38, 1), (1, 28), (38, 28), (20, 15), (30, 10)]
+        stats = RoadNetworkBuilder(self.grid_map, self.costs).build(points)
+        self.assertEqual(stats['connections'], len(points) - 1)
+        self.assertTrue(road_connected(self.grid_map, points))
+
+    def test_single_search_expands_each_tile_once(self):
+        """Test that the builder runs one search over the map."""
+        points = [(x, y) for x in range(2, 40, 8) for y in range(2, 30, 8)]
+        stats = RoadNetworkBuilder(self.grid_map, self.costs).build(points)
+        self.assertEqual(stats['expanded'], self.grid_map.width * self.grid_map.height)
+        self.assertTrue(road_connected(self.grid_map, points))
+
+    def test_roads_avoid_expensive_terrain(self):
+        """Test that roads go around the mountain block instead of through it."""
+        RoadNetworkBuilder(self.grid_map, self.costs).build([(5, 15), (15, 15)])
+        self.assertFalse((self.grid_map.terrain[12:18, 8:12] == TERRAIN_CODES['road']).any())
+
+    def test_place_roads_uses_key_points(self):
+        """Test that PathPlanner.place_roads connects explicit key points."""
+        planner = PathPlanner(self.grid_map, {})
+        planner.place_roads([(3, 3), (36, 26)])
+        self.assertEqual(planner.stats['connections'], 1)
+
+
+class TestAStar(unittest.TestCase):
+    """Unit tests for the A* search core."""
+
+    def setUp(self):
+        """Initialize a map with a water wall that has one gap."""
+        self.grid_map = GridMap(30, 20)
+        self.grid_map.terrain[:, 15] = TERRAIN_CODES['water']
+        self.grid_map.terrain[10, 15] = TERRAIN_CODES['road']
+        self.costs = self.grid_map.cost_grid(PathPlanner(self.grid_map, {}).movement_costs).ravel().tolist()
+
+    def test_path_is_optimal(self):
+        """Test that A* finds the same cost as an uninformed search with fewer expansions."""
+        path, stats = astar_search(self.costs, 30, 20, (2, 3), (27, 17), 0.5)
+        _, dijkstra = astar_search(self.costs, 30, 20, (2, 3), (27, 17), 0)
+        self.assertEqual(stats['cost'], dijkstra['cost'])
+        self.assertLess(stats['expanded'], dijkstra['expanded'])
+        self.assertEqual(path[0], (2, 3))
+        self.assertEqual(path[-1], (27, 17))
+        self.assertIn((15, 10), path)
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            self.assertEqual(abs(x1 - x2) + abs(y1 - y2), 1)
+
+    def test_unreachable_goal(self):
+        """Test that impassable tiles make the goal unreachable."""
+        costs = [float('inf') if x == 15 else cost for x, cost in
+                 ((index % 30, cost) for index, cost in enumerate(self.costs))]
+        path, stats = astar_search(costs, 30, 20, (2, 3), (27, 17), 0.5)
+        self.assertIsNone(path)
+        self.assertIsNone(stats['cost'])
+
+    def test_cost_is_sum_of_entry_costs(self):
+        """Test that the reported cost is the entry cost of every tile after the start."""
+        path, stats = astar_search(self.costs, 30, 20, (0, 0), (29, 19), 0.5)
+        self.assertEqual(stats['cost'], sum(self.costs[y * 30 + x] for x, y in path[1:]))
+        self.assertGreater(stats['expanded'], 0)
+
+    def test_start_is_goal(self):
+        """Test that a search from the goal itself returns a one-tile path at no cost."""
+        path, stats = astar_search(self.costs, 30, 20, (4, 4), (4, 4), 0.5)
+        self.assertEqual(path, [(4, 4)])
+        self.assertEqual(stats['cost'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
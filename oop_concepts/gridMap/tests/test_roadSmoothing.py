@@ -0,0 +1,119 @@
+"""
+Unit Tests for Road Smoothing
+=============================
+Tests spur pruning, zig-zag straightening and that key points stay connected.
+"""
+
+import unittest
+import numpy as np
+from main import TERRAIN_CONFIG
+from models.components import label_components
+from models.gridMap import GridMap
+from models.pathfinder import PathPlanner
+from models.roadSmoothing import neighbour_count, prune_spurs, smooth_roads, straighten_corners
+from models.tile import TERRAIN_CODES
+
+
+def count_turns(road):
+    """Number of road tiles with one horizontal and one vertical road neighbour."""
+    padded = np.pad(road, 1)
+    horizontal = padded[1:-1, :-2].astype(int) + padded[1:-1, 2:]
+    vertical = padded[:-2, 1:-1].astype(int) + padded[2:, 1:-1]
+    return int((road & (horizontal == 1) & (vertical == 1)).sum())
+
+
+class TestRoadSmoothing(unittest.TestCase):
+    """Unit tests for the vectorized road smoothing stage."""
+
+    def test_neighbour_count(self):
+        """Test neighbour counts at the centre, edges and corners."""
+        mask = np.ones((3, 3), dtype=bool)
+        self.assertEqual(neighbour_count(mask).tolist(), [[2, 3, 2], [3, 4, 3], [2, 3, 2]])
+
+    def test_prune_matches_repeated_full_passes(self):
+        """Test that the frontier-based fixpoint equals removing all leaves pass after pass."""
+        rng = np.random.default_rng(8)
+        for _ in range(5):
+            road = rng.random((30, 40)) < 0.55
+            protected = np.zeros_like(road)
+            protected[rng.integers(0, 30, 5), rng.integers(0, 40, 5)] = True
+            expected = road.copy()
+            while True:
+                leaves = expected & (neighbour_count(expected) <= 1) & ~protected
+                if not leaves.any():
+                    break
+                expected &= ~leaves
+            pruned = road.copy()
+            self.assertEqual(prune_spurs(pruned, protected), int(road.sum() - expected.sum()))
+            self.assertTrue(np.array_equal(pruned, expected))
+
+    def test_prune_keeps_road_between_key_points(self):
+        """Test that a road between two key points survives while its spur is removed."""
+        road = np.zeros((10, 12), dtype=bool)
+        road[5, 1:11] = True
+        road[1:5, 6] = True  # Dead-end branch
+        protected = np.zeros_like(road)
+        protected[5, 1] = protected[5, 10] = True
+        self.assertEqual(prune_spurs(road, protected), 4)
+        self.assertEqual(road.sum(), 10)
+        self.assertTrue(road[5, 1] and road[5, 10])
+
+    def test_straighten_staircase(self):
+        """Test that a staircase keeps its length and connectivity but loses turns."""
+        road = np.zeros((14, 14), dtype=bool)
+        x = y = 1
+        road[y, x] = True
+        for step in range(20):
+            if step % 2 == 0:
+                x += 1
+            else:
+                y += 1
+            road[y, x] = True
+        protected = np.zeros_like(road)
+        protected[1, 1] = protected[11, 11] = True
+        before_tiles, before_turns = int(road.sum()), count_turns(road)
+        flips, _ = straighten_corners(road, np.ones_like(road), protected)
+        self.assertGreater(flips, 0)
+        self.assertEqual(int(road.sum()), before_tiles)
+        self.assertLess(count_turns(road), before_turns)
+        _, count = label_components(road)
+        self.assertEqual(count, 1)
+        self.assertTrue(road[1, 1] and road[11, 11])
+
+    def test_straighten_respects_buildable_tiles(self):
+        """Test that corners never move onto tiles that cannot be built on."""
+        road = np.zeros((6, 6), dtype=bool)
+        road[1, 1:3] = road[2, 2:4] = road[3, 3:5] = True
+        expected = road.copy()
+        straighten_corners(road, np.zeros_like(road), np.zeros_like(road))
+        self.assertTrue(np.array_equal(road, expected))
+
+    def test_place_roads_keeps_key_points_connected(self):
+        """Test that the planner's smoothing never cuts roads between key points."""
+        grid_map = GridMap(40, 30)
+        grid_map.terrain[8:12, 5:35] = TERRAIN_CODES['water']
+        grid_map.terrain[20, 3:9] = TERRAIN_CODES['road']  # Stray road, pruned unless a route reuses it
+        config = dict(TERRAIN_CONFIG, road=dict(TERRAIN_CONFIG['road'], straighten=True))
+        planner = PathPlanner(grid_map, config, seed=3)
+        key_points = [(2, 2), (37, 2), (2, 27), (37, 27), (20, 15)]
+        planner.place_roads(key_points)
+        road = grid_map.terrain == TERRAIN_CODES['road']
+        labels, _ = label_components(road)
+        self.assertEqual(len({labels[y, x] for x, y in key_points}), 1)
+        self.assertNotIn(0, {labels[y, x] for x, y in key_points})
+        dead_ends = {(int(x), int(y)) for y, x in zip(*np.nonzero(road & (neighbour_count(road) <= 1)))}
+        self.assertLessEqual(dead_ends, set(key_points))
+        self.assertIn('straightened', planner.stats)
+
+    def test_smooth_roads_writes_grass(self):
+        """Test that pruned tiles become grass and the stats are reported."""
+        grid_map = GridMap(8, 8)
+        grid_map.terrain[4, 2:6] = TERRAIN_CODES['road']
+        stats = smooth_roads(grid_map, [(2, 4)])
+        self.assertEqual(stats, {'pruned': 3, 'straightened': 0, 'sweeps': 0})
+        self.assertEqual(grid_map.terrain[4, 2], TERRAIN_CODES['road'])
+        self.assertTrue((grid_map.terrain[4, 3:6] == TERRAIN_CODES['grass']).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
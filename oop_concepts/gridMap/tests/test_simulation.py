@@ -0,0 +1,68 @@
+"""
+Unit Tests for the Headless Simulation
+======================================
+Tests spawning, turn play and the report of the simulation runner.
+"""
+
+import unittest
+from main import TERRAIN_CONFIG
+from models.simulation import Simulation, run_simulation
+
+
+class TestSimulation(unittest.TestCase):
+    """Unit tests for Simulation and run_simulation."""
+
+    def _play(self, policy, seed=4):
+        """Set up a small simulation and play 200 turns."""
+        simulation = Simulation(40, 40, TERRAIN_CONFIG, players=3, units_per_player=6, policy=policy, seed=seed)
+        simulation.setup()
+        simulation.run(200)
+        return simulation
+
+    def test_units_are_spawned_per_player(self):
+        """Test that every player gets their units on distinct walkable tiles."""
+        simulation = self._play('random')
+        self.assertEqual([len(player.units) for player in simulation.players], [6, 6, 6])
+        positions = [simulation.grid_map.position_of(unit) for player in simulation.players for unit in player.units]
+        self.assertEqual(len(set(positions)), 18)
+        for x, y in positions:
+            self.assertTrue(simulation.grid_map.grid[y][x].terrain in ('grass', 'road'))
+
+    def test_same_seed_same_outcome(self):
+        """Test that a seed fixes the map, spawns and every move."""
+        for policy in ('random', 'advance'):
+            first, second = self._play(policy), self._play(policy)
+            self.assertEqual(first.turns, 200)
+            self.assertEqual(sorted(first.grid_map.units), sorted(second.grid_map.units))
+
+    def test_advance_closes_distance(self):
+        """Test that advancing units end up closer to the map centre than they started."""
+        simulation = Simulation(40, 40, TERRAIN_CONFIG, players=2, units_per_player=4, policy='advance', seed=1)
+        simulation.setup()
+
+        def spread():
+            return sum(abs(x - 20) + abs(y - 20) for x, y in simulation.grid_map.units)
+
+        before = spread()
+        simulation.run(40)
+        self.assertLess(spread(), before)
+
+    def test_report(self):
+        """Test that the report covers throughput, every stage and the memory peak."""
+        report = run_simulation(24, 24, TERRAIN_CONFIG, players=2, units_per_player=3, turns=50, seed=2)
+        self.assertEqual((report['units'], report['turns']), (6, 50))
+        self.assertGreater(report['turns_per_second'], 0)
+        self.assertLessEqual({'generate', 'terrain', 'roads', 'spawn', 'schedule', 'range', 'policy', 'move'},
+                             set(report['timings']))
+        self.assertIn('roads_expanded', report['counters'])
+        self.assertGreater(report['peak_memory'], 0)
+        self.assertIsNone(run_simulation(24, 24, TERRAIN_CONFIG, turns=5, trace_memory=False)['peak_memory'])
+
+    def test_unknown_policy(self):
+        """Test that an unknown policy name is rejected."""
+        with self.assertRaises(ValueError):
+            Simulation(10, 10, TERRAIN_CONFIG, policy='teleport')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Unit Tests for Unit Placement and Spatial Queries
+=================================================
+Tests GridMap unit placement, moves and the SpatialHash range queries behind them.
+"""
+
+import random
+import unittest
+from models.gridMap import GridMap
+from models.spatialIndex import SpatialHash
+from models.unit import Unit
+
+
+class TestUnitPlacement(unittest.TestCase):
+    """Unit tests for placing, moving and looking up units."""
+
+    def setUp(self):
+        """Initialize a map with one knight and a listener log."""
+        self.grid_map = GridMap(40, 30)
+        self.knight = Unit("Knight", 5)
+        self.grid_map.place_unit(3, 4, self.knight)
+        self.changes = []
+        self.grid_map.add_listener(lambda x, y, kind: self.changes.append((x, y, kind)))
+
+    def test_lookups_both_ways(self):
+        """Test position-to-unit and unit-to-position lookups."""
+        self.assertIs(self.grid_map.unit_at(3, 4), self.knight)
+        self.assertEqual(self.grid_map.position_of(self.knight), (3, 4))
+        self.assertIsNone(self.grid_map.unit_at(0, 0))
+        self.assertIsNone(self.grid_map.position_of(Unit("Archer", 3)))
+
+    def test_place_rejects_occupied_and_duplicate(self):
+        """Test that placing on an occupied tile, twice or off the map raises."""
+        with self.assertRaises(ValueError):
+            self.grid_map.place_unit(3, 4, Unit("Archer", 3))
+        with self.assertRaises(ValueError):
+            self.grid_map.place_unit(5, 5, self.knight)
+        with self.assertRaises(IndexError):
+            self.grid_map.place_unit(40, 0, Unit("Archer", 3))
+
+    def test_move_unit(self):
+        """Test that moving updates every index and notifies both tiles."""
+        self.grid_map.move_unit(self.knight, 20, 25)
+        self.assertIsNone(self.grid_map.unit_at(3, 4))
+        self.assertEqual(self.grid_map.position_of(self.knight), (20, 25))
+        self.assertEqual(self.grid_map.units_in_radius(20, 25, 0), {(20, 25): self.knight})
+        self.assertEqual(self.grid_map.units_in_rect(0, 0, 10, 10), {})
+        self.assertEqual(self.changes, [(3, 4, 'unit'), (20, 25, 'unit')])
+        archer = Unit("Archer", 3)
+        self.grid_map.place_unit(1, 1, archer)
+        with self.assertRaises(ValueError):
+            self.grid_map.move_unit(archer, 20, 25)
+
+    def test_remove_unit(self):
+        """Test that a removed unit is gone from every index."""
+        self.assertEqual(self.grid_map.remove_unit(self.knight), (3, 4))
+        self.assertIsNone(self.grid_map.position_of(self.knight))
+        self.assertEqual(self.grid_map.units, {})
+        self.assertEqual(len(self.grid_map.spatial_index), 0)
+
+    def test_set_unit_replaces_occupant(self):
+        """Test that set_unit over another unit takes that unit off the map."""
+        archer = Unit("Archer", 3)
+        self.grid_map.set_unit(3, 4, archer)
+        self.assertIsNone(self.grid_map.position_of(self.knight))
+        self.assertEqual(self.grid_map.position_of(archer), (3, 4))
+        self.assertEqual(len(self.grid_map.spatial_index), 1)
+
+
+class TestSpatialHash(unittest.TestCase):
+    """Unit tests for SpatialHash queries against brute force."""
+
+    def setUp(self):
+        """Insert random positions, then remove some of them."""
+        rng = random.Random(11)
+        self.positions = {(rng.randrange(-50, 200), rng.randrange(-50, 200)) for _ in range(600)}
+        self.index = SpatialHash(cell_size=8)
+        for position in self.positions:
+            self.index.insert(*position)
+        for position in rng.sample(sorted(self.positions), 150):
+            self.index.remove(*position)
+            self.positions.discard(position)
+        self.rng = rng
+
+    def test_rect_queries(self):
+        """Test rectangles of many sizes, including empty and map-sized ones."""
+        for _ in range(200):
+            x0, y0 = self.rng.randrange(-60, 200), self.rng.randrange(-60, 200)
+            x1, y1 = x0 + self.rng.randrange(0, 120), y0 + self.rng.randrange(0, 120)
+            expected = {(x, y) for x, y in self.positions if x0 <= x < x1 and y0 <= y < y1}
+            self.assertEqual(sorted(self.index.query_rect(x0, y0, x1, y1)), sorted(expected))
+        self.assertEqual(len(self.index.query_rect(-1000, -1000, 1000, 1000)), len(self.positions))
+
+    def test_radius_queries(self):
+        """Test every metric against brute force."""
+        distances = {
+            'euclidean': lambda dx, dy: (dx * dx + dy * dy) ** 0.5,
+            'manhattan': lambda dx, dy: abs(dx) + abs(dy),
+            'chebyshev': lambda dx, dy: max(abs(dx), abs(dy)),
+        }
+        for metric, distance in distances.items():
+            for _ in range(60):
+                x, y, radius = self.rng.randrange(200), self.rng.randrange(200), self.rng.randrange(30)
+                expected = {(px, py) for px, py in self.positions if distance(px - x, py - y) <= radius}
+                self.assertEqual(set(self.index.query_radius(x, y, radius, metric)), expected)
+        with self.assertRaises(ValueError):
+            self.index.query_radius(0, 0, 5, 'hexagonal')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Unit Tests for TerrainGenerator Class
+=====================================
+Tests seeded, chunked terrain generation in serial and parallel modes.
+"""
+
+import unittest
+import numpy as np
+from main import TERRAIN_CONFIG
+from models.gridMap import GridMap
+from models.noiseField import perlin_field
+from models.seeding import derive_seed
+from models.terrainGenerator import TerrainGenerator
+
+
+def generate(width, height, seed, **options):
+    grid_map = GridMap(width, height)
+    TerrainGenerator(grid_map, TERRAIN_CONFIG, seed=seed, **options).generate_terrain()
+    return grid_map.terrain
+
+
+class TestTerrainGenerator(unittest.TestCase):
+    """Unit tests for TerrainGenerator functionality."""
+
+    def test_same_seed_same_map(self):
+        """Test that a seed fully determines the generated terrain."""
+        self.assertTrue(np.array_equal(generate(60, 40, 11), generate(60, 40, 11)))
+        self.assertFalse(np.array_equal(generate(60, 40, 11), generate(60, 40, 12)))
+
+    def test_parallel_matches_serial(self):
+        """Test that worker processes produce the same map as in-process generation."""
+        serial = generate(96, 80, 5, chunk_size=32, workers=1)
+        parallel = generate(96, 80, 5, chunk_size=32, workers=2)
+        self.assertTrue(np.array_equal(serial, parallel))
+
+    def test_chunk_noise_matches_full_field(self):
+        """Test that windowed noise lines up exactly with the full field."""
+        full = perlin_field(64, 64, 8, seed=3)
+        window = perlin_field(16, 24, 8, seed=3, row_offset=32, col_offset=16)
+        self.assertTrue(np.array_equal(full[32:48, 16:40], window))
+
+    def test_derive_seed_is_stable(self):
+        """Test that derived seeds depend on every component."""
+        self.assertEqual(derive_seed(1, 'water', 0, 0), derive_seed(1, 'water', 0, 0))
+        self.assertNotEqual(derive_seed(1, 'water', 0, 0), derive_seed(1, 'water', 32, 0))
+        self.assertNotEqual(derive_seed(1, 'water'), derive_seed(2, 'water'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit Tests for TurnManager
+==========================
+Tests turn order, tie-breaking, removal, speed changes and time mode.
+"""
+
+import random
+import unittest
+from models.turnManager import TurnManager
+from models.unit import Unit
+
+
+class TestTurnManager(unittest.TestCase):
+    """Unit tests for the indexed initiative scheduler."""
+
+    def _drain(self, manager):
+        """Take turns until the queue is empty and return the unit names."""
+        order = []
+        while len(manager):
+            order.append(manager.next_turn().name)
+        return order
+
+    def test_fastest_unit_acts_first(self):
+        """Test that units act in order of speed."""
+        manager = TurnManager()
+        for name, speed in [("Knight", 5), ("Archer", 8), ("Mage", 3)]:
+            manager.add_unit(Unit(name, speed))
+        self.assertEqual(self._drain(manager), ["Archer", "Knight", "Mage"])
+        self.assertIsNone(manager.next_turn())
+
+    def test_equal_speeds_keep_insertion_order(self):
+        """Test that ties do not compare units and go to the unit added first."""
+        manager = TurnManager()
+        for name in ["A", "B", "C", "D"]:
+            manager.add_unit(Unit(name, 5))
+        self.assertEqual(self._drain(manager), ["A", "B", "C", "D"])
+
+    def test_remove_and_update_speed(self):
+        """Test that removed units never act and speed changes reorder the queue."""
+        manager = TurnManager()
+        units = {name: Unit(name, speed) for name, speed in [("A", 1), ("B", 2), ("C", 3), ("D", 4)]}
+        for unit in units.values():
+            manager.add_unit(unit)
+        manager.remove_unit(units["C"])
+        manager.update_speed(units["A"], 10)
+        self.assertNotIn(units["C"], manager)
+        self.assertEqual(manager.peek(), units["A"])
+        self.assertEqual(self._drain(manager), ["A", "D", "B"])
+        manager.add_unit(units["A"])
+        with self.assertRaises(ValueError):
+            manager.add_unit(units["A"])
+
+    def test_random_operations_match_sorting(self):
+        """Test the heap against a sorted reference under random adds, removals and speed changes."""
+        rng = random.Random(5)
+        manager = TurnManager()
+        units = [Unit(f"U{i}", rng.randrange(10)) for i in range(300)]
+        for unit in units:
+            manager.add_unit(unit)
+        for unit in rng.sample(units, 100):
+            manager.remove_unit(unit)
+        alive = [unit for unit in units if unit in manager]
+        for unit in rng.sample(alive, 80):
+            manager.update_speed(unit, rng.randrange(10))
+        expected = sorted(alive, key=lambda unit: -unit.speed)
+        order = [manager.next_turn() for _ in alive]
+        self.assertEqual([unit.speed for unit in order], [unit.speed for unit in expected])
+
+    def test_time_mode_acts_in_proportion_to_speed(self):
+        """Test that in time mode a unit twice as fast acts twice as often."""
+        manager = TurnManager(mode='time')
+        fast, slow = Unit("Fast", 10), Unit("Slow", 5)
+        manager.add_unit(slow)
+        manager.add_unit(fast)
+        order = [manager.next_turn().name for _ in range(6)]
+        self.assertEqual(order, ["Fast", "Slow", "Fast", "Fast", "Slow", "Fast"])
+        self.assertEqual(len(manager), 2)
+
+    def test_time_mode_speed_change_keeps_progress(self):
+        """Test that changing speed mid-wait rescales the remaining wait."""
+        manager = TurnManager(mode='time')
+        runner, walker = Unit("Runner", 10), Unit("Walker", 4)
+        manager.add_unit(runner)
+        manager.add_unit(walker)
+        manager.next_turn()  # Runner acts at time 10
+        manager.update_speed(walker, 8)  # Walker had 15 left at speed 4, so 7.5 at speed 8
+        self.assertIs(manager.next_turn(), walker)
+        self.assertAlmostEqual(manager.time, 17.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Unit Tests for UnitPathfinder Class
+===================================
+Tests walkable pathfinding for units and invalidation of the path cache.
+"""
+
+import unittest
+from models.gridMap import GridMap
+from models.tile import TERRAIN_CODES
+from models.unit import Unit
+from models.unitPathfinder import UnitPathfinder
+
+
+class TestUnitPathfinder(unittest.TestCase):
+    """Unit tests for UnitPathfinder functionality."""
+
+    def setUp(self):
+        """Initialize a map with a mountain ridge that has a gap at row 5."""
+        self.grid_map = GridMap(12, 10)
+        self.grid_map.terrain[:, 6] = TERRAIN_CODES['mountain']
+        self.grid_map.terrain[5, 6] = TERRAIN_CODES['grass']
+        self.pathfinder = UnitPathfinder(self.grid_map)
+
+    def test_path_respects_walkability(self):
+        """Test that paths only cross walkable tiles."""
+        path = self.pathfinder.find_path((0, 0), (11, 9))
+        self.assertIn((6, 5), path)
+        for x, y in path:
+            self.assertTrue(self.grid_map.grid[y][x].is_walkable())
+
+    def test_repeated_requests_hit_cache(self):
+        """Test that the same (start, goal) is served from the cache."""
+        first = self.pathfinder.find_path((0, 0), (11, 9))
+        second = self.pathfinder.find_path((0, 0), (11, 9))
+        self.assertIs(first, second)
+        self.assertEqual(self.pathfinder.stats, {'hits': 1, 'misses': 1, 'invalidations': 0})
+
+    def test_change_off_path_keeps_cache(self):
+        """Test that edits to tiles off the path keep the cached entry."""
+        path = self.pathfinder.find_path((0, 0), (11, 9))
+        self.assertNotIn((0, 9), path)
+        self.grid_map.set_terrain(0, 9, 'water')
+        self.assertIs(self.pathfinder.find_path((0, 0), (11, 9)), path)
+
+    def test_unit_on_path_invalidates(self):
+        """Test that occupying a tile on the path invalidates and blocks it."""
+        self.pathfinder.find_path((0, 0), (11, 9))
+        self.grid_map.grid[5][6].unit = Unit("Guard", 3)
+        self.assertEqual(self.pathfinder.stats['invalidations'], 1)
+        self.assertIsNone(self.pathfinder.find_path((0, 0), (11, 9)))
+
+    def test_terrain_change_reopens_path(self):
+        """Test that a cleared blocker is picked up by new searches."""
+        self.grid_map.set_terrain(6, 5, 'water')
+        self.assertIsNone(self.pathfinder.find_path((0, 5), (11, 5)))
+        self.grid_map.set_terrain(6, 5, 'road')
+        self.assertEqual(len(self.pathfinder.find_path((0, 5), (11, 5))), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
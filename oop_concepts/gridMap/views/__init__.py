@@ -1 +1,6 @@
-from .gridView import BoardView
+from .imageExport import export_directory, export_image, render_pixels
+
+try:
+    from .gridView import BoardView
+except ImportError:  # No tkinter, e.g. on a headless server
+    BoardView = None
@@ -1,44 +1,192 @@
 import tkinter as tk
+import numpy as np
+from models.tile import TERRAIN_TYPES
+from .palette import TERRAIN_COLORS, UNIT_COLOR
+
+PALETTE = np.array([TERRAIN_COLORS.get(terrain, '#ffffff') for terrain in TERRAIN_TYPES], dtype=object)
+MIN_TILE_SIZE, MAX_TILE_SIZE = 1, 64
+UNIT_LABEL_SIZE = 12  # Smallest tile size that shows unit initials; below it units are drawn as colour
+
+
+def dirty_rectangles(tiles):
+    """Merge a set of (x, y) tiles into (x0, y0, x1, y1) rectangles, end-exclusive.
+
+    Tiles are joined into horizontal runs per row, and runs with the same span in
+    consecutive rows are stacked into one rectangle.
+    """
+    runs = {}
+    for x, y in sorted(tiles, key=lambda tile: (tile[1], tile[0])):
+        row = runs.setdefault(y, [])
+        if row and row[-1][1] == x:
+            row[-1][1] = x + 1
+        else:
+            row.append([x, x + 1])
+
+    rectangles = []
+    open_rects = {}  # (x0, x1) -> index of a rectangle that ends on the previous row
+    for y in sorted(runs):
+        still_open = {}
+        for x0, x1 in runs[y]:
+            index = open_rects.get((x0, x1))
+            if index is not None and rectangles[index][3] == y:
+                rx0, ry0, rx1, _ = rectangles[index]
+                rectangles[index] = (rx0, ry0, rx1, y + 1)
+            else:
+                index = len(rectangles)
+                rectangles.append((x0, y, x1, y + 1))
+            still_open[(x0, x1)] = index
+        open_rects = still_open
+    return rectangles
+
 
 class BoardView:
-    def __init__(self, root, grid_map):
+    """Canvas renderer that draws only the visible viewport of the map.
+
+    The terrain layer is a PhotoImage with one pixel per visible tile, zoomed to the
+    tile size. Changed tiles are collected and repainted once per frame as merged
+    dirty rectangles. Arrow keys or dragging scroll, the mouse wheel zooms.
+    """
+
+    def __init__(self, root, grid_map, tile_size=24, width=960, height=720):
         self.root = root
         self.grid_map = grid_map
-        self.buttons = []
+        self.tile_size = tile_size
+        self.width = width
+        self.height = height
+        self.origin_x = 0  # Top-left visible tile
+        self.origin_y = 0
+        self.canvas = None
+        self._image = None
+        self._visible = (0, 0, 0, 0)  # (x0, y0, x1, y1) tiles currently drawn
+        self._dirty = set()
+        self._flush_pending = False
+        self._drag_start = None
 
     def display_board(self):
-        """Render the grid as a Tkinter GUI."""
-        for row in range(self.grid_map.height):
-            button_row = []
-            for col in range(self.grid_map.width):
-                tile = self.grid_map.grid[row][col]
-                text = tile.unit.name[0].upper() if tile.unit else self._terrain_symbol(tile.terrain)
-                button = tk.Button(
-                    self.root,
-                    text=text,
-                    width=3,
-                    height=1,
-                    relief=tk.RIDGE,
-                    bg=self._terrain_color(tile.terrain),
-                )
-                button.grid(row=row, column=col, sticky="nsew")
-                button_row.append(button)
-            self.buttons.append(button_row)
+        """Create the canvas and render the visible part of the map."""
+        self.canvas = tk.Canvas(self.root, width=self.width, height=self.height, bg='black', highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas.bind('<Configure>', lambda event: self.render())
+        self.canvas.bind('<ButtonPress-1>', self._start_drag)
+        self.canvas.bind('<B1-Motion>', self._drag)
+        self.canvas.bind('<MouseWheel>', lambda event: self.zoom(2 if event.delta > 0 else 0.5, event.x, event.y))
+        self.canvas.bind('<Button-4>', lambda event: self.zoom(2, event.x, event.y))
+        self.canvas.bind('<Button-5>', lambda event: self.zoom(0.5, event.x, event.y))
+        for key, (dx, dy) in {'<Left>': (-1, 0), '<Right>': (1, 0), '<Up>': (0, -1), '<Down>': (0, 1)}.items():
+            self.root.bind(key, lambda event, dx=dx, dy=dy: self.scroll(dx, dy))
+        self.grid_map.add_listener(self._on_tile_changed)
+        self.render()
 
     def update_tile(self, x, y):
-        """Update a specific tile based on its current state."""
-        tile = self.grid_map.grid[y][x]
-        text = tile.unit.name[0].upper() if tile.unit else self._terrain_symbol(tile.terrain)
-        self.buttons[y][x].config(text=text, bg=self._terrain_color(tile.terrain))
-
-    @staticmethod
-    def _terrain_symbol(terrain):
-        """Return a symbol to represent the terrain."""
-        symbols = {'grass': '.', 'water': '~', 'mountain': '^', 'road': '#'}
-        return symbols.get(terrain, '?')
-
-    @staticmethod
-    def _terrain_color(terrain):
-        """Return a color for the terrain."""
-        colors = {'grass': 'green', 'water': 'blue', 'mountain': 'gray', 'road': 'brown'}
-        return colors.get(terrain, 'white')
+        """Mark a tile for repainting on the next frame."""
+        self._dirty.add((x, y))
+        if not self._flush_pending and self.canvas is not None:
+            self._flush_pending = True
+            self.root.after_idle(self._flush_dirty)
+
+    def scroll(self, dx, dy):
+        """Move the viewport by whole tiles."""
+        cols, rows = self._viewport_size()
+        self.origin_x = max(0, min(self.origin_x + dx, self.grid_map.width - cols))
+        self.origin_y = max(0, min(self.origin_y + dy, self.grid_map.height - rows))
+        self.render()
+
+    def zoom(self, factor, anchor_x=0, anchor_y=0):
+        """Scale the tile size, keeping the tile under the canvas point (anchor_x, anchor_y) in place."""
+        tile_size = int(max(MIN_TILE_SIZE, min(MAX_TILE_SIZE, self.tile_size * factor)))
+        if tile_size == self.tile_size:
+            return
+        tile_x = self.origin_x + anchor_x // self.tile_size
+        tile_y = self.origin_y + anchor_y // self.tile_size
+        self.tile_size = tile_size
+        self.origin_x = tile_x - anchor_x // tile_size
+        self.origin_y = tile_y - anchor_y // tile_size
+        self.scroll(0, 0)
+
+    def render(self):
+        """Redraw the whole viewport."""
+        cols, rows = self._viewport_size()
+        x0, y0 = self.origin_x, self.origin_y
+        x1, y1 = min(x0 + cols, self.grid_map.width), min(y0 + rows, self.grid_map.height)
+        self._visible = (x0, y0, x1, y1)
+        self._dirty.clear()
+        self.canvas.delete('all')
+        if x1 <= x0 or y1 <= y0:
+            self._image = None
+            return
+
+        base = tk.PhotoImage(width=x1 - x0, height=y1 - y0)
+        base.put(' '.join('{' + ' '.join(row) + '}' for row in self._colors(x0, y0, x1, y1)))
+        self._image = base.zoom(self.tile_size) if self.tile_size > 1 else base
+        self.canvas.create_image(0, 0, anchor=tk.NW, image=self._image, tags='terrain')
+        self._draw_units(x0, y0, x1, y1)
+
+    def _flush_dirty(self):
+        """Repaint the dirty rectangles that intersect the viewport."""
+        self._flush_pending = False
+        if self._image is None:
+            self._dirty.clear()
+            return
+        vx0, vy0, vx1, vy1 = self._visible
+        size = self.tile_size
+        for x0, y0, x1, y1 in dirty_rectangles(self._dirty):
+            x0, y0, x1, y1 = max(x0, vx0), max(y0, vy0), min(x1, vx1), min(y1, vy1)
+            if x1 <= x0 or y1 <= y0:
+                continue
+            for y, row in enumerate(self._colors(x0, y0, x1, y1), start=y0):
+                start = 0
+                for end in range(1, len(row) + 1):
+                    if end == len(row) or row[end] != row[start]:  # Fill each run of one colour at once
+                        self._image.put(row[start], to=(
+                            (x0 + start - vx0) * size, (y - vy0) * size, (x0 + end - vx0) * size, (y - vy0 + 1) * size,
+                        ))
+                        start = end
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    self.canvas.delete(f'unit_{x}_{y}')
+            self._draw_units(x0, y0, x1, y1)
+        self._dirty.clear()
+
+    def _colors(self, x0, y0, x1, y1):
+        """Return rows of colour strings for a block of tiles."""
+        colors = PALETTE[self.grid_map.terrain[y0:y1, x0:x1]]
+        if self.tile_size < UNIT_LABEL_SIZE:
+            for (x, y) in self._units_in(x0, y0, x1, y1):
+                colors[y - y0, x - x0] = UNIT_COLOR
+        return colors.tolist()
+
+    def _draw_units(self, x0, y0, x1, y1):
+        """Draw unit initials over a block of tiles when tiles are large enough."""
+        if self.tile_size < UNIT_LABEL_SIZE:
+            return
+        vx0, vy0 = self._visible[:2]
+        half = self.tile_size // 2
+        for (x, y), unit in self._units_in(x0, y0, x1, y1).items():
+            self.canvas.create_text(
+                (x - vx0) * self.tile_size + half, (y - vy0) * self.tile_size + half,
+                text=unit.name[0].upper(), fill='white', tags=('unit', f'unit_{x}_{y}'),
+            )
+
+    def _units_in(self, x0, y0, x1, y1):
+        return self.grid_map.units_in_rect(x0, y0, x1, y1)
+
+    def _viewport_size(self):
+        """Number of (columns, rows) of tiles that fit on the canvas."""
+        width, height = self.width, self.height
+        if self.canvas is not None and self.canvas.winfo_width() > 1:
+            width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        return -(-width // self.tile_size), -(-height // self.tile_size)
+
+    def _on_tile_changed(self, x, y, kind):
+        self.update_tile(x, y)
+
+    def _start_drag(self, event):
+        self._drag_start = (event.x, event.y)
+
+    def _drag(self, event):
+        start_x, start_y = self._drag_start
+        dx = int((start_x - event.x) / self.tile_size)
+        dy = int((start_y - event.y) / self.tile_size)
+        if dx or dy:
+            self._drag_start = (start_x - dx * self.tile_size, start_y - dy * self.tile_size)
+            self.scroll(dx, dy)
@@ -0,0 +1,97 @@
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np  # Install with pip install numpy
+from models.mapFile import load_map
+from models.tile import TERRAIN_TYPES
+from .palette import TERRAIN_COLORS, UNIT_COLOR
+
+FORMATS = ('png', 'ppm')
+
+
+def _rgb(color):
+    return [int(color[i:i + 2], 16) for i in (1, 3, 5)]
+
+
+RGB_PALETTE = np.array([_rgb(TERRAIN_COLORS.get(terrain, '#ffffff')) for terrain in TERRAIN_TYPES], dtype=np.uint8)
+UNIT_RGB = np.array(_rgb(UNIT_COLOR), dtype=np.uint8)
+
+
+def render_pixels(grid_map, scale=1, units=True):
+    """Return a (height * scale, width * scale, 3) uint8 RGB image of the map.
+
+    Every tile becomes a scale x scale block of its terrain colour; with units=True
+    occupied tiles are filled with the unit colour instead.
+    """
+    if scale < 1:
+        raise ValueError("Scale must be at least 1.")
+    pixels = RGB_PALETTE[grid_map.terrain]
+    if units and grid_map.units:
+        xs, ys = np.array(list(grid_map.units)).T
+        pixels[ys, xs] = UNIT_RGB
+    if scale > 1:
+        pixels = pixels.repeat(scale, axis=0).repeat(scale, axis=1)
+    return pixels
+
+
+def write_png(pixels, path, level=6):
+    """Write an RGB pixel array as an 8-bit truecolor PNG."""
+    height, width, _ = pixels.shape
+    raw = np.zeros((height, width * 3 + 1), dtype=np.uint8)  # Leading zero per row: filter type None
+    raw[:, 1:] = pixels.reshape(height, width * 3)
+
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    with open(path, 'wb') as file:
+        file.write(b'\x89PNG\r\n\x1a\n')
+        file.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        file.write(chunk(b'IDAT', zlib.compress(raw.tobytes(), level)))
+        file.write(chunk(b'IEND', b''))
+
+
+def write_ppm(pixels, path):
+    """Write an RGB pixel array as a binary (P6) PPM."""
+    height, width, _ = pixels.shape
+    with open(path, 'wb') as file:
+        file.write(f'P6 {width} {height} 255\n'.encode('ascii'))
+        file.write(np.ascontiguousarray(pixels).tobytes())
+
+
+def export_image(grid_map, path, scale=1, units=True):
+    """Render a GridMap to a .png or .ppm file, chosen by the file extension."""
+    fmt = os.path.splitext(path)[1].lstrip('.').lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported image format '{fmt}'.")
+    pixels = render_pixels(grid_map, scale, units)
+    if fmt == 'png':
+        write_png(pixels, path)
+    else:
+        write_ppm(pixels, path)
+
+
+def export_directory(source, destination, scale=1, units=True, fmt='png', workers=1):
+    """Export every .gmap file in source to an image in destination and return the image paths.
+
+    Maps are memory-mapped and rendered one per task, so worker processes never
+    hold more than the map they are exporting.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported image format '{fmt}'.")
+    os.makedirs(destination, exist_ok=True)
+    tasks = [
+        (os.path.join(source, name), os.path.join(destination, os.path.splitext(name)[0] + '.' + fmt), scale, units)
+        for name in sorted(os.listdir(source)) if name.endswith('.gmap')
+    ]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            return list(pool.map(_export_file, tasks))
+    return [_export_file(task) for task in tasks]
+
+
+def _export_file(task):
+    """Export one map file; module-level so it can run in a worker process."""
+    map_path, image_path, scale, units = task
+    export_image(load_map(map_path), image_path, scale, units)
+    return image_path
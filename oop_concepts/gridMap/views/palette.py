@@ -0,0 +1,2 @@
+TERRAIN_COLORS = {'grass': '#008000', 'water': '#0000ff', 'mountain': '#808080', 'road': '#a52a2a'}
+UNIT_COLOR = '#ffffff'